@@ -0,0 +1,177 @@
+# archive.py
+# -*- coding: utf-8 -*-
+"""
+크롤링 마크다운 보관소 + 오프라인 재추출
+
+- 크롤링한 마크다운을 sha256 내용 주소로 gzip 압축 저장 (같은 내용은 한 번만 저장)
+  outputs/markdown/ab/abcdef....md.gz
+- outputs/extract_*.json 에는 markdown_sha256 으로 연결
+- prompt.md / LLM_MODEL 을 바꾼 뒤 브라우저 없이 보관된 마크다운으로 일괄 재추출
+  (기본 결과 폴더 outputs/reextract_<fingerprint> — 같은 프롬프트/모델로 다시 실행하면 이어서 처리)
+
+    python archive.py reextract --workers 4
+    python archive.py reextract --glob "outputs/extract_202510*.json" --out-dir outputs/reextract_test
+"""
+import os
+import sys
+import glob
+import gzip
+import json
+import hashlib
+import argparse
+import tempfile
+import threading
+import concurrent.futures
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# ==== 설정 ===================================================================
+ARCHIVE_DIR = os.getenv("MARKDOWN_ARCHIVE_DIR") or os.path.join("outputs", "markdown")
+REEXTRACT_WORKERS = int(os.getenv("REEXTRACT_WORKERS", "4"))
+
+# ==== 보관소 =================================================================
+def markdown_digest(markdown: str) -> str:
+    return hashlib.sha256((markdown or "").encode("utf-8")).hexdigest()
+
+def _archive_path(digest: str, root: str = ARCHIVE_DIR) -> str:
+    return os.path.join(root, digest[:2], digest + ".md.gz")
+
+def put_markdown(markdown: str, root: str = ARCHIVE_DIR) -> str:
+    """마크다운 저장 후 sha256 반환 (이미 있으면 쓰지 않음, 실패 시 "")"""
+    if not markdown:
+        return ""
+    digest = markdown_digest(markdown)
+    path = _archive_path(digest, root)
+    if os.path.isfile(path):
+        return digest
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 임시 파일에 쓴 뒤 이름 변경 (동시에 같은 내용을 저장해도 깨진 파일이 남지 않도록)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as gz:
+            gz.write(markdown.encode("utf-8"))
+        os.replace(tmp, path)
+        return digest
+    except Exception as e:
+        print(f"[archive] 저장 실패: {e}")
+        return ""
+
+def get_markdown(digest: str, root: str = ARCHIVE_DIR) -> str:
+    """sha256 → 마크다운 (없거나 내용이 다르면 "")"""
+    if not digest:
+        return ""
+    try:
+        with gzip.open(_archive_path(digest, root), "rb") as f:
+            text = f.read().decode("utf-8")
+    except Exception as e:
+        print(f"[archive] 읽기 실패 {digest[:12]}: {e}")
+        return ""
+    if markdown_digest(text) != digest:
+        print(f"[archive] 해시 불일치 {digest[:12]}")
+        return ""
+    return text
+
+# ==== 재추출 =================================================================
+def _fingerprint() -> str:
+    """현재 프롬프트/모델 조합 식별자 (바뀌면 체크포인트가 무효가 됨)"""
+    import llama
+    h = hashlib.sha256()
+    h.update(llama.load_prompt_md().encode("utf-8"))
+    h.update(f"|{llama.MODEL}|{llama.FAST_MODEL}|{llama.NUM_CTX}|{llama.TEMPERATURE}".encode("utf-8"))
+    return h.hexdigest()[:16]
+
+def _load_checkpoint(path: str, fingerprint: str) -> set:
+    done = set()
+    if not os.path.isfile(path):
+        return done
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                row = json.loads(line)
+            except Exception:
+                continue
+            if row.get("fingerprint") == fingerprint and row.get("status") == "ok":
+                done.add(row.get("source"))
+    return done
+
+def reextract(files: List[str], out_dir: str, workers: int = REEXTRACT_WORKERS,
+              checkpoint: Optional[str] = None) -> Dict[str, int]:
+    """
+    보관된 마크다운으로 추출 결과 파일들을 다시 만든다.
+    - 체크포인트(JSONL)에 현재 프롬프트/모델로 이미 끝난 파일은 건너뜀 → 중단 후 이어서 실행 가능
+    - 동시 실행 수는 workers개 스레드 + llama.LIMITER(background 우선순위)로 제한
+    """
+    import llama
+    from data import canonicalize_record, save_json
+
+    os.makedirs(out_dir, exist_ok=True)
+    checkpoint = checkpoint or os.path.join(out_dir, "checkpoint.jsonl")
+    fingerprint = _fingerprint()
+    done = _load_checkpoint(checkpoint, fingerprint)
+    todo = [f for f in files if os.path.abspath(f) not in done]
+    stats = {"total": len(files), "skipped": len(files) - len(todo), "ok": 0, "no_markdown": 0, "failed": 0}
+    print(f"[reextract] {len(files)}개 중 {len(todo)}개 처리 (fingerprint={fingerprint}, workers={workers})")
+    lock = threading.Lock()
+
+    def _one(path: str) -> str:
+        with open(path, "r", encoding="utf-8") as f:
+            old = json.load(f)
+        markdown = get_markdown(old.get("markdown_sha256", ""))
+        if not markdown:
+            return "no_markdown"
+        url = old.get("source_url", "")
+        result = llama.run_pipeline_markdown({
+            "markdown": markdown, "source_url": url, "priority": llama.PRIORITY_BACKGROUND,
+        })
+        if not result:
+            return "failed"
+        result["markdown_sha256"] = old.get("markdown_sha256", "")
+        out_path = os.path.join(out_dir, os.path.basename(path))
+        return "ok" if save_json(result, canonicalize_record(result["data"]), url, path=out_path) else "failed"
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, workers)) as ex, \
+            open(checkpoint, "a", encoding="utf-8") as ck:
+        futs = {ex.submit(_one, p): p for p in todo}
+        for i, fut in enumerate(concurrent.futures.as_completed(futs), 1):
+            path = futs[fut]
+            try:
+                status = fut.result()
+            except Exception as e:
+                print(f"[reextract] {path} 오류: {e}")
+                status = "failed"
+            with lock:
+                stats[status] += 1
+                ck.write(json.dumps({"source": os.path.abspath(path), "status": status, "fingerprint": fingerprint,
+                                     "at": datetime.now().isoformat(timespec="seconds")}, ensure_ascii=False) + "\n")
+                ck.flush()
+            print(f"[reextract] {i}/{len(todo)} {status}: {os.path.basename(path)}")
+
+    print(f"[reextract] 완료: {stats}")
+    return stats
+
+# ==== CLI ====================================================================
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="마크다운 보관소 / 오프라인 재추출")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p_re = sub.add_parser("reextract", help="보관된 마크다운으로 일괄 재추출")
+    p_re.add_argument("--glob", default=os.path.join("outputs", "extract_*.json"), help="대상 추출 결과 파일 패턴")
+    p_re.add_argument("--out-dir", default=None, help="결과 저장 폴더 (기본 outputs/reextract_<fingerprint>)")
+    p_re.add_argument("--workers", type=int, default=REEXTRACT_WORKERS)
+    p_re.add_argument("--checkpoint", default=None, help="체크포인트 JSONL (기본 <out-dir>/checkpoint.jsonl)")
+    p_get = sub.add_parser("cat", help="보관된 마크다운 출력")
+    p_get.add_argument("digest")
+    args = ap.parse_args(argv)
+
+    if args.cmd == "cat":
+        text = get_markdown(args.digest)
+        print(text)
+        return 0 if text else 1
+
+    # 같은 프롬프트/모델이면 같은 폴더(와 체크포인트)를 쓰므로 중단 후 다시 실행하면 이어서 처리
+    out_dir = args.out_dir or os.path.join("outputs", "reextract_" + _fingerprint())
+    files = sorted(glob.glob(args.glob))
+    stats = reextract(files, out_dir, args.workers, args.checkpoint)
+    return 0 if stats["failed"] == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+# assignment.py
+# -*- coding: utf-8 -*-
+"""
+1:1 매칭 (여러 DB 레코드가 같은 사이트 레코드를 차지하지 않도록)
+
+임계치 이상인 (base, target, 점수) 간선만으로 이분 그래프를 만들고
+연결 요소별로 점수 합이 최대인 1:1 배정을 구한다.
+- scipy가 있으면 요소마다 헝가리안 알고리즘(linear_sum_assignment)
+- scipy가 없거나 요소가 ASSIGN_MAX_DENSE보다 크면 점수 높은 간선부터 고르는 greedy 근사
+"""
+import os
+from typing import Dict, List, Tuple
+
+try:
+    import numpy as np
+    from scipy.optimize import linear_sum_assignment
+except Exception:
+    np = None
+    linear_sum_assignment = None
+
+# ==== 설정 ===================================================================
+ASSIGN_MAX_DENSE = int(os.getenv("ASSIGN_MAX_DENSE", "1000000"))   # 요소 하나의 행×열이 이보다 크면 greedy
+
+Edge = Tuple[int, int, float]   # (base 번호, target 번호, 점수)
+
+# ==== 연결 요소 ==============================================================
+def components(edges: List[Edge]) -> List[List[Edge]]:
+    """간선 목록 → 연결 요소별 간선 목록 (union-find, base/target 노드는 따로 구분)"""
+    parent: Dict[tuple, tuple] = {}
+
+    def find(x):
+        parent.setdefault(x, x)
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for i, j, _ in edges:
+        ra, rb = find(("b", i)), find(("t", j))
+        if ra != rb:
+            parent[ra] = rb
+
+    groups: Dict[tuple, List[Edge]] = {}
+    for e in edges:
+        groups.setdefault(find(("b", e[0])), []).append(e)
+    return list(groups.values())
+
+# ==== 배정 ===================================================================
+def greedy_assign(edges: List[Edge]) -> List[Edge]:
+    """점수 높은 간선부터 양쪽이 비어 있으면 채택 (동점은 base/target 번호 순)"""
+    used_b, used_t, out = set(), set(), []
+    for i, j, s in sorted(edges, key=lambda e: (-e[2], e[0], e[1])):
+        if i not in used_b and j not in used_t:
+            used_b.add(i)
+            used_t.add(j)
+            out.append((i, j, s))
+    return out
+
+def hungarian_assign(edges: List[Edge]) -> List[Edge]:
+    """요소 하나를 밀집 행렬로 만들어 점수 합 최대 배정 (간선이 없는 칸은 배정하지 않음)"""
+    rows = sorted({e[0] for e in edges})
+    cols = sorted({e[1] for e in edges})
+    r_of = {b: k for k, b in enumerate(rows)}
+    c_of = {t: k for k, t in enumerate(cols)}
+    w = np.zeros((len(rows), len(cols)), dtype=np.float64)
+    has = np.zeros_like(w, dtype=bool)
+    for i, j, s in edges:
+        w[r_of[i], c_of[j]] = s
+        has[r_of[i], c_of[j]] = True
+    ri, ci = linear_sum_assignment(w, maximize=True)
+    return [(rows[r], cols[c], float(w[r, c])) for r, c in zip(ri, ci) if has[r, c]]
+
+def assign_one_to_one(edges: List[Edge], method: str = "auto") -> List[Edge]:
+    """
+    간선 목록 → 1:1 배정 (base 번호 순)
+    method: auto(scipy 있으면 헝가리안) / hungarian / greedy
+    """
+    use_hungarian = method != "greedy" and linear_sum_assignment is not None
+    if method == "hungarian" and linear_sum_assignment is None:
+        print("[assignment] scipy 없음 → greedy로 대체")
+    out: List[Edge] = []
+    for comp in components(edges):
+        if len(comp) == 1:
+            out.extend(comp)
+            continue
+        n_rows = len({e[0] for e in comp})
+        n_cols = len({e[1] for e in comp})
+        if use_hungarian and n_rows * n_cols <= ASSIGN_MAX_DENSE:
+            out.extend(hungarian_assign(comp))
+        else:
+            out.extend(greedy_assign(comp))
+    out.sort(key=lambda e: e[0])
+    return out
@@ -0,0 +1,224 @@
+# bilingual.py
+# -*- coding: utf-8 -*-
+"""
+국문↔영문 이름 사전 (전시회명 / 개최장소)
+
+Exhibition 테이블의 ExKoreanName/ExEnglishName 쌍과 확인된 레코드(data.json, few-shot 예시 등)로
+사전을 만들어 두고, 추출 후 한쪽 이름만 있을 때 LLM 번역 대신 사전으로 채운다.
+- 정확히 같은 이름(공백 정리) → 정규화 키(소문자, 연도/회차/기호 제거) 순서로 조회
+- 같은 이름에 번역이 여러 개면 가장 많이 나온 것 (NAME_DICT_MIN_SHARE 미만이면 모호 → 채우지 않음)
+
+    python bilingual.py build --json data.json --fewshot
+    python bilingual.py build --db "DRIVER={ODBC Driver 17 for SQL Server};SERVER=...;UID=...;PWD=..."
+    python bilingual.py lookup 코엑스
+"""
+import os
+import re
+import sys
+import json
+import argparse
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# ==== 설정 ===================================================================
+BILINGUAL_STORE = os.getenv("BILINGUAL_STORE") or os.path.join(os.path.dirname(__file__), "bilingual_names.json")
+NAME_DICT_MIN_SHARE = float(os.getenv("NAME_DICT_MIN_SHARE", "0.6"))
+
+# (사전 종류, 국문 키, 영문 키)
+FIELD_PAIRS = (
+    ("exhibition", "전시회 국문명", "영문명(Full Name)"),
+    ("venue", "개최장소(국문)", "개최장소(영어)"),
+)
+KINDS = tuple(k for k, _, _ in FIELD_PAIRS)
+
+# prompt.md의 자주 쓰는 전시장 매핑 (사전 파일이 없어도 동작)
+BUILTIN_PAIRS: List[Tuple[str, str, str]] = [
+    ("venue", "코엑스", "COEX"),
+    ("venue", "킨텍스", "KINTEX"),
+    ("venue", "라스베이거스 컨벤션 센터", "Las Vegas Convention Center"),
+    ("venue", "파리 노르 빌팽트 전시센터", "Paris Nord Villepinte"),
+]
+
+# ==== 키 정규화 ==============================================================
+_YEAR_RE = re.compile(r"(?:19|20)\d{2}\s*년?")
+_ORDINAL_RE = re.compile(r"제\s*\d+\s*회|\b\d+(?:st|nd|rd|th)\b", re.I)
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+def exact_key(name: str) -> str:
+    return " ".join(str(name or "").split())
+
+def strip_edition(name: str) -> str:
+    """'2025 미국 ... 전시회' / '12th Waste Expo 2026' → 연도/회차 제거"""
+    s = _ORDINAL_RE.sub(" ", _YEAR_RE.sub(" ", str(name or "")))
+    s = re.sub(r"[\(\[]\s*[\)\]]", " ", s)
+    return " ".join(s.split()).strip(" -·,")
+
+def name_key(name: str) -> str:
+    """정규화 키: 연도/회차 제거 + 소문자 + 공백/기호 제거"""
+    return _NON_WORD_RE.sub("", strip_edition(name).lower())
+
+# ==== 사전 ===================================================================
+class NameDictionary:
+    """
+    국문↔영문 이름 사전
+    파일에는 (종류, 국문, 영문, 횟수) 쌍을 저장하고, 읽을 때 조회 테이블로 컴파일
+    """
+
+    def __init__(self, path: str = BILINGUAL_STORE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._mtime: Optional[float] = None
+        self._pairs: Counter = Counter()
+        self._tables: Dict[str, Dict[str, Dict[str, Dict[str, str]]]] = {}
+        self._compile()
+
+    # ---------- 쌍 추가/저장 ----------
+    def add_pair(self, kind: str, ko: str, en: str, count: int = 1) -> bool:
+        ko, en = exact_key(ko), exact_key(en)
+        if kind not in KINDS or not ko or not en or not name_key(ko) or not name_key(en):
+            return False
+        self._pairs[(kind, ko, en)] += count
+        return True
+
+    def add_records(self, records: Iterable[Dict[str, Any]]) -> int:
+        """레코드의 국문/영문 쌍(전시회명, 개최장소) 추가 → 추가된 쌍 수"""
+        n = 0
+        for rec in records:
+            for kind, ko_key, en_key in FIELD_PAIRS:
+                n += self.add_pair(kind, rec.get(ko_key, ""), rec.get(en_key, ""))
+        return n
+
+    def save(self, sources: Optional[List[str]] = None):
+        d = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(d, exist_ok=True)
+        payload = {
+            "built_at": datetime.now().isoformat(timespec="seconds"),
+            "sources": sources or [],
+            "pairs": [[kind, ko, en, c] for (kind, ko, en), c in sorted(self._pairs.items())],
+        }
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=0)
+        os.replace(tmp, self.path)
+        with self._lock:
+            self._mtime = os.path.getmtime(self.path)
+            self._compile()
+
+    # ---------- 컴파일/조회 ----------
+    def _load(self):
+        """사전 파일이 바뀌었을 때만 다시 읽음"""
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            return
+        if mtime == self._mtime:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            pairs = Counter()
+            for kind, ko, en, c in payload.get("pairs", []):
+                pairs[(kind, ko, en)] += int(c)
+            self._pairs = pairs
+        except Exception as e:
+            print(f"[bilingual] 사전 읽기 실패: {e}")
+        self._mtime = mtime
+        self._compile()
+
+    def _compile(self):
+        """쌍 횟수 → {kind: {"ko2en"/"en2ko": {"exact"/"norm": {키: 번역}}}}"""
+        votes: Dict[Tuple[str, str, str, str], Counter] = {}
+        pairs = Counter({(k, ko, en): 1 for k, ko, en in BUILTIN_PAIRS})
+        pairs.update(self._pairs)
+        for (kind, ko, en), c in pairs.items():
+            for direction, src, dst in (("ko2en", ko, en), ("en2ko", en, ko)):
+                votes.setdefault((kind, direction, "exact", exact_key(src)), Counter())[dst] += c
+                votes.setdefault((kind, direction, "norm", name_key(src)), Counter())[strip_edition(dst)] += c
+
+        tables = {kind: {d: {"exact": {}, "norm": {}} for d in ("ko2en", "en2ko")} for kind in KINDS}
+        for (kind, direction, level, key), cnt in votes.items():
+            (best, top), total = cnt.most_common(1)[0], sum(cnt.values())
+            if top / total >= NAME_DICT_MIN_SHARE:
+                tables[kind][direction][level][key] = best
+        self._tables = tables
+
+    def lookup(self, kind: str, name: str, to: str = "en") -> str:
+        """이름 → 반대 언어 이름 (to="en": 국문→영문, "ko": 영문→국문), 없거나 모호하면 빈 문자열"""
+        with self._lock:
+            self._load()
+            t = self._tables.get(kind, {}).get("ko2en" if to == "en" else "en2ko")
+        if not t or not exact_key(name):
+            return ""
+        return t["exact"].get(exact_key(name)) or t["norm"].get(name_key(name), "")
+
+    def fill_record(self, rec: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+        """한쪽 이름만 있는 전시회명/개최장소를 사전으로 채움 → (레코드, 채운 키 목록)"""
+        out, filled = dict(rec), []
+        for kind, ko_key, en_key in FIELD_PAIRS:
+            ko, en = exact_key(out.get(ko_key, "")), exact_key(out.get(en_key, ""))
+            if ko and not en:
+                v = self.lookup(kind, ko, to="en")
+                if v:
+                    out[en_key] = v
+                    filled.append(en_key)
+            elif en and not ko:
+                v = self.lookup(kind, en, to="ko")
+                if v:
+                    out[ko_key] = v
+                    filled.append(ko_key)
+        return out, filled
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            self._load()
+            return {f"{kind}.{d}": len(t["exact"]) for kind, dirs in self._tables.items() for d, t in dirs.items()}
+
+NAMES = NameDictionary()
+
+# ==== CLI ====================================================================
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="국문↔영문 이름 사전")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p_build = sub.add_parser("build", help="DB/확인된 레코드로 사전 생성 (기존 사전은 덮어씀)")
+    p_build.add_argument("--json", action="append", default=[], help="확인된 레코드 JSON/JSONL (여러 번 지정 가능)")
+    p_build.add_argument("--db", help="ODBC 연결 문자열 (Exhibition 테이블의 ExKoreanName/ExEnglishName)")
+    p_build.add_argument("--fewshot", action="store_true", help="few-shot 예시 저장소의 검증된 레코드 포함")
+    p_look = sub.add_parser("lookup", help="이름 조회")
+    p_look.add_argument("name")
+    p_look.add_argument("--kind", choices=KINDS, default=None)
+    args = ap.parse_args(argv)
+
+    if args.cmd == "lookup":
+        ko = bool(re.search(r"[가-힣]", args.name))
+        for kind in ([args.kind] if args.kind else KINDS):
+            print(f"{kind}: {NAMES.lookup(kind, args.name, to='en' if ko else 'ko') or '-'}")
+        return 0
+
+    d = NameDictionary(NAMES.path)
+    d._pairs = Counter()
+    sources = []
+    for path in args.json:
+        from data import iter_json_records
+        n = d.add_records(iter_json_records(path))
+        sources.append(f"{path} ({n})")
+    if args.db:
+        import pyodbc
+        from matcher_index import records_from_db
+        with pyodbc.connect(args.db) as conn:
+            n = d.add_records(records_from_db(conn))
+        sources.append(f"db:Exhibition ({n})")
+    if args.fewshot:
+        from fewshot import STORE
+        n = d.add_records(ex["record"] for ex in STORE.examples())
+        sources.append(f"fewshot ({n})")
+    if not sources:
+        ap.error("--json, --db, --fewshot 중 하나 이상 필요합니다.")
+    d.save(sources)
+    print(f"사전 저장: {d.path} ← {', '.join(sources)}")
+    print(d.stats())
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
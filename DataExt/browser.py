@@ -0,0 +1,122 @@
+# browser.py
+# -*- coding: utf-8 -*-
+"""
+crawl4ai 브라우저 공유 레이어
+
+사이트 검색(sitesearch)과 상세 페이지 크롤링(crawl_and_summarize)이
+하나의 이벤트 루프 + 하나의 AsyncWebCrawler(Playwright 브라우저 프로세스)를 같이 쓴다.
+- 브라우저 루프는 백그라운드 스레드에서 계속 돌고, 어느 스레드/루프에서든
+  run_sync() / run_async()로 코루틴을 넘겨 실행한다.
+- 검색 결과 파싱에 필요 없는 이미지/폰트/미디어/트래커 요청은 페이지 단위로 차단한다.
+"""
+import asyncio
+import threading
+from typing import Any, Awaitable, Optional
+
+from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig
+
+# ==== 설정 ===================================================================
+BROWSER_CONFIG = BrowserConfig(headless=True, verbose=False)
+
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+BLOCKED_HOST_KEYWORDS = (
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net",
+    "connect.facebook.net", "hotjar.com",
+)
+
+# ==== 브라우저 전용 이벤트 루프 ==============================================
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_LOCK = threading.Lock()
+_CRAWLER: Optional[AsyncWebCrawler] = None
+_CRAWLER_LOCK: Optional[asyncio.Lock] = None
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """브라우저 루프(백그라운드 스레드)를 처음 호출 시 띄우고 반환"""
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None or _LOOP.is_closed():
+            loop = asyncio.new_event_loop()
+            t = threading.Thread(target=loop.run_forever, name="browser-loop", daemon=True)
+            t.start()
+            _LOOP = loop
+        return _LOOP
+
+def _on_browser_loop() -> bool:
+    try:
+        return asyncio.get_running_loop() is _LOOP
+    except RuntimeError:
+        return False
+
+def run_sync(coro: Awaitable, timeout: Optional[float] = None) -> Any:
+    """동기 코드(Gradio 핸들러, CLI 등)에서 코루틴을 브라우저 루프에 실행하고 결과 대기"""
+    if _on_browser_loop():
+        raise RuntimeError("브라우저 루프 안에서는 run_sync 대신 await를 사용하세요.")
+    return asyncio.run_coroutine_threadsafe(coro, get_loop()).result(timeout)
+
+async def run_async(coro: Awaitable) -> Any:
+    """다른 이벤트 루프에서 코루틴을 브라우저 루프에 넘겨 await (이미 브라우저 루프면 그대로 await)"""
+    if _on_browser_loop():
+        return await coro
+    fut = asyncio.run_coroutine_threadsafe(coro, get_loop())
+    return await asyncio.wrap_future(fut)
+
+# ==== 공유 크롤러 ============================================================
+async def _block_heavy_resources(page, context=None, **kwargs):
+    """새 페이지마다 이미지/폰트/미디어/트래커 요청 차단"""
+    async def _route(route):
+        req = route.request
+        if req.resource_type in BLOCKED_RESOURCE_TYPES or any(h in req.url for h in BLOCKED_HOST_KEYWORDS):
+            await route.abort()
+        else:
+            await route.continue_()
+    await page.route("**/*", _route)
+    return page
+
+async def get_crawler() -> AsyncWebCrawler:
+    """브라우저 루프 안에서 공유 AsyncWebCrawler 반환(없으면 시작)"""
+    global _CRAWLER, _CRAWLER_LOCK
+    if not _on_browser_loop():
+        raise RuntimeError("get_crawler()는 브라우저 루프에서만 호출할 수 있습니다. run_async()를 사용하세요.")
+    if _CRAWLER_LOCK is None:
+        _CRAWLER_LOCK = asyncio.Lock()
+    async with _CRAWLER_LOCK:
+        if _CRAWLER is None:
+            crawler = AsyncWebCrawler(config=BROWSER_CONFIG)
+            crawler.crawler_strategy.set_hook("on_page_context_created", _block_heavy_resources)
+            await crawler.start()
+            _CRAWLER = crawler
+    return _CRAWLER
+
+async def _arun(url: str, config: Optional[CrawlerRunConfig]):
+    crawler = await get_crawler()
+    return await crawler.arun(url=url, config=config)
+
+async def arun(url: str, config: Optional[CrawlerRunConfig] = None):
+    """공유 크롤러로 URL 하나 크롤링 (어느 이벤트 루프에서든 호출 가능)"""
+    return await run_async(_arun(url, config))
+
+async def _kill_session(session_id: str):
+    crawler = await get_crawler()
+    await crawler.crawler_strategy.kill_session(session_id)
+
+async def kill_session(session_id: str):
+    """arun(session_id=...)로 열어둔 페이지 닫기"""
+    try:
+        await run_async(_kill_session(session_id))
+    except Exception as e:
+        print(f"[browser] kill_session error: {e}")
+
+async def _close():
+    global _CRAWLER
+    if _CRAWLER is not None:
+        crawler, _CRAWLER = _CRAWLER, None
+        await crawler.close()
+
+def shutdown():
+    """공유 브라우저 종료 (프로세스 종료 전 호출)"""
+    if _LOOP is None or _LOOP.is_closed():
+        return
+    try:
+        run_sync(_close(), timeout=30)
+    except Exception as e:
+        print(f"[browser] shutdown error: {e}")
@@ -1,9 +1,12 @@
 import json
 import os, json, re, requests
 import time
-from typing import List, Dict, Any, Tuple, Optional
+from itertools import chain, islice
+from typing import List, Dict, Any, Tuple, Optional, Iterable, Iterator
 from datetime import datetime
 
+from match_result import MatchResult, MATCH_PAGE_SIZE
+
 # 저장할 형식
 KEYS = [
         "전시회 국문명","영문명(Full Name)","영문명(약자)",
@@ -70,15 +73,23 @@ def to_json(rec: Dict[str, str]) -> str:
     return "```json\n" + json.dumps(rec, ensure_ascii=False, indent=2) + "\n```"
 
 # json 파일로 저장
-def save_json(result_obj: Dict[str, Any], rec_canon: Dict[str, str], url: str) -> str | None:
-    os.makedirs("outputs", exist_ok=True)
-    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-    path = os.path.abspath(os.path.join("outputs", f"extract_{ts}.json"))
+def save_json(result_obj: Dict[str, Any], rec_canon: Dict[str, str], url: str,
+              path: Optional[str] = None) -> str | None:
+    # path를 주지 않으면 outputs/extract_<시각>.json (재추출은 원본과 같은 파일명으로 저장)
+    if path is None:
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join("outputs", f"extract_{ts}.json")
+    path = os.path.abspath(path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
     payload = {
         "source_url": url,
         "extracted_at": result_obj.get("extracted_at", ""),
         "model": result_obj.get("model", ""),
         "num_ctx": result_obj.get("num_ctx", ""),
+        "tier": result_obj.get("tier", ""),
+        "quality": result_obj.get("quality", {}),
+        "telemetry": result_obj.get("telemetry", {}),
+        "markdown_sha256": result_obj.get("markdown_sha256", ""),
         "keys": result_obj.get("keys", []),
         "data": rec_canon,
     }
@@ -171,18 +182,179 @@ def compare_with_json(file1_obj, file2_obj):
 
     return md
 
+# 대용량 JSON/JSONL 스트리밍 읽기
+# 파일 전체를 읽지 않고 청크 단위로 raw_decode 하면서 레코드를 하나씩 돌려줌
+#  - [...] 배열, {"data": [...]} 래퍼(배열 원소 단위), 단일 레코드, JSONL/연속된 JSON 값 모두 지원
+JSON_STREAM_CHUNK = int(os.getenv("JSON_STREAM_CHUNK", str(1 << 20)))            # 한 번에 읽을 글자 수
+JSON_STREAM_MAX_RECORD = int(os.getenv("JSON_STREAM_MAX_RECORD", str(64 << 20)))  # 레코드 하나의 최대 크기
+
+class _JsonStream:
+    """파일을 청크 단위로 읽으며 JSON 값을 하나씩 꺼내는 버퍼"""
+    _WS = " \t\r\n\ufeff"
+
+    def __init__(self, f, chunk_size: int = JSON_STREAM_CHUNK):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self, n: int = 0) -> bool:
+        if self.eof:
+            return False
+        data = self.f.read(max(n, self.chunk_size))
+        if not data:
+            self.eof = True
+            return False
+        # 이미 읽은 앞부분은 버림 (메모리 제한)
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """공백을 건너뛴 다음 글자 (파일 끝이면 "")"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in self._WS:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, ch: str):
+        if self.peek() != ch:
+            raise ValueError(f"JSON 형식 오류: '{ch}' 필요 (위치 근처: {self.buf[self.pos:self.pos + 40]!r})")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """다음 JSON 값 하나 (버퍼에 다 안 들어왔으면 더 읽어서 재시도)"""
+        self.peek()
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self.buf, self.pos)
+                # 버퍼 끝에서 끝난 값(예: 숫자)은 잘렸을 수 있으므로 더 읽어서 확인
+                if end < len(self.buf) or self.eof or not self._fill():
+                    self.pos = end
+                    return obj
+            except json.JSONDecodeError as e:
+                # 오류 위치 뒤에 줄바꿈이 있으면 잘린 것이 아니라 실제 형식 오류
+                if self.eof or "\n" in self.buf[e.pos:] or len(self.buf) - self.pos > JSON_STREAM_MAX_RECORD:
+                    raise
+                if not self._fill(len(self.buf) - self.pos):
+                    raise
+
+    def skip_line(self):
+        """형식이 깨진 JSONL 줄 건너뛰기"""
+        while True:
+            nl = self.buf.find("\n", self.pos)
+            if nl >= 0:
+                self.pos = nl + 1
+                return
+            self.pos = len(self.buf)
+            if not self._fill():
+                return
+
+def _stream_array(s: _JsonStream) -> Iterator[Any]:
+    """'[' 다음부터 원소를 하나씩 (']'까지)"""
+    while True:
+        c = s.peek()
+        if c == ",":
+            s.pos += 1
+        elif c == "]":
+            s.pos += 1
+            return
+        elif c == "":
+            raise ValueError("JSON 배열이 닫히지 않았습니다.")
+        else:
+            yield s.value()
+
+def _stream_object(s: _JsonStream) -> Iterator[Any]:
+    """
+    최상위 '{...}' 하나: "data"가 배열이면 원소 단위로 스트리밍, dict면 그대로,
+    "data" 키가 없으면 객체 자체를 레코드로
+    """
+    s.expect("{")
+    fields: Dict[str, Any] = {}
+    has_data = False
+    while True:
+        c = s.peek()
+        if c == ",":
+            s.pos += 1
+            continue
+        if c == "}":
+            s.pos += 1
+            break
+        if c == "":
+            raise ValueError("JSON 객체가 닫히지 않았습니다.")
+        key = s.value()
+        s.expect(":")
+        if key == "data" and not has_data:
+            has_data = True
+            if s.peek() == "[":
+                s.pos += 1
+                yield from _stream_array(s)
+            else:
+                data = s.value()
+                if isinstance(data, dict):
+                    yield data
+        else:
+            fields[key] = s.value()
+    if not has_data:
+        yield fields
+
+def iter_json_records(path: str, chunk_size: int = JSON_STREAM_CHUNK) -> Iterator[Dict[str, Any]]:
+    """
+    JSON/JSONL 파일의 레코드(dict)를 하나씩 반환 (파일 전체를 메모리에 올리지 않음)
+    - 문자열 원소는 json.loads 재시도, dict가 아닌 값은 스킵
+    - JSONL에서 깨진 줄은 경고 후 스킵
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        s = _JsonStream(f, chunk_size)
+        if s.peek() == "[":
+            s.pos += 1
+            items = _stream_array(s)
+        else:
+            items = _stream_sequence(s)
+        for it in items:
+            if isinstance(it, str):
+                try:
+                    it = json.loads(it)
+                except Exception:
+                    continue
+            if isinstance(it, dict):
+                yield it
+
+def _stream_sequence(s: _JsonStream) -> Iterator[Any]:
+    """단일 객체/래퍼 또는 JSONL(연속된 JSON 값): 첫 값은 래퍼일 수 있으므로 스트리밍, 이후 값은 줄 단위"""
+    first = True
+    while s.peek():
+        if first and s.peek() == "{":
+            first = False
+            yield from _stream_object(s)
+            continue
+        first = False
+        try:
+            yield s.value()
+        except ValueError as e:
+            print(f"[json] 잘못된 줄 건너뜀: {e}")
+            s.skip_line()
+
 class FuzzyExhibitionMatcher:
     def __init__(
         self,
         threshold: float = 0.8,      # 매칭 임계치 (0~1)
         weight_kr: float = 0.6,      # 국문명 가중치
         weight_en: float = 0.4,      # 영문명 가중치
-        keys_order: Optional[List[str]] = None
+        keys_order: Optional[List[str]] = None,
+        one_to_one: bool = False,    # True면 사이트 레코드 하나에 DB 레코드 하나만 배정 (assignment.py)
+        name_dict: bool = False      # True면 한쪽 이름만 있는 레코드를 국문↔영문 사전으로 채워 비교 (bilingual.py, 점수가 달라짐)
     ):
         self.threshold = threshold
         self.weight_kr = weight_kr
         self.weight_en = weight_en
         self.keys_order = keys_order or DEFAULT_KEYS_ORDER
+        self.one_to_one = one_to_one
 
         # 유사도 함수 준비(rapidfuzz -> difflib 백업)
         try:
@@ -193,112 +365,91 @@ class FuzzyExhibitionMatcher:
             self._use_rapidfuzz = False
             self._fuzz = None
 
+        # 전체 쌍 일괄 계산용(rapidfuzz.process.cdist + numpy), 없으면 이중 루프로 대체
+        try:
+            import numpy as np
+            from rapidfuzz import process
+            self._np = np if self._use_rapidfuzz else None
+            self._process = process if self._use_rapidfuzz else None
+        except Exception:
+            self._np = None
+            self._process = None
+
+        # 후보 블로킹용 n-gram 역색인 (numpy 필요), 같은 target 리스트는 색인 재사용
+        try:
+            import matcher_index
+            self._matcher_index = matcher_index
+        except Exception:
+            self._matcher_index = None
+        self._index_cache: Optional[Tuple[List[Dict[str, Any]], Any]] = None
+
+        # 국문↔영문 이름 사전 (국문명만 있는 DB ↔ 영문명만 있는 사이트도 후보/점수에 잡히도록)
+        self._names_dict = None
+        if name_dict:
+            try:
+                from bilingual import NAMES
+                self._names_dict = NAMES
+            except Exception:
+                self._names_dict = None
+
         # 정규화용 정규식
         self._punct_re = re.compile(r"[\s\-\_\/\|\(\)\[\]\{\}\.\,\!\?\:;’'\"“”`·]+")
 
     # ---------- 공개 API ----------
-    def compare_files(self, base_json_path: str, target_json_path: str) -> str:
+    def compare_files(self, base_json_path: str, target_json_path: str, workers: Optional[int] = None) -> str:
         """
         파일 경로 2개를 받아 매칭 요약 + 상세 차이표(Markdown) 반환.
-        (파일은 {"data":[...]} 또는 리스트 형태 모두 허용)
+        (파일은 {"data":[...]} 또는 리스트 형태 모두 허용, target이 matcher_index 색인 폴더면 색인을 열어 비교)
         """
-        base = self._load_any(base_json_path)
+        # base는 스트리밍(한 건씩 매칭), target은 색인/행렬 계산을 위해 리스트로 읽음
+        base = self._iter_any(base_json_path)
+        if os.path.isdir(target_json_path) and self._matcher_index is not None:
+            return self.compare_lists(base, index=self._matcher_index.MatcherIndex.open(target_json_path),
+                                      workers=workers)
         targ = self._load_any(target_json_path)
-        return self.compare_lists(base, targ)
+        return self.compare_lists(base, targ, workers=workers)
 
-    def compare_lists(self, base_list: List[Dict[str, Any]], target_list: List[Dict[str, Any]]) -> str:
+    def compare_lists(self, base_list: Iterable[Dict[str, Any]], target_list: Optional[List[Dict[str, Any]]] = None,
+                      index=None, workers: Optional[int] = None, page: int = 1,
+                      page_size: int = MATCH_PAGE_SIZE) -> str:
         """
         리스트 2개를 받아 매칭 요약 + 상세 차이표(Markdown) 반환.
+        index(build_index/NgramIndex.load 결과)를 주면 target_list 대신 색인의 레코드와 비교.
+        workers > 1(-1이면 CPU 수)이면 base를 나눠 여러 프로세스에서 매칭 (기본 MATCH_WORKERS).
+        매칭 쌍이 page_size개를 넘으면 page번째 페이지만 그림 (전체는 match()의 MatchResult로 내보내기).
         """
-        pairs = self._build_best_matches(base_list, target_list)
-
-        if not pairs:
-            return f"퍼지 임계치 {self.threshold} 기준으로 매칭된 항목이 없습니다."
-
-        out = []
-        out.append(f"### 매칭 결과 요약 (임계치={self.threshold}, KR:{self.weight_kr}, EN:{self.weight_en})")
-        out.append("| DB | 사이트 데이터 | 매칭점수 |\n|---|---|---|")
-        for a, b, s in pairs:
-            out.append(f"| {a.get(KR_KEY,'')} / {a.get(EN_KEY,'')} | "
-                       f"{b.get(KR_KEY,'')} / {b.get(EN_KEY,'')} | {s:.2f} |")
+        return self.match(base_list, target_list, index, workers).render_page(page, page_size)
 
-        # 상세 차이 표
-        for idx, (a, b, s) in enumerate(pairs, start=1):
-            out.append(f"\n---\n#### #{idx}. `{a.get(KR_KEY,'')}` ↔ `{b.get(KR_KEY,'')}` (score: {s:.2f})")
-            out.append(self._diff_table(a, b))
-
-        return "\n".join(out)
-
-    # ---------- 내부 로직 ----------
-    def _read_json_any(self, path: str):
-        """파일이 JSON/JSONL 중 무엇이든 안전하게 읽어서 Python 객체로 반환"""
-        with open(path, "r", encoding="utf-8") as f:
-            txt = f.read().strip()
-        # JSONL 가능성: 줄마다 개별 JSON
-        if "\n" in txt and txt.lstrip().startswith("{") is False and txt.lstrip().startswith("[") is False:
-            objs = []
-            for i, line in enumerate(txt.splitlines()):
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    objs.append(json.loads(line))
-                except Exception as e:
-                    # 한 줄 JSON 파싱 실패 시 무시(또는 raise로 바꿔도 됨)
-                    pass
-            return objs
-        # 일반 JSON
-        return json.loads(txt)
-
-    def _coerce_records(self, obj) -> List[Dict[str, Any]]:
+    def match(self, base_list: Iterable[Dict[str, Any]], target_list: Optional[List[Dict[str, Any]]] = None,
+              index=None, workers: Optional[int] = None, one_to_one: Optional[bool] = None) -> MatchResult:
         """
-        다양한 입력 형태를 List[dict]로 강제 변환:
-        - {"data": [...]}
-        - {...} (단일 dict)
-        - [...] (dict/str 혼재 가능 → str이면 json.loads 재시도)
-        - 그 외는 스킵
+        매칭 결과를 MatchResult(쌍/점수/항목별 일치 여부)로 반환
+        one_to_one(기본 self.one_to_one)이면 각 base의 최고점 대신 전체 1:1 배정 (단일 프로세스)
         """
-        if isinstance(obj, dict):
-            # {"data": ...} or 단일 레코드
-            data = obj.get("data", obj)
-            if isinstance(data, list):
-                items = data
-            elif isinstance(data, dict):
-                items = [data]
-            else:
-                return []
-        elif isinstance(obj, list):
-            items = obj
+        if index is not None:
+            target_list = index.records
+        if self.one_to_one if one_to_one is None else one_to_one:
+            pairs = self._build_one_to_one(base_list, target_list or [], index)
         else:
-            return []
-
-        records: List[Dict[str, Any]] = []
-        for i, it in enumerate(items):
-            if isinstance(it, dict):
-                records.append(it)
-            elif isinstance(it, str):
-                # 요소가 문자열 JSON인 경우 파싱 시도
-                try:
-                    parsed = json.loads(it)
-                    if isinstance(parsed, dict):
-                        records.append(parsed)
-                except Exception:
-                    # 파싱 불가 문자열은 스킵
-                    continue
-            # 다른 타입은 스킵
-        return records
+            pairs = self._build_best_matches(base_list, target_list or [], index, workers)
+        return MatchResult.from_pairs(pairs, self.keys_order, self.threshold, self.weight_kr, self.weight_en)
 
-    def _load_any(self, path: str) -> List[Dict[str, Any]]:
-        obj = self._read_json_any(path)
-        recs = self._coerce_records(obj)
-        # 국문/영문명이 모두 비어있는 레코드는 매칭 불가 → 스킵
-        cleaned = []
-        for r in recs:
+    # ---------- 내부 로직 ----------
+    def _iter_any(self, path: str) -> Iterator[Dict[str, Any]]:
+        """
+        파일의 레코드를 스트리밍으로 하나씩 반환 (iter_json_records)
+        국문/영문명이 모두 비어있는 레코드는 매칭 불가 → 스킵, 한 건도 없으면 첫 next()에서 ValueError
+        """
+        empty = True
+        for r in iter_json_records(path):
             if str(r.get(KR_KEY, "")).strip() or str(r.get(EN_KEY, "")).strip():
-                cleaned.append(r)
-        if not cleaned:
+                empty = False
+                yield r
+        if empty:
             raise ValueError(f"레코드가 비어있거나, '{KR_KEY}'/'{EN_KEY}'가 없는 데이터입니다: {os.path.basename(path)}")
-        return cleaned
+
+    def _load_any(self, path: str) -> List[Dict[str, Any]]:
+        return list(self._iter_any(path))
 
 
     def _normalize(self, s: Optional[str]) -> str:
@@ -309,6 +460,22 @@ class FuzzyExhibitionMatcher:
         s = re.sub(r"\s+", " ", s)
         return s
 
+    def _raw_names(self, rec: Dict[str, Any]) -> Tuple[str, str]:
+        """(국문명, 영문명) 원문, 한쪽만 있으면 이름 사전으로 반대쪽 채움"""
+        kr, en = str(rec.get(KR_KEY, "") or ""), str(rec.get(EN_KEY, "") or "")
+        d = self._names_dict
+        if d is not None and bool(kr.strip()) != bool(en.strip()):
+            if kr.strip():
+                en = d.lookup("exhibition", kr, to="en")
+            else:
+                kr = d.lookup("exhibition", en, to="ko")
+        return kr, en
+
+    def _names(self, rec: Dict[str, Any]) -> Tuple[str, str]:
+        """(정규화 국문명, 정규화 영문명), 사전 보완 포함"""
+        kr, en = self._raw_names(rec)
+        return self._normalize(kr), self._normalize(en)
+
     def _sim_ratio(self, a: str, b: str) -> float:
         """
         부분 일치 유사도 (0~1). rapidfuzz.partial_ratio 우선, 없으면 difflib로 대체.
@@ -324,11 +491,11 @@ class FuzzyExhibitionMatcher:
         """
         국문/영문 각각 부분 일치 점수 → 사용 가능한 가중치만 정규화해 가중 평균.
         """
-        kr_a = self._normalize(a.get(KR_KEY, ""))
-        kr_b = self._normalize(b.get(KR_KEY, ""))
-        en_a = self._normalize(a.get(EN_KEY, ""))
-        en_b = self._normalize(b.get(EN_KEY, ""))
+        (kr_a, en_a), (kr_b, en_b) = self._names(a), self._names(b)
+        return self._pair_score(kr_a, kr_b, en_a, en_b)
 
+    def _pair_score(self, kr_a: str, kr_b: str, en_a: str, en_b: str) -> float:
+        """_composite_score의 정규화된 이름 버전"""
         score_kr = self._sim_ratio(kr_a, kr_b) if (kr_a and kr_b) else 0.0
         score_en = self._sim_ratio(en_a, en_b) if (en_a and en_b) else 0.0
 
@@ -341,14 +508,54 @@ class FuzzyExhibitionMatcher:
 
         return (score_kr * used_w_kr + score_en * used_w_en) / denom
 
+    def build_index(self, target: List[Dict[str, Any]]):
+        """target 레코드의 n-gram 역색인 생성 (NgramIndex, save()로 저장해 재사용 가능)"""
+        if self._matcher_index is None:
+            raise RuntimeError("numpy가 없어 n-gram 색인을 만들 수 없습니다.")
+        return self._matcher_index.NgramIndex.build(target, self._names)
+
+    def _get_index(self, target: List[Dict[str, Any]]):
+        """같은 target 리스트 객체면 직전 색인 재사용"""
+        if self._index_cache is None or self._index_cache[0] is not target:
+            self._index_cache = (target, self.build_index(target))
+        return self._index_cache[1]
+
     def _build_best_matches(
         self,
-        base: List[Dict[str, Any]],
-        target: List[Dict[str, Any]]
+        base: Iterable[Dict[str, Any]],
+        target: List[Dict[str, Any]],
+        index=None,
+        workers: Optional[int] = None
     ) -> List[Tuple[Dict[str, Any], Dict[str, Any], float]]:
         """
         base 각 항목에 대해 target에서 최고 유사도 항목 선별, 임계치 이상만 반환.
+        - 색인이 있거나 쌍 수가 MATCH_BLOCKING_MIN_PAIRS 이상이면 n-gram 후보만 점수 계산
+          (이때 workers > 1이면 색인을 memory-map으로 공유하는 프로세스 풀에서 base를 나눠 매칭)
+        - rapidfuzz + numpy가 있으면 점수 행렬로 일괄 계산, 없으면 이중 루프
         """
+        n_base = len(base) if hasattr(base, "__len__") else None
+        mi = self._matcher_index
+        if n_base is None and index is None and mi is not None and target:
+            # base가 제너레이터(스트리밍)면 색인 기준 쌍 수가 될 때까지만 미리 읽어 봄
+            # 그 안에 끝나면 작은 입력 → 리스트로 전수/행렬 비교, 아니면 읽은 것부터 이어서 스트리밍
+            it = iter(base)
+            head = list(islice(it, -(-mi.BLOCKING_MIN_PAIRS // len(target))))
+            if len(head) * len(target) < mi.BLOCKING_MIN_PAIRS:
+                base, n_base = head, len(head)
+            else:
+                base = chain(head, it)
+        # 색인은 주어졌거나 쌍 수가 많을 때만 사용, 프로세스 풀도 색인을 쓸 때만 (워커 수와 무관하게 결과 동일)
+        if index is None and mi is not None and target and \
+                (n_base is None or n_base * len(target) >= mi.BLOCKING_MIN_PAIRS):
+            index = self._get_index(target)
+        if index is not None:
+            workers = mi.resolve_workers(workers) if mi is not None else 1
+            if workers > 1 and (n_base is None or n_base > mi.MATCH_SHARD_SIZE):
+                return mi.parallel_best_matches(self, base, index, workers)
+            return self._build_best_matches_blocked(base, index)
+        if self._np is not None and target:
+            return self._build_best_matches_matrix(base, target)
+
         matches = []
         for a in base:
             best_item = None
@@ -361,18 +568,124 @@ class FuzzyExhibitionMatcher:
                 matches.append((a, best_item, best_score))
         return matches
 
-    def _diff_table(self, left: Dict[str, Any], right: Dict[str, Any]) -> str:
+    def _name_matrix(self, base_names: List[str], target_names: List[str]):
         """
-        키 순서(self.keys_order)에 따라 값 비교 표 생성.
-        값이 다르면 빨간색으로 강조.
+        partial_ratio 점수 행렬 (0~1, float64)
+        한쪽이라도 이름이 비어 있는 쌍은 0 (_composite_score와 동일)
         """
-        md = "| 항목 | DB | 비교 데이터 |\n|---|---|---|\n"
-        for k in self.keys_order:
-            v1 = str(left.get(k, "") if left is not None else "")
-            v2 = str(right.get(k, "") if right is not None else "")
-            if v1 != v2:
-                v2_html = f'<span style="color:red">{v2}</span>'
-            else:
-                v2_html = v2
-            md += f"| {k} | {v1} | {v2_html} |\n"
-        return md
+        np = self._np
+        m = self._process.cdist(base_names, target_names, scorer=self._fuzz.partial_ratio,
+                                dtype=np.float64, workers=-1) / 100.0
+        has_a = np.array([bool(x) for x in base_names])
+        has_b = np.array([bool(x) for x in target_names])
+        m[~(has_a[:, None] & has_b[None, :])] = 0.0
+        return m
+
+    def _build_best_matches_matrix(
+        self,
+        base: Iterable[Dict[str, Any]],
+        target: List[Dict[str, Any]],
+        block_rows: int = 2048
+    ) -> List[Tuple[Dict[str, Any], Dict[str, Any], float]]:
+        """
+        _build_best_matches의 행렬 버전 (결과 동일)
+        - 이름 정규화는 레코드당 한 번
+        - KR/EN 점수 행렬을 cdist(workers=-1)로 계산 → 가중 평균 → 행별 argmax(동점이면 앞쪽 target)
+        - 메모리 제한을 위해 base를 block_rows 행씩 나눠 계산
+        """
+        np = self._np
+        matches = []
+        for block, score in self._score_blocks(base, target, block_rows):
+            best_idx = score.argmax(axis=1)
+            best_score = score[np.arange(len(block)), best_idx]
+            for i in np.nonzero(best_score >= self.threshold)[0]:
+                matches.append((block[i], target[best_idx[i]], float(best_score[i])))
+        return matches
+
+    def _score_blocks(self, base: Iterable[Dict[str, Any]], target: List[Dict[str, Any]], block_rows: int = 2048):
+        """base block_rows행씩 (블록 레코드, 종합 점수 행렬) 생성"""
+        np = self._np
+        kr_b, en_b = (list(col) for col in zip(*map(self._names, target))) if target else ([], [])
+
+        it = iter(base)
+        while True:
+            block = list(islice(it, block_rows))
+            if not block:
+                break
+            kr_a, en_a = (list(col) for col in zip(*map(self._names, block)))
+            score_kr = self._name_matrix(kr_a, kr_b)
+            score_en = self._name_matrix(en_a, en_b)
+
+            # 점수가 0인 쪽 가중치는 제외하고 정규화 (둘 다 0이면 0)
+            used_w_kr = np.where(score_kr > 0, self.weight_kr, 0.0)
+            used_w_en = np.where(score_en > 0, self.weight_en, 0.0)
+            denom = used_w_kr + used_w_en
+            denom[denom == 0] = 1.0
+            score = (score_kr * used_w_kr + score_en * used_w_en) / denom
+            yield block, score
+
+    def _candidate_edges(self, base: List[Dict[str, Any]], target: List[Dict[str, Any]],
+                         index=None) -> Iterator[Tuple[int, int, float]]:
+        """
+        임계치 이상인 모든 (base 번호, target 번호, 점수) 간선
+        - 색인이 있거나 쌍 수가 MATCH_BLOCKING_MIN_PAIRS 이상이면 n-gram 후보 쌍만 계산 (N×M 행렬을 만들지 않음)
+        - 작은 입력은 점수 행렬(numpy) 또는 이중 루프
+        """
+        mi = self._matcher_index
+        if index is None and mi is not None and target and len(base) * len(target) >= mi.BLOCKING_MIN_PAIRS:
+            index = self._get_index(target)
+        if index is not None:
+            kr_b, en_b = index.names["kr"], index.names["en"]
+            for i, a in enumerate(base):
+                kr_a, en_a = self._names(a)
+                for j in index.candidates(kr_a, en_a):
+                    s = self._pair_score(kr_a, kr_b[j], en_a, en_b[j])
+                    if s >= self.threshold:
+                        yield i, int(j), s
+        elif self._np is not None and target:
+            start = 0
+            for block, score in self._score_blocks(base, target):
+                for r, j in zip(*self._np.nonzero(score >= self.threshold)):
+                    yield start + int(r), int(j), float(score[r, j])
+                start += len(block)
+        else:
+            for i, a in enumerate(base):
+                for j, b in enumerate(target):
+                    s = self._composite_score(a, b)
+                    if s >= self.threshold:
+                        yield i, j, s
+
+    def _build_one_to_one(self, base: Iterable[Dict[str, Any]], target: List[Dict[str, Any]],
+                          index=None) -> List[Tuple[Dict[str, Any], Dict[str, Any], float]]:
+        """임계치 이상 간선 그래프에서 1:1 배정 (연결 요소별 헝가리안 또는 greedy, assignment.py)"""
+        from assignment import assign_one_to_one
+        base = list(base)
+        records = index.records if index is not None else target
+        edges = list(self._candidate_edges(base, target, index))
+        assigned = assign_one_to_one(edges)
+        print(f"[match] 1:1 배정: 간선 {len(edges)}개 → {len(assigned)}쌍")
+        return [(base[i], records[j], s) for i, j, s in assigned]
+
+    def _build_best_matches_blocked(
+        self,
+        base: Iterable[Dict[str, Any]],
+        index
+    ) -> List[Tuple[Dict[str, Any], Dict[str, Any], float]]:
+        """
+        n-gram 색인 후보만 점수 계산 (점수/동점 처리는 _build_best_matches와 동일,
+        공통 n-gram이 부족해 후보에서 빠진 쌍은 비교하지 않음)
+        """
+        return [(a, index.records[j], s) for _, a, j, s in self._best_match_rows(base, index)]
+
+    def _best_match_rows(self, base: Iterable[Dict[str, Any]], index) -> Iterator[Tuple[int, Dict[str, Any], int, float]]:
+        """색인 기준 base 각 항목의 (base 순번, base 레코드, target 번호, 점수) (임계치 이상만, 병렬 워커에서도 사용)"""
+        kr_b, en_b = index.names["kr"], index.names["en"]
+        for i, a in enumerate(base):
+            kr_a, en_a = self._names(a)
+            best_j, best_score = -1, -1.0
+            for j in index.candidates(kr_a, en_a):
+                s = self._pair_score(kr_a, kr_b[j], en_a, en_b[j])
+                if s > best_score:
+                    best_j, best_score = j, s
+            if best_j >= 0 and best_score >= self.threshold:
+                yield i, a, int(best_j), best_score
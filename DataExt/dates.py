@@ -0,0 +1,320 @@
+# dates.py
+# -*- coding: utf-8 -*-
+"""
+날짜 정규화 (개최 시작/개최 종료 → YYYY-MM-DD)
+
+미리 컴파일한 패턴으로 국문/ISO/점 표기/영문 월 이름과 기간 표기를 처리하고,
+어느 패턴에도 맞지 않을 때만 dateutil(fuzzy)을 쓴다 (사용 횟수는 STATS에 집계).
+- 2025-05-06 / 2025.5.6 / 2025/05/06 / 2025년 5월 6일 / 20250506
+- 기간: 2025.05.06 ~ 05.08 / 2025년 5월 6일 ~ 8일 / May 6-8, 2025 / 30 May - 2 June 2025 / 2025.12.30 ~ 01.02
+- 연-월만 있으면 YYYY-MM-01 (May 2025, 2025.05)
+- 못 읽으면 원문 그대로 반환
+
+    normalize_date("2025.05.06 ~ 05.08")          # '2025-05-06'
+    normalize_date("2025.05.06 ~ 05.08", "end")   # '2025-05-08'
+    normalize_dates(df["개최 시작"])                # 열 단위 (같은 값은 한 번만 계산)
+
+    python dates.py clean outputs/extract_*.json --dry-run
+    python dates.py clean export.xlsx --columns "개최 시작,개최 종료" --out export_clean.xlsx
+"""
+import os
+import re
+import sys
+import glob
+import json
+import argparse
+import datetime as dt
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# ==== 설정 ===================================================================
+DATE_CACHE_SIZE = int(os.getenv("DATE_CACHE_SIZE", "65536"))
+DATE_DATEUTIL_FALLBACK = os.getenv("DATE_DATEUTIL_FALLBACK", "1") != "0"   # 0이면 패턴에 없는 표기는 원문 유지
+DATE_KEYS = ("개최 시작", "개최 종료")
+
+# 패턴별 처리 건수 (pattern / partial / dateutil / dateutil_failed / unparsed)
+STATS: Counter = Counter()
+
+# ==== 패턴 ===================================================================
+_MONTHS = {
+    "jan": 1, "january": 1, "feb": 2, "february": 2, "mar": 3, "march": 3, "apr": 4, "april": 4,
+    "may": 5, "jun": 6, "june": 6, "jul": 7, "july": 7, "aug": 8, "august": 8,
+    "sep": 9, "sept": 9, "september": 9, "oct": 10, "october": 10, "nov": 11, "november": 11,
+    "dec": 12, "december": 12,
+}
+_MON = r"(?:" + "|".join(sorted(_MONTHS, key=len, reverse=True)) + r")\.?"
+_YEAR = r"(?:19|20)\d{2}"
+_YSEP = r"(?:\s*[.\-/년]\s*|\s+)"
+_MSEP = r"(?:\s*[.\-/월]\s*|\s+)"
+_DAY_END = r"(?![\d:])(?:\s*일|\.)?(?:\s*\([^)]{1,3}\))?(?:\s+\d{1,2}:\d{2})?"   # 6일(화) / 6.(화) / 6 10:00
+_ORD = r"(?:st|nd|rd|th)?"
+_RANGE = r"\s*(?:~|∼|〜|–|—|-|to|until|부터)\s*"
+_RANGE_HEAD_RE = re.compile(_RANGE, re.I)
+
+# 2025.05.06 (~ [2025.][05.]08)
+_NUM_RE = re.compile(
+    rf"(?<!\d)(?P<y>{_YEAR}){_YSEP}(?P<m>\d{{1,2}}){_MSEP}(?P<d>\d{{1,2}}){_DAY_END}"
+    rf"(?:{_RANGE}(?:(?P<y2>{_YEAR}){_YSEP})?(?:(?P<m2>\d{{1,2}}){_MSEP})?(?P<d2>\d{{1,2}}){_DAY_END})?",
+    re.I)
+# 20250506
+_COMPACT_RE = re.compile(rf"(?<!\d)(?P<y>{_YEAR})(?P<m>[01]\d)(?P<d>[0-3]\d)(?!\d)")
+# May 6(-8 / - June 2), 2025
+_EN_MDY_RE = re.compile(
+    rf"\b(?P<mon>{_MON})\s+(?P<d>\d{{1,2}}){_ORD}"
+    rf"(?:{_RANGE}(?:(?P<mon2>{_MON})\s+)?(?P<d2>\d{{1,2}}){_ORD})?,?\s+(?P<y>{_YEAR})\b",
+    re.I)
+# 6(-8) May 2025 / 30 May - 2 June 2025
+_EN_DMY_RE = re.compile(
+    rf"(?<!\d)(?P<d>\d{{1,2}}){_ORD}(?:\s+(?P<mon>{_MON}))?"
+    rf"(?:{_RANGE}(?P<d2>\d{{1,2}}){_ORD})?\s+(?P<mon2>{_MON}),?\s+(?P<y>{_YEAR})\b",
+    re.I)
+# 2025.05 / 2025년 5월
+_NUM_YM_RE = re.compile(rf"(?<!\d)(?P<y>{_YEAR}){_YSEP}(?P<m>\d{{1,2}})(?!\d)")
+# May 2025
+_EN_MY_RE = re.compile(rf"\b(?P<mon>{_MON}),?\s+(?P<y>{_YEAR})\b", re.I)
+
+# ==== 파싱 ===================================================================
+def _month(name: Optional[str]) -> int:
+    return _MONTHS.get((name or "").rstrip(".").lower(), 0) if name else 0
+
+def _iso(y: int, m: int, d: int) -> str:
+    """유효한 날짜면 YYYY-MM-DD, 아니면 "" """
+    try:
+        return dt.date(y, m, d).isoformat()
+    except (ValueError, TypeError):
+        return ""
+
+def _end_of(start: str, y2: int, m2: int, d2: int) -> str:
+    """기간 끝 (빠진 연/월은 시작에서, 시작보다 앞서면 다음 달/해로 넘김)"""
+    sy, sm, _ = (int(x) for x in start.split("-"))
+    y, m = y2 or sy, m2 or sm
+    end = _iso(y, m, d2)
+    if end and end < start:
+        end = _iso(y + 1, m, d2) if m2 else _iso(y + (sm == 12), sm % 12 + 1, d2)
+    return end
+
+def _full_match(s: str) -> Optional[Tuple[int, int, str, str]]:
+    """연-월-일이 모두 있는 첫 표기 → (시작 위치, 끝 위치, 시작, 끝)"""
+    best: Optional[Tuple[int, int, str, str]] = None
+
+    def _take(m, start: str, end: str):
+        nonlocal best
+        if start and (best is None or m.start() < best[0]):
+            best = (m.start(), m.end(), start, end or start)
+
+    for m in _NUM_RE.finditer(s):
+        start = _iso(int(m["y"]), int(m["m"]), int(m["d"]))
+        if start:
+            end = _end_of(start, int(m["y2"] or 0), int(m["m2"] or 0), int(m["d2"])) if m["d2"] else ""
+            _take(m, start, end)
+            break
+    for m in _COMPACT_RE.finditer(s):
+        start = _iso(int(m["y"]), int(m["m"]), int(m["d"]))
+        if start:
+            _take(m, start, "")
+            break
+    for m in _EN_MDY_RE.finditer(s):
+        y, mon = int(m["y"]), _month(m["mon"])
+        end = _iso(y, _month(m["mon2"]) or mon, int(m["d2"])) if m["d2"] else ""
+        # "Dec 30 - Jan 2, 2026": 연도는 끝 날짜 기준
+        start = _iso(y - 1 if end and _month(m["mon2"]) and _month(m["mon2"]) < mon else y, mon, int(m["d"]))
+        if start:
+            _take(m, start, end)
+            break
+    for m in _EN_DMY_RE.finditer(s):
+        y, mon2 = int(m["y"]), _month(m["mon2"])
+        mon = _month(m["mon"]) or mon2
+        if m["d2"]:
+            start = _iso(y - 1 if mon > mon2 else y, mon, int(m["d"]))
+            end = _iso(y, mon2, int(m["d2"]))
+        else:
+            start, end = _iso(y, mon2, int(m["d"])), ""
+        if start:
+            _take(m, start, end)
+            break
+    return best
+
+def _partial_match(s: str) -> str:
+    """연-월만 있는 첫 표기 → YYYY-MM-01"""
+    best = None
+    for rx, month_of in ((_NUM_YM_RE, lambda m: int(m["m"])), (_EN_MY_RE, lambda m: _month(m["mon"]))):
+        for m in rx.finditer(s):
+            v = _iso(int(m["y"]), month_of(m), 1)
+            if v:
+                if best is None or m.start() < best[0]:
+                    best = (m.start(), v)
+                break
+    return best[1] if best else ""
+
+def _dateutil(s: str) -> str:
+    """마지막 수단: dateutil fuzzy 파싱 (없거나 실패하면 "")"""
+    if not DATE_DATEUTIL_FALLBACK or not any(c.isdigit() for c in s):
+        return ""
+    STATS["dateutil"] += 1
+    try:
+        from dateutil import parser  # conda/pip에 dateutil이 없다면 위의 패턴만 사용
+        return parser.parse(s, fuzzy=True, dayfirst=False).strftime("%Y-%m-%d")
+    except Exception:
+        STATS["dateutil_failed"] += 1
+        return ""
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_range(s: str) -> Tuple[str, str]:
+    """표기 → (시작, 끝) YYYY-MM-DD (기간이 아니면 끝 = 시작, 못 읽으면 ("", ""))"""
+    s = " ".join(str(s or "").split())
+    if not s:
+        return "", ""
+    found = _full_match(s)
+    if found:
+        STATS["pattern"] += 1
+        _, stop, start, end = found
+        if end == start:
+            # "May 6, 2025 - May 8, 2025"처럼 끝 날짜도 완전한 표기인 기간
+            head = _RANGE_HEAD_RE.match(s, stop)
+            nxt = _full_match(s[head.end():]) if head else None
+            if nxt and nxt[0] == 0 and nxt[2] >= start:
+                end = nxt[2]
+        return start, end
+    v = _partial_match(s)
+    if v:
+        STATS["partial"] += 1
+        return v, v
+    v = _dateutil(s)
+    if not v:
+        STATS["unparsed"] += 1
+    return v, v
+
+def normalize_date(s: Any, part: str = "start") -> str:
+    """다양한 표기 → YYYY-MM-DD (part="end"면 기간의 끝, 모르면 원문 그대로)"""
+    if s is None:
+        return ""
+    s = str(s).strip()
+    if not s:
+        return ""
+    start, end = parse_range(s)
+    v = end if part == "end" else start
+    return v or s
+
+def date_stats() -> Dict[str, int]:
+    """처리 건수 + 캐시 적중"""
+    info = parse_range.cache_info()
+    return {**STATS, "cache_hits": info.hits, "cache_size": info.currsize}
+
+# ==== 열 단위 ================================================================
+def _is_missing(v: Any) -> bool:
+    return v is None or (isinstance(v, float) and v != v)
+
+def normalize_dates(values: Iterable[Any], part: str = "start"):
+    """
+    열(리스트 / numpy 배열 / pandas Series) 단위 정규화
+    같은 값은 한 번만 계산해서 다시 펼침 (Series면 같은 index의 Series, 배열이면 object 배열, 그 외 리스트)
+    """
+    is_series = hasattr(values, "index") and hasattr(values, "to_numpy")
+    raw = values.to_numpy(dtype=object) if is_series else values
+    try:
+        import numpy as np
+    except Exception:
+        np = None
+
+    if np is None:
+        memo: Dict[Any, str] = {}
+        out = [memo.setdefault(v, normalize_date(v, part)) if not _is_missing(v) else "" for v in raw]
+        return out
+
+    arr = np.asarray(raw, dtype=object)
+    keys = np.array(["" if _is_missing(v) else str(v) for v in arr.ravel()], dtype=object)
+    uniq, inverse = np.unique(keys, return_inverse=True)
+    mapped = np.array([normalize_date(u, part) for u in uniq], dtype=object)
+    out = mapped[inverse].reshape(arr.shape)
+    if is_series:
+        import pandas as pd
+        return pd.Series(out, index=values.index, name=getattr(values, "name", None))
+    if isinstance(values, np.ndarray):
+        return out
+    return out.tolist()
+
+def normalize_frame(df, columns: Iterable[str] = DATE_KEYS):
+    """DataFrame의 날짜 열 정규화 (개최 종료 열은 기간의 끝), 없는 열은 무시 → 같은 DataFrame"""
+    for col in columns:
+        if col in df.columns:
+            df[col] = normalize_dates(df[col], "end" if col == "개최 종료" else "start")
+    return df
+
+def normalize_records(records: List[Dict[str, Any]], columns: Iterable[str] = DATE_KEYS) -> List[Dict[str, Any]]:
+    """레코드 목록의 날짜 키 정규화 (제자리 수정 후 그대로 반환)"""
+    for col in columns:
+        present = [r for r in records if col in r]
+        if not present:
+            continue
+        vals = normalize_dates([r[col] for r in present], "end" if col == "개최 종료" else "start")
+        for r, v in zip(present, vals):
+            r[col] = v
+    return records
+
+# ==== CLI ====================================================================
+def _clean_json(path: str, out: str, columns: List[str], dry_run: bool) -> int:
+    """추출 결과({"data": {...}}) / 레코드 목록 / {"data": [...]} JSON 정리 → 바뀐 값 수"""
+    with open(path, "r", encoding="utf-8") as f:
+        obj = json.load(f)
+    data = obj.get("data") if isinstance(obj, dict) else obj
+    records = [data] if isinstance(data, dict) else [r for r in (data or []) if isinstance(r, dict)]
+    before = [[r.get(c) for c in columns] for r in records]
+    normalize_records(records, columns)
+    changed = sum(a != r.get(c) for b, r in zip(before, records) for a, c in zip(b, columns))
+    if changed and not dry_run:
+        with open(out, "w", encoding="utf-8") as f:
+            json.dump(obj, f, ensure_ascii=False, indent=2)
+    return changed
+
+def _clean_table(path: str, out: str, columns: List[str], dry_run: bool) -> int:
+    """CSV/XLSX (DB 내보내기 등) 정리 → 바뀐 값 수 (pandas 필요)"""
+    import pandas as pd
+    xlsx = path.lower().endswith((".xlsx", ".xls"))
+    df = pd.read_excel(path, dtype=str) if xlsx else pd.read_csv(path, dtype=str, encoding="utf-8-sig")
+    cols = [c for c in columns if c in df.columns]
+    before = df[cols].copy()
+    normalize_frame(df, cols)
+    changed = int((before.fillna("") != df[cols].fillna("")).to_numpy().sum())
+    if changed and not dry_run:
+        if out.lower().endswith((".xlsx", ".xls")):
+            df.to_excel(out, index=False)
+        else:
+            df.to_csv(out, index=False, encoding="utf-8-sig")
+    return changed
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="날짜 정규화")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p_clean = sub.add_parser("clean", help="JSON 추출 결과, CSV/XLSX 내보내기의 날짜 열 정리")
+    p_clean.add_argument("paths", nargs="+", help="파일 또는 glob 패턴 (예: outputs/extract_*.json)")
+    p_clean.add_argument("--columns", default=",".join(DATE_KEYS), help="정리할 열 (쉼표 구분)")
+    p_clean.add_argument("--out", default=None, help="결과 파일 (파일 1개일 때만, 기본은 제자리 수정)")
+    p_clean.add_argument("--dry-run", action="store_true", help="바뀔 값 수만 출력")
+    p_parse = sub.add_parser("parse", help="표기 하나 해석")
+    p_parse.add_argument("text")
+    args = ap.parse_args(argv)
+
+    if args.cmd == "parse":
+        print(parse_range(args.text))
+        return 0
+
+    files = [f for p in args.paths for f in (sorted(glob.glob(p)) or [p])]
+    if args.out and len(files) != 1:
+        ap.error("--out은 파일이 1개일 때만 쓸 수 있습니다.")
+    columns = [c.strip() for c in args.columns.split(",") if c.strip()]
+    total = 0
+    for path in files:
+        try:
+            fn = _clean_table if path.lower().endswith((".csv", ".xlsx", ".xls")) else _clean_json
+            n = fn(path, args.out or path, columns, args.dry_run)
+        except Exception as e:
+            print(f"{path}: 건너뜀 ({e})")
+            continue
+        total += n
+        print(f"{path}: {n}개 값 {'변경 예정' if args.dry_run else '변경'}")
+    print(f"합계 {total}개, {date_stats()}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
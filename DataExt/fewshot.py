@@ -0,0 +1,243 @@
+# fewshot.py
+# -*- coding: utf-8 -*-
+"""
+few-shot 예시 저장소
+
+검증된 (마크다운 발췌, 추출 레코드) 쌍을 도메인/페이지 형태와 함께 저장해 두고,
+요청마다 어휘 유사도가 가장 높은 예시만 골라 프롬프트에 넣는다.
+
+    python fewshot.py add --url https://www.auma.de/... --markdown page.md --record outputs/extract_....json
+    python fewshot.py list
+"""
+import os
+import re
+import sys
+import json
+import argparse
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+# ==== 설정 ===================================================================
+FEWSHOT_STORE = os.getenv("FEWSHOT_STORE") or os.path.join(os.path.dirname(__file__), "fewshot_examples.jsonl")
+FEWSHOT_K = int(os.getenv("FEWSHOT_K", "1"))                        # 요청당 넣을 예시 수
+FEWSHOT_EXCERPT_CHARS = int(os.getenv("FEWSHOT_EXCERPT_CHARS", "1200"))  # 저장할 발췌 길이
+DOMAIN_BONUS = 0.3
+SHAPE_BONUS = 0.1
+
+# 검색 대상 사이트는 도메인 그대로, 그 외는 모두 공식 홈페이지(official)로 묶음
+KNOWN_DOMAINS = ("auma.de", "gep.or.kr", "myfair.co")
+
+# ==== 기본 예시 (저장소가 비어 있어도 동작) ==================================
+BUILTIN_EXAMPLES: List[Dict[str, Any]] = [
+    {
+        "domain": "gep.or.kr",
+        "source_url": "",
+        "markdown": (
+            "2025 미국 라스베가스 폐기물 재활용 전시회 [WE]\nWaste Expo\nWE\n2025.05.06 - 2025.05.08\n"
+            "개최국가 | 미국 \n개최장소 | Las Vegas Convention Center \n산업분야 | 물류&운송, 기계&장비, 환경&폐기물 \n"
+            "전시품목 | 시설, 중장비, 운송, 처리 기술 및 시스템 \n"
+            "주최기관 | Informa Market \n전화 | 212-520-2700 \n이메일 | informamarkets@informa.com \n"
+            "홈페이지 | [www.wasteexpo.com]\n"
+        ),
+        "record": {
+            "전시회 국문명": "2025 미국 라스베가스 폐기물 재활용 전시회",
+            "영문명(Full Name)": "Waste Expo",
+            "영문명(약자)": "WE",
+            "개최 시작": "2025-05-06",
+            "개최 종료": "2025-05-08",
+            "개최장소(국문)": "라스베이거스 컨벤션 센터",
+            "개최장소(영어)": "Las Vegas Convention Center",
+            "국가": "United States",
+            "도시": "Las Vegas",
+            "첫 개최년도": "",
+            "개최 주기": "Annual",
+            "공식 홈페이지": "https://www.wasteexpo.com",
+            "주최기관": "Informa Markets",
+            "담당자": "",
+            "전화": "212-520-2700",
+            "이메일": "informamarkets@informa.com",
+            "산업분야": "Logistics, Machinery, Environment & Waste",
+            "전시품목": "Facilities, Heavy Equipment, Transport, Processing Tech & Systems",
+            "출처": "https://example.com"
+        },
+    },
+    {
+        "domain": "myfair.co",
+        "source_url": "",
+        "markdown": (
+            "# 미국 폐기물 및 재활용 전시회 2026(Waste Expo 2026)...\n"
+            "개최 일정 | 2027년 05월 03일(월) - 06일(목)\n"
+            "개최 장소 | Las Vegas Convention Center (LVCC)\n"
+            "개최 주기 | 1회 / 2년 | 첫 개최년도 | 1968년\n"
+        ),
+        "record": {
+            "전시회 국문명": "미국 폐기물 및 재활용 전시회 2026",
+            "영문명(Full Name)": "Waste Expo 2026",
+            "영문명(약자)": "",
+            "개최 시작": "2027-05-03",
+            "개최 종료": "2027-05-06",
+            "개최장소(국문)": "라스베이거스 컨벤션 센터",
+            "개최장소(영어)": "Las Vegas Convention Center (LVCC)",
+            "국가": "United States",
+            "도시": "Las Vegas",
+            "첫 개최년도": "1968",
+            "개최 주기": "Biennial",
+            "공식 홈페이지": "https://www.wasteexpo.com/en/home.html",
+            "주최기관": "",
+            "담당자": "",
+            "전화": "",
+            "이메일": "",
+            "산업분야": "Waste collection & transport, Smart waste mgmt, Recycling plants & equipment, Biogas & WtE, Eco-friendly treatment, Policy & Education",
+            "전시품목": "",
+            "출처": ""
+        },
+    },
+]
+
+# ==== 특징 추출 ==============================================================
+_TOKEN_RE = re.compile(r"[a-z]+|[가-힣]+|\d+")
+
+def domain_of(url: str) -> str:
+    """URL → 예시 도메인 키 (auma.de / gep.or.kr / myfair.co / official)"""
+    host = (urlsplit(url or "").netloc or "").lower().split(":")[0]
+    for d in KNOWN_DOMAINS:
+        if host == d or host.endswith("." + d):
+            return d
+    return "official" if host else ""
+
+def page_shape(markdown: str) -> str:
+    """페이지 형태: table(마크다운 표) / labels('항목 | 값', '항목: 값' 위주) / prose"""
+    lines = [l.strip() for l in (markdown or "").splitlines() if l.strip()]
+    if not lines:
+        return "prose"
+    table = sum(1 for l in lines if l.startswith("|") and l.count("|") >= 3)
+    labels = sum(1 for l in lines if re.match(r"^[^|:]{1,20}\s*[|:]\s*\S", l))
+    if table / len(lines) > 0.2:
+        return "table"
+    if labels / len(lines) > 0.2:
+        return "labels"
+    return "prose"
+
+def _tokens(text: str) -> set:
+    return set(_TOKEN_RE.findall((text or "").lower()))
+
+def _jaccard(a: set, b: set) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+# ==== 저장소 =================================================================
+class ExampleStore:
+    """few-shot 예시 저장소 (JSONL 파일 + 기본 예시)"""
+    def __init__(self, path: str = FEWSHOT_STORE, builtins: Optional[List[Dict[str, Any]]] = None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._mtime: Optional[float] = None
+        self._examples: List[Dict[str, Any]] = []
+        self._builtins = [self._prepare(dict(e)) for e in (BUILTIN_EXAMPLES if builtins is None else builtins)]
+
+    @staticmethod
+    def _prepare(ex: Dict[str, Any]) -> Dict[str, Any]:
+        ex["markdown"] = (ex.get("markdown") or "")[:FEWSHOT_EXCERPT_CHARS]
+        ex.setdefault("domain", domain_of(ex.get("source_url", "")))
+        ex.setdefault("shape", page_shape(ex["markdown"]))
+        ex["_tokens"] = _tokens(ex["markdown"])
+        return ex
+
+    def _load(self):
+        """파일이 바뀌었을 때만 다시 읽음"""
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            self._examples, self._mtime = [], None
+            return
+        if mtime == self._mtime:
+            return
+        examples = []
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    examples.append(self._prepare(json.loads(line)))
+                except Exception as e:
+                    print(f"[fewshot] 잘못된 예시 줄 건너뜀: {e}")
+        self._examples, self._mtime = examples, mtime
+
+    def examples(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            self._load()
+            return self._examples + self._builtins
+
+    def add(self, source_url: str, markdown: str, record: Dict[str, Any]) -> Dict[str, Any]:
+        """검증된 (URL, 마크다운, 레코드) 추가"""
+        ex = {
+            "domain": domain_of(source_url),
+            "source_url": source_url,
+            "shape": page_shape(markdown),
+            "markdown": (markdown or "")[:FEWSHOT_EXCERPT_CHARS],
+            "record": record,
+        }
+        with self._lock:
+            d = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(d, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(ex, ensure_ascii=False) + "\n")
+        return ex
+
+    def select(self, text: str, source_url: str = "", k: int = FEWSHOT_K) -> List[Tuple[float, Dict[str, Any]]]:
+        """입력 페이지와 가장 비슷한 예시 k개 (점수 = 토큰 Jaccard + 도메인/형태 일치 가산점)"""
+        domain = domain_of(source_url)
+        shape = page_shape(text)
+        toks = _tokens((text or "")[:FEWSHOT_EXCERPT_CHARS * 4])
+        scored = []
+        for ex in self.examples():
+            s = _jaccard(toks, ex["_tokens"])
+            if domain and ex.get("domain") == domain:
+                s += DOMAIN_BONUS
+            if ex.get("shape") == shape:
+                s += SHAPE_BONUS
+            scored.append((s, ex))
+        scored.sort(key=lambda t: -t[0])
+        return scored[:max(0, k)]
+
+STORE = ExampleStore()
+
+def build_fewshot(text: str, source_url: str = "", k: int = FEWSHOT_K) -> Tuple[List[str], List[str]]:
+    """extract_from_text용 (before_user_prompt, before_assis_prompt) 생성"""
+    users, assists = [], []
+    for i, (score, ex) in enumerate(STORE.select(text, source_url, k), 1):
+        users.append(f"[예시 {i}]\n[입력 발췌]\n{ex['markdown']}")
+        assists.append(json.dumps(ex["record"], ensure_ascii=False))
+        print(f"[fewshot] 예시 {i}: domain={ex.get('domain') or '-'} shape={ex.get('shape')} score={score:.2f}")
+    return users, assists
+
+# ==== CLI ====================================================================
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="few-shot 예시 저장소 관리")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p_add = sub.add_parser("add", help="검증된 예시 추가")
+    p_add.add_argument("--url", required=True, help="원본 페이지 URL")
+    p_add.add_argument("--markdown", required=True, help="크롤링한 마크다운 파일")
+    p_add.add_argument("--record", required=True, help="검증된 레코드 JSON (outputs/extract_*.json 또는 키/값 dict)")
+    sub.add_parser("list", help="저장된 예시 목록")
+    args = ap.parse_args(argv)
+
+    if args.cmd == "add":
+        with open(args.markdown, "r", encoding="utf-8") as f:
+            markdown = f.read()
+        with open(args.record, "r", encoding="utf-8") as f:
+            rec = json.load(f)
+        rec = rec.get("data", rec) if isinstance(rec, dict) else rec
+        ex = STORE.add(args.url, markdown, rec)
+        print(f"추가됨: domain={ex['domain']} shape={ex['shape']} → {STORE.path}")
+    else:
+        for ex in STORE.examples():
+            name = ex["record"].get("전시회 국문명") or ex["record"].get("영문명(Full Name)", "")
+            print(f"{ex.get('domain') or '-':<10} {ex.get('shape'):<7} {name}  {ex.get('source_url', '')}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,518 @@
+# gazetteer.py
+# -*- coding: utf-8 -*-
+"""
+국가/도시/전시장 지명 사전 (Aho-Corasick)
+
+국문/영문 지명과 동의어(대한민국/한국/KR → South Korea 등, prompt.md 규칙)를 하나의 오토마톤으로 컴파일해
+텍스트를 한 번만 훑어 모든 지명을 찾는다. 목록을 돌며 `in`으로 하나씩 찾던 방식을 대체.
+- 영문 지명은 단어 경계에서, 표기 그대로(또는 전부 대문자)일 때만 (a nice day ↔ Nice, nicely ↔ Nice 구분)
+- 흔한 단어/인명과 겹치는 지명(AMBIGUOUS_NAMES)은 대소문자까지 같고 같은 나라 지명이 함께 나올 때만,
+  국가 코드(KR, USA 등)는 대소문자까지 같을 때만, US는 바로 옆에 미국 도시/전시장이 있을 때만 (CONTACT US 구분)
+- 한글 지명은 앞 글자가 한글이 아닐 때만 (니스 ↔ 비즈니스 구분, 뒤에 붙는 조사/시·도는 허용)
+- 흔한 한국어 단어와 겹치는 지명(AMBIGUOUS_KO_NAMES: 스마트공장 대전, 고양이)은 뒤에 시/광역시가 붙거나
+  같은 나라 지명이 함께 나올 때만
+- 겹치면 먼저 시작하는 것 → 긴 것 우선
+- GAZETTEER_EXTRA(JSON)로 항목 추가: {"countries": {...}, "cities": {...}, "venues": {...}} (아래 표와 같은 형식)
+
+    python gazetteer.py "2025 독일 뮌헨 바우마, Messe München"
+"""
+import os
+import sys
+import json
+import threading
+from collections import Counter, deque
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+# ==== 설정 ===================================================================
+GAZETTEER_EXTRA = os.getenv("GAZETTEER_EXTRA", "")
+
+# 흔한 영어 단어/인명과 겹치는 지명: 대소문자 그대로 + 같은 나라 지명(국가/도시/전시장)이 함께 나올 때만 사용
+AMBIGUOUS_NAMES = {"Nice", "Phoenix", "Austin", "Leeds", "Sydney", "Orlando", "Dallas", "Boston", "Holland"}
+# 일반 문장에도 나오는 국가 코드 (CONTACT US 등): WEAK_CODE_WINDOW자 안에 같은 나라 도시/전시장이 있을 때만 사용
+WEAK_CODES = {"US"}
+WEAK_CODE_WINDOW = 30
+# 흔한 한국어 단어와 겹치는 지명 (대전=큰 전시회, 고양이): 뒤에 KO_CITY_SUFFIXES가 붙거나 같은 나라 지명이 함께 나올 때만
+AMBIGUOUS_KO_NAMES = {"대전", "고양"}
+KO_CITY_SUFFIXES = ("광역시", "특례시", "시")
+
+# 국가: 영문 표준명 → (국문명, 동의어, 대소문자 일치 코드)
+COUNTRIES: Dict[str, Tuple[str, List[str], List[str]]] = {
+    "South Korea": ("대한민국", ["한국", "Korea", "Republic of Korea", "S. Korea"], ["KR", "KOR", "ROK"]),
+    "United States": ("미국", ["USA", "U.S.A.", "U.S.", "United States of America"], ["US"]),
+    "Germany": ("독일", ["Deutschland"], []),
+    "France": ("프랑스", [], []),
+    "United Kingdom": ("영국", ["Great Britain", "England"], ["UK"]),
+    "Japan": ("일본", [], []),
+    "China": ("중국", ["PR China", "People's Republic of China"], ["PRC"]),
+    "Italy": ("이탈리아", ["Italia"], []),
+    "Spain": ("스페인", ["España"], []),
+    "Netherlands": ("네덜란드", ["The Netherlands", "Holland"], []),
+    "Belgium": ("벨기에", [], []),
+    "Switzerland": ("스위스", [], []),
+    "Austria": ("오스트리아", [], []),
+    "Sweden": ("스웨덴", [], []),
+    "Poland": ("폴란드", [], []),
+    "Czech Republic": ("체코", ["Czechia"], []),
+    "Russia": ("러시아", ["Russian Federation"], []),
+    "Turkey": ("튀르키예", ["Türkiye", "터키"], []),
+    "United Arab Emirates": ("아랍에미리트", ["UAE", "U.A.E."], []),
+    "Saudi Arabia": ("사우디아라비아", ["사우디"], []),
+    "India": ("인도", [], []),
+    "Singapore": ("싱가포르", [], []),
+    "Vietnam": ("베트남", ["Viet Nam"], []),
+    "Thailand": ("태국", [], []),
+    "Indonesia": ("인도네시아", [], []),
+    "Malaysia": ("말레이시아", [], []),
+    "Philippines": ("필리핀", [], []),
+    "Taiwan": ("대만", [], []),
+    "Hong Kong": ("홍콩", [], []),
+    "Canada": ("캐나다", [], []),
+    "Mexico": ("멕시코", [], []),
+    "Brazil": ("브라질", ["Brasil"], []),
+    "Australia": ("호주", ["오스트레일리아"], []),
+}
+
+# 도시: 영문 표준명 → (국문명, 국가, 동의어)
+CITIES: Dict[str, Tuple[str, str, List[str]]] = {
+    "Seoul": ("서울", "South Korea", []),
+    "Busan": ("부산", "South Korea", []),
+    "Incheon": ("인천", "South Korea", []),
+    "Daegu": ("대구", "South Korea", []),
+    "Daejeon": ("대전", "South Korea", []),
+    "Gwangju": ("광주", "South Korea", []),
+    "Ulsan": ("울산", "South Korea", []),
+    "Suwon": ("수원", "South Korea", []),
+    "Goyang": ("고양", "South Korea", ["Ilsan", "일산"]),
+    "Changwon": ("창원", "South Korea", []),
+    "Jeju": ("제주", "South Korea", []),
+    "New York": ("뉴욕", "United States", []),
+    "Los Angeles": ("로스앤젤레스", "United States", []),
+    "Chicago": ("시카고", "United States", []),
+    "Houston": ("휴스턴", "United States", []),
+    "Phoenix": ("피닉스", "United States", []),
+    "Philadelphia": ("필라델피아", "United States", []),
+    "San Antonio": ("샌안토니오", "United States", []),
+    "San Diego": ("샌디에이고", "United States", []),
+    "Dallas": ("댈러스", "United States", []),
+    "San Jose": ("산호세", "United States", []),
+    "Austin": ("오스틴", "United States", []),
+    "Jacksonville": ("잭슨빌", "United States", []),
+    "Las Vegas": ("라스베이거스", "United States", ["라스베가스"]),
+    "Orlando": ("올랜도", "United States", []),
+    "Atlanta": ("애틀랜타", "United States", []),
+    "San Francisco": ("샌프란시스코", "United States", []),
+    "Boston": ("보스턴", "United States", []),
+    "Frankfurt": ("프랑크푸르트", "Germany", ["Frankfurt am Main"]),
+    "Munich": ("뮌헨", "Germany", ["München", "Muenchen"]),
+    "Berlin": ("베를린", "Germany", []),
+    "Hamburg": ("함부르크", "Germany", []),
+    "Cologne": ("쾰른", "Germany", ["Köln", "Koeln"]),
+    "Düsseldorf": ("뒤셀도르프", "Germany", ["Dusseldorf", "Duesseldorf"]),
+    "Hannover": ("하노버", "Germany", ["Hanover"]),
+    "Nuremberg": ("뉘른베르크", "Germany", ["Nürnberg", "Nuernberg"]),
+    "Stuttgart": ("슈투트가르트", "Germany", []),
+    "Leipzig": ("라이프치히", "Germany", []),
+    "Paris": ("파리", "France", []),
+    "Lyon": ("리옹", "France", []),
+    "Marseille": ("마르세유", "France", []),
+    "Toulouse": ("툴루즈", "France", []),
+    "Nice": ("니스", "France", []),
+    "Nantes": ("낭트", "France", []),
+    "London": ("런던", "United Kingdom", []),
+    "Birmingham": ("버밍엄", "United Kingdom", []),
+    "Manchester": ("맨체스터", "United Kingdom", []),
+    "Glasgow": ("글래스고", "United Kingdom", []),
+    "Liverpool": ("리버풀", "United Kingdom", []),
+    "Leeds": ("리즈", "United Kingdom", []),
+    "Tokyo": ("도쿄", "Japan", ["동경"]),
+    "Osaka": ("오사카", "Japan", []),
+    "Nagoya": ("나고야", "Japan", []),
+    "Sapporo": ("삿포로", "Japan", []),
+    "Kobe": ("고베", "Japan", []),
+    "Kyoto": ("교토", "Japan", []),
+    "Yokohama": ("요코하마", "Japan", []),
+    "Chiba": ("지바", "Japan", ["치바"]),
+    "Shanghai": ("상하이", "China", ["상해"]),
+    "Beijing": ("베이징", "China", ["북경"]),
+    "Guangzhou": ("광저우", "China", []),
+    "Shenzhen": ("심천", "China", []),
+    "Milan": ("밀라노", "Italy", ["Milano"]),
+    "Bologna": ("볼로냐", "Italy", []),
+    "Barcelona": ("바르셀로나", "Spain", []),
+    "Madrid": ("마드리드", "Spain", []),
+    "Amsterdam": ("암스테르담", "Netherlands", []),
+    "Vienna": ("비엔나", "Austria", ["Wien"]),
+    "Basel": ("바젤", "Switzerland", []),
+    "Warsaw": ("바르샤바", "Poland", []),
+    "Moscow": ("모스크바", "Russia", []),
+    "Istanbul": ("이스탄불", "Turkey", []),
+    "Dubai": ("두바이", "United Arab Emirates", []),
+    "Riyadh": ("리야드", "Saudi Arabia", []),
+    "New Delhi": ("뉴델리", "India", []),
+    "Mumbai": ("뭄바이", "India", []),
+    "Singapore": ("싱가포르", "Singapore", []),
+    "Ho Chi Minh City": ("호찌민", "Vietnam", ["호치민", "Ho Chi Minh"]),
+    "Hanoi": ("하노이", "Vietnam", []),
+    "Bangkok": ("방콕", "Thailand", []),
+    "Jakarta": ("자카르타", "Indonesia", []),
+    "Kuala Lumpur": ("쿠알라룸푸르", "Malaysia", []),
+    "Taipei": ("타이베이", "Taiwan", []),
+    "Toronto": ("토론토", "Canada", []),
+    "Mexico City": ("멕시코시티", "Mexico", []),
+    "São Paulo": ("상파울루", "Brazil", ["Sao Paulo"]),
+    "Sydney": ("시드니", "Australia", []),
+    "Melbourne": ("멜버른", "Australia", []),
+}
+
+# 전시장: 영문명 → (국문명, 도시, 동의어)
+VENUES: Dict[str, Tuple[str, str, List[str]]] = {
+    "COEX": ("코엑스", "Seoul", []),
+    "aT Center": ("aT센터", "Seoul", []),
+    "SETEC": ("세텍", "Seoul", []),
+    "KINTEX": ("킨텍스", "Goyang", []),
+    "BEXCO": ("벡스코", "Busan", []),
+    "EXCO": ("엑스코", "Daegu", []),
+    "Songdo Convensia": ("송도컨벤시아", "Incheon", []),
+    "Daejeon Convention Center": ("대전컨벤션센터", "Daejeon", []),
+    "Kimdaejung Convention Center": ("김대중컨벤션센터", "Gwangju", []),
+    "Changwon Exhibition Convention Center": ("창원컨벤션센터", "Changwon", ["CECO"]),
+    "Las Vegas Convention Center": ("라스베이거스 컨벤션 센터", "Las Vegas", ["LVCC", "라스베가스 컨벤션 센터"]),
+    "McCormick Place": ("맥코믹 플레이스", "Chicago", []),
+    "Javits Center": ("재비츠 센터", "New York", ["Jacob K. Javits Convention Center"]),
+    "Orange County Convention Center": ("오렌지카운티 컨벤션 센터", "Orlando", []),
+    "Messe Frankfurt": ("메세 프랑크푸르트", "Frankfurt", []),
+    "Messe München": ("메세 뮌헨", "Munich", ["Messe Muenchen", "Messe Munich", "Trade Fair Center Messe München"]),
+    "Messe Düsseldorf": ("메세 뒤셀도르프", "Düsseldorf", ["Messe Duesseldorf", "Messe Dusseldorf"]),
+    "Koelnmesse": ("쾰른메쎄", "Cologne", ["Kölnmesse", "쾰른 메세"]),
+    "Messe Berlin": ("메세 베를린", "Berlin", []),
+    "Deutsche Messe": ("하노버 전시장", "Hannover", ["Hannover Exhibition Grounds"]),
+    "NürnbergMesse": ("뉘른베르크 메세", "Nuremberg", ["NuernbergMesse", "Exhibition Centre Nuremberg"]),
+    "Messe Stuttgart": ("메세 슈투트가르트", "Stuttgart", []),
+    "Paris Nord Villepinte": ("파리 노르 빌팽트 전시센터", "Paris", ["Parc des Expositions de Paris-Nord Villepinte",
+                                                               "Paris-Nord Villepinte"]),
+    "Paris Expo Porte de Versailles": ("파리 포르트 드 베르사유 전시장", "Paris", ["Porte de Versailles"]),
+    "ExCeL London": ("엑셀 런던", "London", []),
+    "NEC Birmingham": ("버밍엄 NEC", "Birmingham", ["National Exhibition Centre"]),
+    "Tokyo Big Sight": ("도쿄 빅사이트", "Tokyo", []),
+    "Makuhari Messe": ("마쿠하리 메세", "Chiba", []),
+    "INTEX Osaka": ("인텍스 오사카", "Osaka", []),
+    "Shanghai New International Expo Centre": ("상하이 신국제엑스포센터", "Shanghai", ["SNIEC"]),
+    "Fiera Milano": ("피에라 밀라노", "Milan", []),
+    "Fira Barcelona": ("피라 바르셀로나", "Barcelona", []),
+    "IFEMA": ("이페마", "Madrid", []),
+    "RAI Amsterdam": ("라이 암스테르담", "Amsterdam", []),
+    "Dubai World Trade Centre": ("두바이 월드 트레이드 센터", "Dubai", ["DWTC", "Dubai World Trade Center"]),
+    "Marina Bay Sands": ("마리나 베이 샌즈", "Singapore", ["Sands Expo"]),
+    "Singapore Expo": ("싱가포르 엑스포", "Singapore", []),
+    "IMPACT Exhibition Center": ("임팩트 전시장", "Bangkok", ["IMPACT Muang Thong Thani"]),
+    "BITEC": ("바이텍", "Bangkok", []),
+}
+
+# ==== Aho-Corasick ===========================================================
+class Automaton:
+    """문자열 여러 개를 한 번에 찾는 Aho-Corasick 오토마톤 (소문자 기준)"""
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        self.patterns: List[str] = []
+
+    def add(self, pattern: str) -> int:
+        """패턴 추가 → 패턴 번호 (build 전에만)"""
+        s = 0
+        for ch in pattern.lower():
+            nxt = self._goto[s].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[s][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            s = nxt
+        self._out[s].append(len(self.patterns))
+        self.patterns.append(pattern)
+        return len(self.patterns) - 1
+
+    def build(self) -> "Automaton":
+        """실패 링크 계산 (BFS), 출력은 실패 링크 쪽 출력까지 합쳐 둠"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            s = queue.popleft()
+            for ch, nxt in self._goto[s].items():
+                queue.append(nxt)
+                f = self._fail[s]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+        return self
+
+    def iter(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """(시작, 끝, 패턴 번호) — 겹치는 것까지 모두"""
+        low = text.lower()
+        if len(low) != len(text):   # 소문자 변환으로 길이가 바뀌는 문자(İ 등)는 그대로 둠
+            low = "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+        goto, fail, out, lens = self._goto, self._fail, self._out, [len(p) for p in self.patterns]
+        s = 0
+        for i, ch in enumerate(low):
+            while s and ch not in goto[s]:
+                s = fail[s]
+            s = goto[s].get(ch, 0)
+            for pid in out[s]:
+                yield i + 1 - lens[pid], i + 1, pid
+
+# ==== 지명 사전 ==============================================================
+class Place(NamedTuple):
+    kind: str       # "country" / "city" / "venue"
+    en: str         # 영문 표준명
+    ko: str         # 국문명
+    city: str       # 도시 (venue), 도시 자신 (city), "" (country)
+    country: str    # 국가 (영문 표준명)
+
+class Hit(NamedTuple):
+    place: Place
+    start: int
+    end: int
+    surface: str    # 텍스트에 나온 그대로
+    weak: bool = False   # 다른 지명으로 뒷받침돼야 하는 표기 (AMBIGUOUS_NAMES / WEAK_CODES)
+
+def _is_hangul(ch: str) -> bool:
+    return "가" <= ch <= "힣"
+
+def _case_ok(surface: str, pattern: str, rule: str, boundaries: bool = True) -> bool:
+    if rule == "any":
+        return True
+    if not boundaries:
+        return rule == "cased"
+    if rule == "exact":
+        return surface == pattern
+    return surface == pattern or surface == pattern.upper()
+
+class Gazetteer:
+    """국가/도시/전시장 지명 사전 (처음 사용할 때 컴파일)"""
+
+    def __init__(self, extra_path: str = GAZETTEER_EXTRA):
+        self.extra_path = extra_path
+        self._lock = threading.Lock()
+        self._ac: Optional[Automaton] = None
+        self._targets: List[List[Tuple[Place, str, bool, str]]] = []   # 패턴 번호 → [(지명, 대소문자 규칙, weak, 표기)]
+        self.places: Dict[Tuple[str, str], Place] = {}
+
+    # ---------- 컴파일 ----------
+    def _tables(self):
+        countries, cities, venues = dict(COUNTRIES), dict(CITIES), dict(VENUES)
+        if self.extra_path:
+            try:
+                with open(self.extra_path, "r", encoding="utf-8") as f:
+                    extra = json.load(f)
+                countries.update({k: tuple(v) for k, v in extra.get("countries", {}).items()})
+                cities.update({k: tuple(v) for k, v in extra.get("cities", {}).items()})
+                venues.update({k: tuple(v) for k, v in extra.get("venues", {}).items()})
+            except Exception as e:
+                print(f"[gazetteer] 추가 지명 읽기 실패 ({self.extra_path}): {e}")
+        return countries, cities, venues
+
+    def _compile(self):
+        ac = Automaton()
+        pids: Dict[str, int] = {}
+        targets: List[List[Tuple[Place, str, bool, str]]] = []
+
+        def _add(surface: str, place: Place, code: bool = False):
+            """
+            대소문자 규칙: any(국문) / cased(표기 그대로 또는 전부 대문자) / exact(표기 그대로, 코드·AMBIGUOUS_NAMES)
+            """
+            surface = " ".join(surface.split())
+            hangul = any(_is_hangul(c) for c in surface)
+            weak = surface in WEAK_CODES if code else (surface in AMBIGUOUS_NAMES or surface in AMBIGUOUS_KO_NAMES)
+            rule = "any" if hangul else ("exact" if code or weak else "cased")
+            variants = {surface}
+            if " " in surface and hangul:
+                variants.add(surface.replace(" ", ""))   # 국문 띄어쓰기 변형
+            for v in variants:
+                key = v.lower()
+                if key not in pids:
+                    pids[key] = ac.add(v)
+                    targets.append([])
+                targets[pids[key]].append((place, rule, weak, v))
+
+        countries, cities, venues = self._tables()
+        for en, (ko, aliases, codes) in countries.items():
+            p = self.places[("country", en)] = Place("country", en, ko, "", en)
+            for s in [en, ko, *aliases]:
+                _add(s, p)
+            for code in codes:
+                _add(code, p, code=True)
+        for en, (ko, country, aliases) in cities.items():
+            p = self.places[("city", en)] = Place("city", en, ko, en, country)
+            for s in [en, ko, *aliases]:
+                _add(s, p)
+        for en, (ko, city, aliases) in venues.items():
+            country = cities.get(city, ("", ""))[1]
+            p = self.places[("venue", en)] = Place("venue", en, ko, city, country)
+            for s in [en, ko, *aliases]:
+                _add(s, p)
+        self._ac, self._targets = ac.build(), targets
+
+    def _automaton(self) -> Automaton:
+        if self._ac is None:
+            with self._lock:
+                if self._ac is None:
+                    self._compile()
+        return self._ac
+
+    # ---------- 검색 ----------
+    def find(self, text: str, boundaries: bool = True) -> List[Hit]:
+        """
+        텍스트의 지명 (겹치면 먼저 시작하는 것 → 긴 것, 텍스트 순서)
+        boundaries=False면 단어 경계/대소문자를 보지 않음 (URL처럼 소문자로 붙어 있는 텍스트용: seoulfair.kr → Seoul,
+        대소문자로만 구분되는 코드/AMBIGUOUS_NAMES는 사용 안 함)
+        다른 지명으로 뒷받침되지 않는 weak 표기는 뺌 (AMBIGUOUS_KO_NAMES는 뒤에 시/광역시가 붙으면 weak 아님)
+        """
+        if not text:
+            return []
+        ac = self._automaton()
+        spans = []
+        for start, end, pid in ac.iter(text):
+            surface = text[start:end]
+            first, last = surface[0], surface[-1]
+            before = text[start - 1] if start > 0 else ""
+            after = text[end] if end < len(text) else ""
+            if boundaries:
+                if _is_hangul(first):
+                    if before and _is_hangul(before):
+                        continue
+                elif first.isalnum() and before.isalnum():
+                    continue
+                if not _is_hangul(last) and last.isalnum() and after.isalnum() and not _is_hangul(after):
+                    continue
+            suffixed = text.startswith(KO_CITY_SUFFIXES, end)   # 대전광역시 / 고양시
+            places = [(p, weak and not (rule == "any" and suffixed)) for p, rule, weak, pattern in self._targets[pid]
+                      if _case_ok(surface, pattern, rule, boundaries)]
+            if places:
+                spans.append((start, -end, places, surface))
+
+        hits, pos = [], 0
+        for start, neg_end, places, surface in sorted(spans, key=lambda x: (x[0], x[1])):
+            if start < pos:
+                continue
+            hits.extend(Hit(p, start, -neg_end, surface, weak) for p, weak in places)
+            pos = -neg_end
+
+        strong = [h for h in hits if not h.weak]
+
+        def _supported(h: Hit) -> bool:
+            if not h.weak:
+                return True
+            if h.place.kind == "country":   # 약한 코드: 바로 옆에 같은 나라 도시/전시장
+                return any(s.place.kind != "country" and s.place.country == h.place.country
+                           and max(s.start - h.end, h.start - s.end) <= WEAK_CODE_WINDOW for s in strong)
+            return any(s.place.country == h.place.country for s in strong)
+
+        return [h for h in hits if _supported(h)]
+
+    def lookup(self, name: str, kind: Optional[str] = None) -> Optional[Place]:
+        """이름 전체가 지명 하나(동의어 포함)이면 그 지명"""
+        name = " ".join(str(name or "").split())
+        for h in self.find(name):
+            if h.start == 0 and h.end == len(name) and (kind is None or h.place.kind == kind):
+                return h.place
+        return None
+
+    def recognize(self, text: str, boundaries: bool = True) -> Dict[str, str]:
+        """
+        텍스트 → {"국가", "도시", "개최장소(국문)", "개최장소(영어)"} (영문 표준명, 못 찾으면 "")
+        가장 많이 나온 전시장 → 그 도시/국가, 전시장이 없으면 가장 많이 나온 도시(국가가 함께 나온 쪽 우선) → 국가
+        """
+        return self._resolve(self.find(text, boundaries))
+
+    def _resolve(self, hits: List[Hit], strict: bool = False) -> Dict[str, str]:
+        """strict=True면 종류별로 서로 다른 지명이 하나뿐일 때만 사용"""
+        by_kind: Dict[str, Counter] = {"country": Counter(), "city": Counter(), "venue": Counter()}
+        for h in hits:
+            by_kind[h.place.kind][h.place] += 1
+
+        def _pick(kind: str, prefer=None) -> Optional[Place]:
+            cnt = by_kind[kind]
+            if not cnt or (strict and len(cnt) > 1):
+                return None
+            order = list(cnt)   # 처음 나온 순서
+            return max(order, key=lambda p: (prefer(p) if prefer else 0, cnt[p], -order.index(p)))
+
+        out = {"국가": "", "도시": "", "개최장소(국문)": "", "개최장소(영어)": ""}
+        venue = _pick("venue")
+        if venue is not None:
+            out.update({"개최장소(국문)": venue.ko, "개최장소(영어)": venue.en, "도시": venue.city, "국가": venue.country})
+            return out
+        countries = {p.en for p in by_kind["country"]}
+        city = _pick("city", prefer=lambda p: p.country in countries)
+        if city is not None:
+            out.update({"도시": city.en, "국가": city.country})
+            return out
+        country = _pick("country")
+        if country is not None:
+            out["국가"] = country.en
+        return out
+
+    def canonical_names(self, text: str) -> set:
+        """텍스트에 나온 지명의 영문 표준명 (전시장은 도시/국가까지)"""
+        names = set()
+        for h in self.find(text):
+            names.update(n for n in (h.place.en, h.place.city, h.place.country) if n)
+        return names
+
+GAZETTEER = Gazetteer()
+
+# ==== 레코드 채우기 ==========================================================
+LOCATION_KEYS = ("국가", "도시", "개최장소(국문)", "개최장소(영어)")
+# 주최기관은 제외 (Messe Frankfurt 등 주최사가 다른 나라 전시도 주최)
+_RECORD_FIELDS = ("개최장소(국문)", "개최장소(영어)", "도시", "국가", "전시회 국문명", "영문명(Full Name)")
+
+def city_in(text: str, boundaries: bool = True) -> str:
+    """텍스트의 도시 (영문 표준명, 없으면 "")"""
+    return GAZETTEER.recognize(text, boundaries)["도시"]
+
+def country_in(text: str, boundaries: bool = True) -> str:
+    """텍스트의 국가 (영문 표준명, 없으면 "")"""
+    return GAZETTEER.recognize(text, boundaries)["국가"]
+
+def fill_location(rec: Dict[str, Any], text: str = "", gazetteer: Gazetteer = GAZETTEER) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    빈 국가/도시/개최장소를 지명 사전으로 채움 → (레코드, 채운 키 목록)
+    - 국가가 동의어(대한민국/한국/KR 등)면 영문 표준명으로 바꿈
+    - 레코드의 장소/이름 필드에서 먼저 찾고, 그래도 비면 원문(text)에서 지명이 하나뿐일 때만 사용
+    - 이미 있는 값은 덮어쓰지 않고, 국가와 어긋나는 도시/전시장은 쓰지 않음
+    """
+    out, filled = dict(rec), []
+    country = str(out.get("국가") or "").strip()
+    if country:
+        p = gazetteer.lookup(country, "country")
+        if p is not None and p.en != country:
+            out["국가"] = p.en
+            filled.append("국가")
+
+    def _apply(found: Dict[str, str]):
+        cur = str(out.get("국가") or "").strip()
+        if cur and found["국가"] and found["국가"] != cur:
+            return
+        for k in LOCATION_KEYS:
+            if found[k] and not str(out.get(k) or "").strip():
+                out[k] = found[k]
+                filled.append(k)
+
+    hits = gazetteer.find(" | ".join(str(out.get(k) or "") for k in _RECORD_FIELDS))
+    _apply(gazetteer._resolve(hits))
+    if text and any(not str(out.get(k) or "").strip() for k in LOCATION_KEYS):
+        _apply(gazetteer._resolve(gazetteer.find(text), strict=True))
+    return out, filled
+
+# ==== CLI ====================================================================
+def main(argv: Optional[List[str]] = None) -> int:
+    text = " ".join(argv if argv is not None else sys.argv[1:]) or sys.stdin.read()
+    for h in GAZETTEER.find(text):
+        print(f"{h.start:>5}-{h.end:<5} {h.place.kind:<8} {h.surface} → {h.place.en} ({h.place.ko})")
+    print(json.dumps(GAZETTEER.recognize(text), ensure_ascii=False))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
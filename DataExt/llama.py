@@ -2,13 +2,63 @@
 import os
 import re
 import json
+import time
+import random
+import threading
+import concurrent.futures
+from collections import deque
 import requests
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
+from urllib.parse import urlsplit
+
+from fewshot import build_fewshot
+from bilingual import NAMES
+from gazetteer import fill_location
+import dates
 
 # ==== 런타임 설정 (환경변수로 덮어쓰기 가능) ===============================
-OLLAMA_URL = "http://127.0.0.1:11434/api/generate"
+# 여러 Ollama 서버를 쓰려면 OLLAMA_URLS="http://host1:11434,http://host2:11434"
+OLLAMA_URLS = [u.strip().rstrip("/") for u in os.getenv("OLLAMA_URLS", "http://127.0.0.1:11434").split(",") if u.strip()]
+OLLAMA_URL = OLLAMA_URLS[0] + "/api/generate"
+OLLAMA_RETRIES = int(os.getenv("OLLAMA_RETRIES", "2"))            # 다른 백엔드로 재시도 횟수
+OLLAMA_EJECT_SEC = float(os.getenv("OLLAMA_EJECT_SEC", "30"))      # 실패한 백엔드 제외 시간
+OLLAMA_HEALTH_TIMEOUT = float(os.getenv("OLLAMA_HEALTH_TIMEOUT", "3"))
+OLLAMA_BACKOFF_BASE = float(os.getenv("OLLAMA_BACKOFF_BASE", "0.5"))  # 재시도 대기 = base × 2^n × (0.5~1.5)
+OLLAMA_BACKOFF_MAX = float(os.getenv("OLLAMA_BACKOFF_MAX", "8"))
+# 헤징: 응답이 최근 p95 지연을 넘기면 다른 백엔드에 같은 요청을 한 번 더 보내고 먼저 온 결과 사용
+OLLAMA_HEDGE = os.getenv("OLLAMA_HEDGE", "1") != "0"
+OLLAMA_HEDGE_MIN_SAMPLES = int(os.getenv("OLLAMA_HEDGE_MIN_SAMPLES", "20"))
+OLLAMA_HEDGE_MIN_SEC = float(os.getenv("OLLAMA_HEDGE_MIN_SEC", "5"))
+# 서킷 브레이커: 연속 실패가 THRESHOLD번이면 COOLDOWN 동안 바로 실패, 이후 1건만 시험 통과
+OLLAMA_BREAKER_THRESHOLD = int(os.getenv("OLLAMA_BREAKER_THRESHOLD", "5"))
+OLLAMA_BREAKER_COOLDOWN = float(os.getenv("OLLAMA_BREAKER_COOLDOWN", "30"))
+# LLM 동시 요청 수 자동 조절 (AIMD)
+LLM_LIMIT_INITIAL = float(os.getenv("LLM_LIMIT_INITIAL", "2"))
+LLM_LIMIT_MIN = float(os.getenv("LLM_LIMIT_MIN", "1"))
+LLM_LIMIT_MAX = float(os.getenv("LLM_LIMIT_MAX", str(4 * len(OLLAMA_URLS))))
+LLM_LATENCY_TOLERANCE = float(os.getenv("LLM_LATENCY_TOLERANCE", "2.0"))  # 기준 지연의 몇 배부터 과부하로 볼지
+LLM_BACKOFF = float(os.getenv("LLM_BACKOFF", "0.7"))                      # 과부하/오류 시 limit 곱셈 감소율
+# LLM 작업 우선순위: interactive(UI 클릭) > batch(일괄 추출) > background(재추출/갱신)
+PRIORITY_INTERACTIVE, PRIORITY_BATCH, PRIORITY_BACKGROUND = "interactive", "batch", "background"
+PRIORITY_RANK = {PRIORITY_INTERACTIVE: 0, PRIORITY_BATCH: 1, PRIORITY_BACKGROUND: 2}
+# 클래스별 최대 동시 실행 = limit × 비율 (최소 1) → batch/background가 자리를 다 차지하지 못하게 함
+PRIORITY_SHARE = {
+    PRIORITY_INTERACTIVE: 1.0,
+    PRIORITY_BATCH: float(os.getenv("LLM_BATCH_SHARE", "0.75")),
+    PRIORITY_BACKGROUND: float(os.getenv("LLM_BACKGROUND_SHARE", "0.5")),
+}
+LLM_AGING_SEC = float(os.getenv("LLM_AGING_SEC", "120"))  # 이만큼 기다리면 우선순위 한 단계 상승 (기아 방지)
+LLM_DEFAULT_PRIORITY = os.getenv("LLM_DEFAULT_PRIORITY", PRIORITY_BATCH)
 MODEL = os.getenv("LLM_MODEL", "llama3.2")
+# 2단계 캐스케이드: FAST_MODEL이 설정되면 먼저 빠른 모델로 추출하고, 품질 검사에 떨어진 페이지만 MODEL로 재추출
+FAST_MODEL = os.getenv("FAST_MODEL", "")
+CASCADE_MIN_COMPLETENESS = float(os.getenv("CASCADE_MIN_COMPLETENESS", "0.5"))  # 채워진 키 비율 하한
+# 빈 키만 다시 묻는 부분 추출 (빈 키 수가 FILL_MAX_KEYS 이하일 때만, 0이면 끔)
+FILL_MAX_KEYS = int(os.getenv("FILL_MAX_KEYS", "8"))
+FILL_CONTEXT_CHARS = int(os.getenv("FILL_CONTEXT_CHARS", "4000"))  # 부분 추출에 넘길 본문 길이
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "2h")  # 모델을 메모리에 유지할 시간 (워밍업/요청 공통)
+TELEMETRY_WINDOW = int(os.getenv("TELEMETRY_WINDOW", "200"))  # p50/p95 계산에 쓰는 최근 요청 수
 NUM_CTX = int(os.getenv("NUM_CTX", "10000"))        
 TEMPERATURE = float(os.getenv("TEMPERATURE", "0.2")) 
 TIMEOUT = int(os.getenv("OLLAMA_TIMEOUT", "500"))    
@@ -25,10 +75,22 @@ KEYS = [
 ]
 
 # ==== 유틸 ==================================================================
+_PROMPT_CACHE: Dict[str, tuple] = {}   # path -> (mtime, text)
+
+def read_prompt_file(path: str) -> str:
+    """프롬프트 파일 읽기 (수정 시각이 같으면 메모리 캐시 사용, 없으면 FileNotFoundError)"""
+    mtime = os.path.getmtime(path)
+    cached = _PROMPT_CACHE.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    _PROMPT_CACHE[path] = (mtime, text)
+    return text
+
 def load_prompt_md(path: str = PROMPT_MD) -> str:
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return f.read()
+        return read_prompt_file(path)
     except Exception:
         # 파일이 없어도 동작하도록 안전 기본값
         return "너는 전시회 정보 추출기이다. 입력 마크다운에서 지정된 키만 추출하고 JSON만 출력하라."
@@ -52,34 +114,9 @@ def _safe_json_parse(text: str) -> Dict[str, Any]:
         return {}
 
 # ==== 날짜/연도 정규화 ======================================================
-def normalize_date(s: str) -> str:
-    """다양한 표기 → YYYY-MM-DD (모르면 그대로 반환)"""
-    if not s:
-        return ""
-    s = s.strip()
-
-    # 2025.05.06 ~ 05.08 / 2025-05-06 to 05-08 등 범위 케이스의 앞/뒤만 깔끔히 쓰고 싶다면
-    # 이 함수 외부에서 '개최 시작','개최 종료'를 각각 원문에서 따로 추출하는 게 더 낫지만
-    # 여기서는 단일 값만 들어온다고 보고 정규화만 수행.
-    # 2025.05.06 / 2025-05-06 / 2025/5/6 / 2025년 5월 6일
-    m = re.search(r"(\d{4})[.\-/\s년](\d{1,2})[.\-/\s월](\d{1,2})", s)
-    if m:
-        y, mo, d = m.groups()
-        return f"{int(y):04d}-{int(mo):02d}-{int(d):02d}"
-
-    # 2025.05 / 2025-5
-    m = re.search(r"(\d{4})[.\-/\s년](\d{1,2})", s)
-    if m:
-        y, mo = m.groups()
-        return f"{int(y):04d}-{int(mo):02d}-01"
-
-    # May 6, 2025 / 6 May 2025 등 간단 영문 포맷(있으면)
-    try:
-        from dateutil import parser  # conda/pip에 dateutil이 없다면 위의 규칙만 사용
-        dt = parser.parse(s, fuzzy=True, dayfirst=False)
-        return dt.strftime("%Y-%m-%d")
-    except Exception:
-        return s
+def normalize_date(s: str, part: str = "start") -> str:
+    """다양한 표기 → YYYY-MM-DD (모르면 그대로 반환, 기간 표기는 part="start"/"end"로 앞/뒤 선택, dates.py)"""
+    return dates.normalize_date(s, part)
 
 def normalize_year(s: str) -> str:
     """첫 개최년도 등은 'YYYY'만 유지"""
@@ -96,44 +133,460 @@ def normalize_url(s: str) -> str:
         return s
     return ""  # http(s) 아닌 건 버림
 
-# ==== Ollama 호출 (Grammar 강제) ============================================
-def ask_ollama(system_prompt: str,
-               before_user_prompt: List[str],
-               before_assis_prompt: List[str],
-               user_prompt: str) -> Dict[str, Any]:
+# ==== Ollama 백엔드 디스패처 ================================================
+class OllamaBackend:
+    """Ollama 서버 하나의 상태 (진행 중 요청 수, 제외 기한)"""
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self.outstanding = 0
+        self.failures = 0
+        self.ejected_until = 0.0
+
+    @property
+    def available(self) -> bool:
+        return time.time() >= self.ejected_until
+
+    def __repr__(self) -> str:
+        state = "up" if self.available else "ejected"
+        return f"<OllamaBackend {self.base_url} {state} outstanding={self.outstanding} failures={self.failures}>"
+
+class OllamaDispatcher:
     """
-    기존 호출 시그니처 유지.
-    - /api/generate + grammar 로 '지정 키만 있는 JSON'을 강제.
+    여러 Ollama 서버에 요청 분배
+    - 진행 중 요청이 가장 적은 백엔드로 라우팅
+    - 실패한 백엔드는 OLLAMA_EJECT_SEC 동안 제외하고, 기한이 지나면 /api/tags로 확인 후 복귀
+    - 재시도는 지터 백오프 후, 이번 요청에서 아직 시도하지 않은 백엔드를 우선해서 보냄
+    - 헤징: 최근 p95 지연 안에 응답이 없으면 다른 백엔드에 한 번 더 보내고 먼저 온 결과 사용
+    - 서킷 브레이커: 요청이 연속으로 실패하면 쿨다운 동안 서버를 기다리지 않고 바로 실패
     """
-    # 추출 키만 허용하는 간단 PEG 문법
-    GRAMMAR = r'''
-    root    <- ws obj ws
-    obj     <- '{' ws (pair (ws ',' ws pair)*)? ws '}'
-    pair    <- (k1/k2/k3/k4/k5/k6/k7/k8/k9/k10/k11/k12/k13/k14/k15/k16/k17/k18/k19) ws ':' ws value
+    def __init__(self, urls: List[str], retries: int = OLLAMA_RETRIES, eject_sec: float = OLLAMA_EJECT_SEC):
+        self.backends = [OllamaBackend(u) for u in urls]
+        self.retries = retries
+        self.eject_sec = eject_sec
+        self._lock = threading.Lock()
+        self._rr = 0
+        self._latencies: deque = deque(maxlen=200)   # 성공 응답 지연 (p95 계산용)
+        self._consecutive_failures = 0
+        self._breaker_open_until = 0.0
+        self._half_open_probe = False
+        self.counters = {"requests": 0, "failures": 0, "retries": 0, "hedges": 0, "hedge_wins": 0,
+                         "breaker_opened": 0, "breaker_rejected": 0}
+
+    def check_health(self, backend: OllamaBackend) -> bool:
+        """GET /api/tags 로 서버 응답 여부 확인"""
+        try:
+            resp = requests.get(backend.base_url + "/api/tags", timeout=OLLAMA_HEALTH_TIMEOUT)
+            return resp.status_code == 200
+        except Exception:
+            return False
+
+    def health(self) -> List[Dict[str, Any]]:
+        """전체 백엔드 상태 확인 (제외된 백엔드도 응답하면 복귀)"""
+        out = []
+        for b in self.backends:
+            ok = self.check_health(b)
+            with self._lock:
+                if ok and not b.available:
+                    b.ejected_until = 0.0
+                    b.failures = 0
+            out.append({"url": b.base_url, "healthy": ok, "outstanding": b.outstanding, "failures": b.failures})
+        return out
+
+    def _eject(self, backend: OllamaBackend, reason: str):
+        """실패 기록 + 제외 (다른 사용 가능한 백엔드가 없으면 제외하지 않음 → 재시도가 같은 서버로 감)"""
+        with self._lock:
+            backend.failures += 1
+            last = not any(b.available for b in self.backends if b is not backend)
+            if not last:
+                backend.ejected_until = time.time() + self.eject_sec
+        if last:
+            print(f"[dispatcher] {backend.base_url} 실패 (남은 백엔드가 없어 제외하지 않음): {reason}")
+        else:
+            print(f"[dispatcher] {backend.base_url} 제외 ({self.eject_sec:.0f}s): {reason}")
+
+    def _acquire(self, tried: set, fallback: bool = False) -> Optional[OllamaBackend]:
+        """
+        시도하지 않은 백엔드 중 진행 중 요청이 가장 적은 것 선택 (동률이면 라운드로빈)
+        fallback=True면 모두 제외된 상태에서도 None 대신 제외 기한이 가장 빨리 끝나는 백엔드 선택
+        """
+        # 제외 기한이 지난 백엔드는 헬스체크를 통과해야 복귀
+        for b in self.backends:
+            if b.base_url not in tried and b.failures and b.available:
+                if self.check_health(b):
+                    with self._lock:
+                        b.failures = 0
+                    print(f"[dispatcher] {b.base_url} 복귀")
+                else:
+                    self._eject(b, "health check failed")
+        with self._lock:
+            cands = [b for b in self.backends if b.base_url not in tried and b.available]
+            if not cands:
+                if not fallback or not self.backends:
+                    return None
+                soonest = min(self.backends, key=lambda b: (b.ejected_until, b.outstanding))
+                soonest.outstanding += 1
+                return soonest
+            self._rr += 1
+            n = len(self.backends)
+            best = min(cands, key=lambda b: (b.outstanding, (self.backends.index(b) - self._rr) % n))
+            best.outstanding += 1
+            return best
+
+    def _release(self, backend: OllamaBackend):
+        with self._lock:
+            backend.outstanding = max(0, backend.outstanding - 1)
+
+    def _count(self, name: str, n: int = 1):
+        with self._lock:
+            self.counters[name] += n
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            out = dict(self.counters)
+            out["p95_sec"] = self._p95()
+            out["breaker"] = "open" if time.time() < self._breaker_open_until else "closed"
+        return out
+
+    def _p95(self) -> Optional[float]:
+        if len(self._latencies) < OLLAMA_HEDGE_MIN_SAMPLES:
+            return None
+        xs = sorted(self._latencies)
+        return round(xs[min(len(xs) - 1, int(len(xs) * 0.95))], 2)
+
+    # ---- 서킷 브레이커 ----
+    def _breaker_allow(self):
+        with self._lock:
+            now = time.time()
+            if now < self._breaker_open_until:
+                self.counters["breaker_rejected"] += 1
+                raise RuntimeError(f"Ollama 서킷 브레이커 열림 ({self._breaker_open_until - now:.0f}s 후 재시도)")
+            if self._consecutive_failures >= OLLAMA_BREAKER_THRESHOLD:
+                # half-open: 쿨다운 후 시험 요청 1건만 통과
+                if self._half_open_probe:
+                    self.counters["breaker_rejected"] += 1
+                    raise RuntimeError("Ollama 서킷 브레이커 시험 요청 진행 중")
+                self._half_open_probe = True
+
+    def _breaker_record(self, ok: bool):
+        with self._lock:
+            self._half_open_probe = False
+            if ok:
+                self._consecutive_failures = 0
+                return
+            self._consecutive_failures += 1
+            self.counters["failures"] += 1
+            if self._consecutive_failures >= OLLAMA_BREAKER_THRESHOLD:
+                self._breaker_open_until = time.time() + OLLAMA_BREAKER_COOLDOWN
+                self.counters["breaker_opened"] += 1
+                print(f"[dispatcher] 서킷 브레이커 열림: 연속 실패 {self._consecutive_failures}회, {OLLAMA_BREAKER_COOLDOWN:.0f}s 동안 즉시 실패")
+
+    # ---- 단일 시도 ----
+    def _attempt(self, backend: OllamaBackend, path: str, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """백엔드 하나에 POST (_acquire로 잡은 자리는 여기서 반환)"""
+        t0 = time.time()
+        try:
+            resp = requests.post(backend.base_url + path, json=payload, timeout=timeout)
+            if resp.status_code >= 500:
+                raise requests.HTTPError(f"{resp.status_code} Server Error", response=resp)
+            resp.raise_for_status()
+            data = resp.json() or {}
+            with self._lock:
+                backend.failures = 0
+                self._latencies.append(time.time() - t0)
+            return data
+        except (requests.ConnectionError, requests.Timeout) as e:
+            self._eject(backend, str(e))
+            raise
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code >= 500:
+                self._eject(backend, str(e))
+            raise
+        finally:
+            self._release(backend)
+
+    def _spawn(self, backend: OllamaBackend, path: str, payload: Dict[str, Any], timeout: float) -> concurrent.futures.Future:
+        """_attempt를 데몬 스레드로 실행 (헤징에서 진 요청이 프로세스 종료를 막지 않도록)"""
+        fut: concurrent.futures.Future = concurrent.futures.Future()
+
+        def _run():
+            try:
+                fut.set_result(self._attempt(backend, path, payload, timeout))
+            except Exception as e:
+                fut.set_exception(e)
+        threading.Thread(target=_run, name="ollama-request", daemon=True).start()
+        return fut
+
+    def _hedged_call(self, path: str, payload: Dict[str, Any], timeout: float, tried: set) -> Dict[str, Any]:
+        backend = self._acquire(tried) or self._acquire(set(), fallback=True)
+        if backend is None:
+            raise RuntimeError("사용 가능한 Ollama 백엔드가 없습니다.")
+        tried.add(backend.base_url)
+
+        delay = self._p95() if OLLAMA_HEDGE and len(self.backends) > 1 else None
+        if delay is None:
+            return self._attempt(backend, path, payload, timeout)
+
+        delay = max(delay, OLLAMA_HEDGE_MIN_SEC)
+        first = self._spawn(backend, path, payload, timeout)
+        done, _ = concurrent.futures.wait([first], timeout=delay)
+        if done:
+            return first.result()
+        second_backend = self._acquire(tried)
+        if second_backend is None:
+            return first.result()
+        tried.add(second_backend.base_url)
+        self._count("hedges")
+        print(f"[dispatcher] 헤징: {backend.base_url} 응답 지연(> {delay:.1f}s) → {second_backend.base_url} 동시 요청")
+        second = self._spawn(second_backend, path, payload, timeout)
+
+        pending, last_exc = {first, second}, None
+        while pending:
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for f in done:
+                if f.exception() is None:
+                    if f is second:
+                        self._count("hedge_wins")
+                    return f.result()
+                last_exc = f.exception()
+        raise last_exc
+
+    def post(self, path: str, payload: Dict[str, Any], timeout: float = TIMEOUT) -> Dict[str, Any]:
+        """
+        백엔드에 POST 후 JSON 응답 반환
+        연결 오류/타임아웃/5xx는 해당 백엔드를 제외하고 지터 백오프 후 재시도(최대 retries회), 모두 실패하면 마지막 예외를 올림
+        4xx는 요청 자체 문제이므로 재시도하지 않음
+        """
+        self._breaker_allow()
+        self._count("requests")
+        tried: set = set()
+        last_exc: Optional[Exception] = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                wait = min(OLLAMA_BACKOFF_MAX, OLLAMA_BACKOFF_BASE * (2 ** (attempt - 1))) * random.uniform(0.5, 1.5)
+                self._count("retries")
+                print(f"[dispatcher] 재시도 {attempt}/{self.retries} ({wait:.1f}s 후): {last_exc}")
+                time.sleep(wait)
+            try:
+                data = self._hedged_call(path, payload, timeout, tried)
+                self._breaker_record(True)
+                return data
+            except requests.HTTPError as e:
+                if e.response is not None and e.response.status_code < 500:
+                    self._breaker_record(True)  # 서버는 살아 있음
+                    raise
+                last_exc = e
+            except Exception as e:
+                last_exc = e
+        self._breaker_record(False)
+        raise last_exc
+
+    def generate(self, payload: Dict[str, Any], timeout: float = TIMEOUT) -> Dict[str, Any]:
+        """/api/generate 호출"""
+        return self.post("/api/generate", payload, timeout)
+
+DISPATCHER = OllamaDispatcher(OLLAMA_URLS)
+
+# ==== LLM 동시 실행 제어 (AIMD) ============================================
+class AdaptiveLimiter:
+    """
+    LLM 요청 입장 제어기 (AIMD)
+    - 동시 실행 수(limit)만큼만 요청을 통과시키고 나머지는 대기
+    - 요청이 성공하고 지연이 기준(최근 최소 지연 × LLM_LATENCY_TOLERANCE) 이내면 limit += 1/limit
+    - 오류이거나 지연이 기준을 넘으면 limit *= LLM_BACKOFF (한 번 줄인 뒤 진행 중이던 요청이 끝날 때까지는 다시 줄이지 않음)
+    지연은 프롬프트 길이(1000자 단위)로 나눠 페이지 크기 차이를 보정한다.
+
+    대기 중인 요청은 우선순위 클래스(PRIORITY_RANK) 순으로 입장하고, 같은 클래스 안에서는 먼저 온 순서.
+    오래 기다린 요청은 LLM_AGING_SEC마다 한 단계씩 우선순위가 올라가며,
+    클래스별 동시 실행 수는 limit × PRIORITY_SHARE로 제한된다.
+    """
+    def __init__(self, initial: float = LLM_LIMIT_INITIAL, min_limit: float = LLM_LIMIT_MIN,
+                 max_limit: float = LLM_LIMIT_MAX, tolerance: float = LLM_LATENCY_TOLERANCE,
+                 backoff: float = LLM_BACKOFF, window: int = 50):
+        self.limit = max(min_limit, min(initial, max_limit))
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.tolerance = tolerance
+        self.backoff = backoff
+        self.in_flight = 0
+        self.errors = 0
+        self.completed = 0
+        self._samples: List[float] = []   # 최근 정규화 지연 (기준 지연 계산용)
+        self._window = window
+        self._seq = 0                     # 요청 시작 순번
+        self._last_decrease_seq = -1      # 마지막 감소 시점의 순번
+        self._waiting: List[list] = []    # [rank, 대기 시작 시각, 도착 순번, priority]
+        self._arrivals = 0
+        self._class_in_flight = {p: 0 for p in PRIORITY_RANK}
+        self._cond = threading.Condition()
+
+    def _class_cap(self, priority: str) -> int:
+        return max(1, int(self.limit * PRIORITY_SHARE.get(priority, 1.0)))
+
+    def _effective_rank(self, ticket: list, now: float) -> float:
+        return ticket[0] - (now - ticket[1]) / LLM_AGING_SEC
+
+    def _next_ticket(self) -> Optional[list]:
+        """지금 입장할 차례인 대기 요청 (클래스 한도에 걸린 요청은 건너뜀)"""
+        now = time.time()
+        eligible = [t for t in self._waiting if self._class_in_flight[t[3]] < self._class_cap(t[3])]
+        if not eligible:
+            return None
+        return min(eligible, key=lambda t: (self._effective_rank(t, now), t[2]))
+
+    def acquire(self, priority: str = LLM_DEFAULT_PRIORITY) -> int:
+        """빈 자리가 나고 자기 차례가 될 때까지 대기 후 입장, 요청 순번 반환"""
+        if priority not in PRIORITY_RANK:
+            priority = LLM_DEFAULT_PRIORITY
+        with self._cond:
+            self._arrivals += 1
+            ticket = [PRIORITY_RANK[priority], time.time(), self._arrivals, priority]
+            self._waiting.append(ticket)
+            try:
+                while self.in_flight >= int(self.limit) or self._next_ticket() is not ticket:
+                    # aging 반영을 위해 주기적으로 깨어나 순서를 다시 계산
+                    self._cond.wait(timeout=1.0)
+            finally:
+                self._waiting.remove(ticket)
+            self.in_flight += 1
+            self._class_in_flight[priority] += 1
+            self._seq += 1
+            # 자리가 남아 있으면 다음 차례도 입장할 수 있도록
+            self._cond.notify_all()
+            return self._seq
+
+    def release(self, seq: int, latency: float, ok: bool = True, size: int = 0,
+                priority: str = LLM_DEFAULT_PRIORITY):
+        """요청 종료: 지연/성공 여부로 limit 조정"""
+        with self._cond:
+            self.in_flight = max(0, self.in_flight - 1)
+            if priority in self._class_in_flight:
+                self._class_in_flight[priority] = max(0, self._class_in_flight[priority] - 1)
+            self.completed += 1
+            old = self.limit
+            norm = latency / (1.0 + size / 1000.0)
+            overloaded = not ok
+            if ok:
+                self._samples.append(norm)
+                if len(self._samples) > self._window:
+                    self._samples.pop(0)
+                baseline = min(self._samples)
+                overloaded = len(self._samples) >= 3 and norm > baseline * self.tolerance
+            else:
+                self.errors += 1
+
+            if overloaded:
+                # 감소 이후에 시작된 요청의 결과일 때만 다시 감소 (한 번의 과부하로 연속 감소 방지)
+                if seq > self._last_decrease_seq:
+                    self.limit = max(self.min_limit, self.limit * self.backoff)
+                    self._last_decrease_seq = self._seq
+            else:
+                self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+
+            if int(old) != int(self.limit):
+                reason = "error" if not ok else ("slow" if overloaded else "ok")
+                print(f"[limiter] limit {old:.2f} → {self.limit:.2f} ({reason}, latency={latency:.1f}s, in_flight={self.in_flight})")
+            self._cond.notify_all()
+
+    def slot(self, size: int = 0, priority: str = LLM_DEFAULT_PRIORITY):
+        """with LIMITER.slot(len(prompt), priority) as s: ... ; 실패 시 s.ok = False"""
+        return _LimiterSlot(self, size, priority)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "limit": round(self.limit, 2),
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "errors": self.errors,
+                "baseline_latency_per_kchar": round(min(self._samples), 3) if self._samples else None,
+                "in_flight_by_class": dict(self._class_in_flight),
+                "waiting_by_class": {p: sum(1 for t in self._waiting if t[3] == p) for p in PRIORITY_RANK},
+            }
+
+class _LimiterSlot:
+    def __init__(self, limiter: AdaptiveLimiter, size: int, priority: str):
+        self.limiter = limiter
+        self.size = size
+        self.priority = priority if priority in PRIORITY_RANK else LLM_DEFAULT_PRIORITY
+        self.ok = True
+
+    def __enter__(self):
+        self.seq = self.limiter.acquire(self.priority)
+        self.t0 = time.time()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        ok = self.ok and exc_type is None
+        self.limiter.release(self.seq, time.time() - self.t0, ok=ok, size=self.size, priority=self.priority)
+        return False
+
+LIMITER = AdaptiveLimiter()
+
+# ==== 요청 텔레메트리 ========================================================
+# Ollama 응답의 *_duration 값은 나노초
+_NS = 1e9
+
+def parse_ollama_stats(resp: Dict[str, Any]) -> Dict[str, Any]:
+    """/api/generate 응답 → 토큰 수/시간(초)/속도(tok/s)"""
+    prompt_tokens = int(resp.get("prompt_eval_count") or 0)
+    eval_tokens = int(resp.get("eval_count") or 0)
+    prompt_sec = (resp.get("prompt_eval_duration") or 0) / _NS
+    eval_sec = (resp.get("eval_duration") or 0) / _NS
+    return {
+        "prompt_tokens": prompt_tokens,
+        "eval_tokens": eval_tokens,
+        "load_sec": round((resp.get("load_duration") or 0) / _NS, 3),
+        "prompt_sec": round(prompt_sec, 3),
+        "eval_sec": round(eval_sec, 3),
+        "ollama_total_sec": round((resp.get("total_duration") or 0) / _NS, 3),
+        "prompt_tps": round(prompt_tokens / prompt_sec, 1) if prompt_sec else 0.0,
+        "eval_tps": round(eval_tokens / eval_sec, 1) if eval_sec else 0.0,
+    }
+
+def _percentile(xs: List[float], q: float) -> float:
+    xs = sorted(xs)
+    return round(xs[min(len(xs) - 1, int(len(xs) * q))], 3) if xs else 0.0
+
+class TelemetryStats:
+    """최근 TELEMETRY_WINDOW개 요청의 모델별/도메인별 p50·p95 집계"""
+    METRICS = ("wall_sec", "queue_sec", "load_sec", "prompt_sec", "eval_sec", "prompt_tokens", "eval_tokens")
+
+    def __init__(self, window: int = TELEMETRY_WINDOW):
+        self.window = window
+        self._series: Dict[tuple, deque] = {}
+        self._lock = threading.Lock()
+
+    def record(self, call: Dict[str, Any]):
+        with self._lock:
+            for dim in ("model", "domain"):
+                key = (dim, call.get(dim) or "-")
+                self._series.setdefault(key, deque(maxlen=self.window)).append(call)
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """{"model": {이름: {count, <metric>: {p50, p95}}}, "domain": {...}}"""
+        out: Dict[str, Dict[str, Dict[str, Any]]] = {"model": {}, "domain": {}}
+        with self._lock:
+            items = [(k, list(v)) for k, v in self._series.items()]
+        for (dim, name), calls in items:
+            row: Dict[str, Any] = {"count": len(calls)}
+            for m in self.METRICS:
+                xs = [float(c.get(m) or 0) for c in calls]
+                row[m] = {"p50": _percentile(xs, 0.5), "p95": _percentile(xs, 0.95)}
+            out[dim][name] = row
+        return out
+
+TELEMETRY = TelemetryStats()
+
+def _source_domain(url: str) -> str:
+    host = (urlsplit(url or "").netloc or "").lower().split(":")[0]
+    return host[4:] if host.startswith("www.") else host
+
+# ==== 출력 문법 ==============================================================
+_GRAMMAR_VALUES = r'''
     value   <- string / date / url / 'null' / array / obj
 
     array   <- '[' ws (value (ws ',' ws value)*)? ws ']'
 
-    k1  <- '"' '전시회 국문명' '"'
-    k2  <- '"' '영문명(Full Name)' '"'
-    k3  <- '"' '영문명(약자)' '"'
-    k4  <- '"' '개최 시작' '"'
-    k5  <- '"' '개최 종료' '"'
-    k6  <- '"' '개최장소(국문)' '"'
-    k7  <- '"' '개최장소(영어)' '"'
-    k8  <- '"' '국가' '"'
-    k9  <- '"' '도시' '"'
-    k10 <- '"' '첫 개최년도' '"'
-    k11 <- '"' '개최 주기' '"'
-    k12 <- '"' '공식 홈페이지' '"'
-    k13 <- '"' '주최기관' '"'
-    k14 <- '"' '담당자' '"'
-    k15 <- '"' '전화' '"'
-    k16 <- '"' '이메일' '"'
-    k17 <- '"' '산업분야' '"'
-    k18 <- '"' '전시품목' '"'
-    k19 <- '"' '출처' '"'
-
     string  <- '"' chars* '"'
     chars   <- [^"\\] / escape
     escape  <- '\\' ["\\/bfnrt] / '\\u' [0-9a-fA-F]{4}
@@ -143,25 +596,66 @@ def ask_ollama(system_prompt: str,
     ws      <- [ \t\n\r]*
     '''
 
+def build_grammar(keys: List[str]) -> str:
+    """지정한 키만 허용하는 PEG 문법 생성 (부분 추출 시 키 수만큼 문법/출력이 줄어듦)"""
+    names = [f"k{i}" for i in range(1, len(keys) + 1)]
+    lines = [
+        "",
+        "    root    <- ws obj ws",
+        "    obj     <- '{' ws (pair (ws ',' ws pair)*)? ws '}'",
+        f"    pair    <- ({'/'.join(names)}) ws ':' ws value",
+        "",
+    ]
+    for name, key in zip(names, keys):
+        lit = key.replace("\\", "\\\\").replace("'", "\\'")
+        lines.append(f"    {name:<3} <- '\"' '{lit}' '\"'")
+    return "\n".join(lines) + "\n" + _GRAMMAR_VALUES
+
+# ==== Ollama 호출 (Grammar 강제) ============================================
+def ask_ollama(system_prompt: str,
+               before_user_prompt: List[str],
+               before_assis_prompt: List[str],
+               user_prompt: str,
+               priority: str = LLM_DEFAULT_PRIORITY,
+               model: str = "",
+               keys: Optional[List[str]] = None,
+               telemetry: Optional[List[Dict[str, Any]]] = None,
+               source_url: str = "",
+               include_rules: bool = True) -> Dict[str, Any]:
+    """
+    기존 호출 시그니처 유지.
+    - /api/generate + grammar 로 '지정 키만 있는 JSON'을 강제.
+    - priority: LLM 대기열 우선순위 (interactive / batch / background)
+    - model: 사용할 모델 (비우면 MODEL)
+    - keys: 문법으로 허용할 키 (비우면 KEYS 전체)
+    - telemetry: 리스트를 넘기면 이 호출의 토큰/시간 통계를 append (TELEMETRY에도 집계)
+    - include_rules: False면 prompt.md(19개 키 전체 규칙)를 붙이지 않음 (빈 키 재질의용)
+    """
+    # 추출 키만 허용하는 간단 PEG 문법
+    GRAMMAR = build_grammar(keys or KEYS)
+
     # 시스템 규칙(외부 MD) + 기존 few-shot 프롬프트를 하나의 prompt로 합침
-    rules_md = load_prompt_md()
-    # 리스트 방어적 처리
-    bu0 = (before_user_prompt[0] if before_user_prompt else "")
-    ba0 = (before_assis_prompt[0] if before_assis_prompt else "")
-    bu1 = (before_user_prompt[1] if len(before_user_prompt) > 1 else "")
-    ba1 = (before_assis_prompt[1] if len(before_assis_prompt) > 1 else "")
+    rules_md = load_prompt_md() if include_rules else ""
+    # few-shot 예시는 받은 개수(FEWSHOT_K)만큼 모두 넣음 (리스트 방어적 처리: 짝이 없는 쪽은 빈 문자열)
+    before_user_prompt, before_assis_prompt = list(before_user_prompt or []), list(before_assis_prompt or [])
+    n_shots = max(len(before_user_prompt), len(before_assis_prompt))
+    shots = "".join(
+        (before_user_prompt[i] if i < len(before_user_prompt) else "").strip() + "\n" +
+        (before_assis_prompt[i] if i < len(before_assis_prompt) else "").strip() + "\n"
+        for i in range(n_shots)
+    )
 
     prompt = (
         (rules_md.strip() + "\n\n" if rules_md else "") +
         system_prompt.strip() + "\n\n" +
-        bu0.strip() + "\n" + ba0.strip() + "\n" +
-        bu1.strip() + "\n" + ba1.strip() + "\n" +
+        shots +
         user_prompt.strip() + "\n\nJSON:"
     )
 
     payload = {
-        "model": MODEL,
+        "model": model or MODEL,
         "prompt": prompt,
+        "keep_alive": OLLAMA_KEEP_ALIVE,
         "options": {
             "num_ctx": NUM_CTX,
             "temperature": TEMPERATURE,
@@ -170,27 +664,71 @@ def ask_ollama(system_prompt: str,
         "stream": False
     }
 
+    call = {"model": payload["model"], "domain": _source_domain(source_url), "keys": len(keys or KEYS),
+            "prompt_chars": len(prompt), "ok": False}
+    t_req = time.time()
     try:
-        resp = requests.post(OLLAMA_URL, json=payload, timeout=TIMEOUT)
-        resp.raise_for_status()
-        content = (resp.json() or {}).get("response", "")
+        # 동시 요청 수는 LIMITER가 지연/오류를 보고 조절 (초과분은 여기서 대기)
+        with LIMITER.slot(len(prompt), priority):
+            t_start = time.time()
+            call["queue_sec"] = round(t_start - t_req, 3)
+            resp = DISPATCHER.generate(payload, timeout=TIMEOUT)
+            call["wall_sec"] = round(time.time() - t_start, 3)
+        call.update(parse_ollama_stats(resp))
+        call["ok"] = True
+        content = resp.get("response", "")
         obj = _safe_json_parse(content)
         return obj if isinstance(obj, dict) else {}
     except Exception as e:
         print(f"[ERROR] Ollama request failed: {e}")
         return {}
+    finally:
+        call.setdefault("queue_sec", round(time.time() - t_req, 3))
+        call.setdefault("wall_sec", 0.0)
+        if call["ok"]:
+            TELEMETRY.record(call)
+            print(f"[telemetry] {call['model']} {call['domain'] or '-'} wall={call['wall_sec']}s queue={call['queue_sec']}s "
+                  f"load={call['load_sec']}s prompt={call['prompt_tokens']}tok/{call['prompt_sec']}s "
+                  f"eval={call['eval_tokens']}tok/{call['eval_sec']}s")
+        if telemetry is not None:
+            telemetry.append(call)
 
 # ==== 메인 추출 함수 =========================================================
-def extract_from_text(text: str, keys: List[str], source_url: str = "") -> Dict[str, Any]:
+def _postprocess(obj: Dict[str, Any], keys: List[str]) -> Dict[str, Any]:
+    """누락 키 보정 + 값 정규화 (날짜/연도/URL)"""
+    fixed: Dict[str, Any] = {}
+    for k in keys:
+        v = obj.get(k, "")
+        if v is None:
+            v = ""
+        if not isinstance(v, str):
+            v = str(v)
+        v = v.strip()
+
+        if k == "개최 시작":
+            v = normalize_date(v)
+        elif k == "개최 종료":
+            v = normalize_date(v, part="end")   # "2025.05.06 ~ 05.08" → 2025-05-08
+        elif k == "첫 개최년도":
+            v = normalize_year(v)
+        elif k == "공식 홈페이지":
+            v = normalize_url(v)
+
+        fixed[k] = v
+
+    return fixed
+
+
+def extract_from_text(text: str, keys: List[str], source_url: str = "",
+                      priority: str = LLM_DEFAULT_PRIORITY, model: str = "",
+                      telemetry: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
     import os, json
     from typing import Any, Dict, List
 
-    # 0) prompt.md 로드 (없으면 빈 문자열로 진행) + 로딩 확인 로그
-    base_dir = os.path.dirname(__file__)
-    prompt_path = os.path.join(base_dir, "prompt.md")
+    # 0) prompt.md 로드 (PROMPT_MD, 워밍업과 같은 파일 / 없으면 빈 문자열로 진행) + 로딩 확인 로그
+    prompt_path = PROMPT_MD
     try:
-        with open(prompt_path, "r", encoding="utf-8") as f:
-            prompt_md = f.read()
+        prompt_md = read_prompt_file(prompt_path)
         print("[PROMPT LOADED]", prompt_path)
         #print((prompt_md or "")[:200], "...")
     except FileNotFoundError:
@@ -219,69 +757,8 @@ def extract_from_text(text: str, keys: List[str], source_url: str = "") -> Dict[
         "  · 단, 영문명(약자)은 본문에 실제로 등장할 때만 채운다(엄격)."
     )
 
-    # 2) few-shot (기존 유지 가능)
-    before_user_prompt = [(
-        "[예시 1]\n"
-        "[입력 발췌]\n"
-        "2025 미국 라스베가스 폐기물 재활용 전시회 [WE]\nWaste Expo\nWE\n2025.05.06 - 2025.05.08\n"
-        "개최국가 | 미국 \n개최장소 | Las Vegas Convention Center \n산업분야 | 물류&운송, 기계&장비, 환경&폐기물 \n"
-        "전시품목 | 시설, 중장비, 운송, 처리 기술 및 시스템 \n"
-        "주최기관 | Informa Market \n전화 | 212-520-2700 \n이메일 | informamarkets@informa.com \n"
-        "홈페이지 | [www.wasteexpo.com]\n"
-    ), (
-        "[예시 2]\n"
-        "[입력 발췌]\n"
-        "# 미국 폐기물 및 재활용 전시회 2026(Waste Expo 2026)...\n"
-        "개최 일정 | 2027년 05월 03일(월) - 06일(목)\n"
-        "개최 장소 | Las Vegas Convention Center (LVCC)\n"
-        "개최 주기 | 1회 / 2년 | 첫 개최년도 | 1968년\n"
-    )]
-
-    before_assis_prompt = [(
-        json.dumps({
-            "전시회 국문명": "2025 미국 라스베가스 폐기물 재활용 전시회",
-            "영문명(Full Name)": "Waste Expo",
-            "영문명(약자)": "WE",
-            "개최 시작": "2025-05-06",
-            "개최 종료": "2025-05-08",
-            "개최장소(국문)": "라스베이거스 컨벤션 센터",
-            "개최장소(영어)": "Las Vegas Convention Center",
-            "국가": "United States",
-            "도시": "Las Vegas",
-            "첫 개최년도": "",
-            "개최 주기": "Annual",
-            "공식 홈페이지": "https://www.wasteexpo.com",
-            "주최기관": "Informa Markets",
-            "담당자": "",
-            "전화": "212-520-2700",
-            "이메일": "informamarkets@informa.com",
-            "산업분야": "Logistics, Machinery, Environment & Waste",
-            "전시품목": "Facilities, Heavy Equipment, Transport, Processing Tech & Systems",
-            "출처": "https://example.com"
-        }, ensure_ascii=False)
-    ), (
-        json.dumps({
-            "전시회 국문명": "미국 폐기물 및 재활용 전시회 2026",
-            "영문명(Full Name)": "Waste Expo 2026",
-            "영문명(약자)": "",
-            "개최 시작": "2027-05-03",
-            "개최 종료": "2027-05-06",
-            "개최장소(국문)": "라스베이거스 컨벤션 센터",
-            "개최장소(영어)": "Las Vegas Convention Center (LVCC)",
-            "국가": "United States",
-            "도시": "Las Vegas",
-            "첫 개최년도": "1968",
-            "개최 주기": "Biennial",
-            "공식 홈페이지": "https://www.wasteexpo.com/en/home.html",
-            "주최기관": "",
-            "담당자": "",
-            "전화": "",
-            "이메일": "",
-            "산업분야": "Waste collection & transport, Smart waste mgmt, Recycling plants & equipment, Biogas & WtE, Eco-friendly treatment, Policy & Education",
-            "전시품목": "",
-            "출처": ""
-        }, ensure_ascii=False)
-    )]
+    # 2) few-shot: 예시 저장소(fewshot.py)에서 이 페이지와 가장 비슷한 예시만 선택
+    before_user_prompt, before_assis_prompt = build_fewshot(text, source_url)
 
     # 3) 사용자 프롬프트(사이트/URL 힌트 포함)
     user_prompt = (
@@ -308,7 +785,8 @@ def extract_from_text(text: str, keys: List[str], source_url: str = "") -> Dict[
     )
 
     # 4) 모델 호출
-    obj = ask_ollama(system_prompt, before_user_prompt, before_assis_prompt, user_prompt)
+    obj = ask_ollama(system_prompt, before_user_prompt, before_assis_prompt, user_prompt,
+                     priority=priority, model=model, keys=keys, telemetry=telemetry, source_url=source_url)
 
     # 5) 견고한 파싱: 문자열이면 JSON 파싱 시도, dict 아니면 빈 dict
     if isinstance(obj, str):
@@ -320,32 +798,172 @@ def extract_from_text(text: str, keys: List[str], source_url: str = "") -> Dict[
         obj = {}
 
     # 6) 누락 키 보정 + 후처리(정규화)
-    fixed: Dict[str, Any] = {}
-    for k in keys:
-        v = obj.get(k, "")
-        if v is None:
-            v = ""
-        if not isinstance(v, str):
-            v = str(v)
-        v = v.strip()
-
-        if k in ("개최 시작", "개최 종료"):
-            v = normalize_date(v)
-        elif k == "첫 개최년도":
-            v = normalize_year(v)
-        elif k == "공식 홈페이지":
-            v = normalize_url(v)
+    return _postprocess(obj, keys)
+
+
+# ==== 빈 키 부분 추출 ========================================================
+# 키별로 관련 본문 조각을 고를 때 쓰는 단서 단어
+FIELD_HINTS: Dict[str, List[str]] = {
+    "전시회 국문명": ["전시회", "박람회", "전시"],
+    "영문명(Full Name)": ["expo", "exhibition", "show", "fair", "conference", "congress"],
+    "영문명(약자)": ["expo", "show", "fair"],
+    "개최 시작": ["개최", "일정", "기간", "date", "dates", "20"],
+    "개최 종료": ["개최", "일정", "기간", "date", "dates", "20"],
+    "개최장소(국문)": ["장소", "전시장", "센터", "venue"],
+    "개최장소(영어)": ["venue", "center", "centre", "hall", "location"],
+    "국가": ["국가", "country", "개최국"],
+    "도시": ["도시", "city"],
+    "첫 개최년도": ["첫 개최", "since", "founded", "established", "first held", "년부터"],
+    "개최 주기": ["주기", "매년", "격년", "annual", "biennial", "every", "년"],
+    "공식 홈페이지": ["홈페이지", "website", "www", "http"],
+    "주최기관": ["주최", "주관", "organizer", "organiser", "organized by", "organised by", "host"],
+    "담당자": ["담당", "contact", "manager"],
+    "전화": ["전화", "tel", "phone", "+"],
+    "이메일": ["이메일", "email", "e-mail", "@"],
+    "산업분야": ["산업", "분야", "industry", "sector"],
+    "전시품목": ["품목", "전시품", "products", "exhibits", "profile"],
+    "출처": [],
+}
+
+def _split_chunks(text: str, size: int = 800) -> List[str]:
+    """빈 줄/제목 기준으로 나눈 뒤 size자 안팎으로 묶기"""
+    blocks = [b.strip() for b in re.split(r"\n\s*\n|\n(?=#)", text or "") if b.strip()]
+    chunks, cur = [], ""
+    for b in blocks:
+        if cur and len(cur) + len(b) > size:
+            chunks.append(cur)
+            cur = ""
+        cur = (cur + "\n\n" + b) if cur else b
+    if cur:
+        chunks.append(cur)
+    return chunks
+
+def select_relevant_chunks(text: str, keys: List[str], rec: Optional[Dict[str, Any]] = None,
+                           max_chars: int = FILL_CONTEXT_CHARS) -> str:
+    """빈 키의 단서 단어와 이미 뽑은 이름이 많이 나오는 본문 조각만 골라 원래 순서대로 이어 붙임"""
+    chunks = _split_chunks(text)
+    if not chunks:
+        return ""
+    hints = [h.lower() for k in keys for h in FIELD_HINTS.get(k, [])]
+    names = [str((rec or {}).get(k) or "").lower() for k in ("전시회 국문명", "영문명(Full Name)", "영문명(약자)")]
+    names = [n for n in names if len(n) >= 2]
+
+    def _score(c: str) -> float:
+        low = c.lower()
+        return sum(low.count(h) for h in hints) + 2 * sum(1 for n in names if n in low)
+
+    ranked = sorted(range(len(chunks)), key=lambda i: (-_score(chunks[i]), i))
+    picked, total = [], 0
+    for i in ranked:
+        if picked and total + len(chunks[i]) > max_chars:
+            continue
+        picked.append(i)
+        total += len(chunks[i])
+        if total >= max_chars:
+            break
+    return "\n\n".join(chunks[i][:max_chars] for i in sorted(picked))
+
+def extract_missing_fields(text: str, rec: Dict[str, Any], keys: Optional[List[str]] = None,
+                           source_url: str = "", priority: str = LLM_DEFAULT_PRIORITY,
+                           model: str = "", telemetry: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """
+    빈 키만 다시 추출해 rec에 합친 새 dict 반환
+    - 문법/프롬프트를 빈 키만으로 줄이고, 이미 뽑은 값과 관련 본문 조각만 넘김 (prompt.md 제외)
+    - 이미 값이 있는 키는 덮어쓰지 않음
+    """
+    keys = keys or KEYS
+    merged = dict(rec or {})
+    missing = [k for k in keys if not str(merged.get(k) or "").strip() and k != "출처"]
+    if not missing:
+        return merged
+
+    known = {k: v for k, v in merged.items() if k in keys and str(v or "").strip()}
+    context = select_relevant_chunks(text, missing, merged)
+    system_prompt = (
+        "너는 전시회 정보 추출 도우미다. 이미 추출된 값을 참고해, 아래 본문에서 비어 있는 키만 찾아 JSON으로 출력해라.\n"
+        "텍스트에 없는 정보는 \"\"(빈 문자열)로 둔다. 추측 금지. 날짜는 YYYY-MM-DD."
+    )
+    user_prompt = (
+        f"- 찾을 키(순서 유지): {missing}\n"
+        f"- 이미 추출된 값: {json.dumps(known, ensure_ascii=False)}\n"
+        f"- 출처 URL: {source_url}\n"
+        "\n텍스트 시작:\n"
+        f"{context}\n"
+        "텍스트 끝."
+    )
+    # 전체 규칙(prompt.md)은 빼고 빈 키 안내만 넘김
+    obj = ask_ollama(system_prompt, [], [], user_prompt, priority=priority, model=model, keys=missing,
+                     telemetry=telemetry, source_url=source_url, include_rules=False)
+    if not isinstance(obj, dict):
+        obj = {}
+    filled = {k: v for k, v in _postprocess(obj, missing).items() if v}
+    print(f"[fill] 빈 키 {len(missing)}개 재질의 → {len(filled)}개 채움: {list(filled)}")
+    merged.update(filled)
+    return merged
 
-        fixed[k] = v
+# ==== 추출 품질 검사 =========================================================
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 
-    return fixed
+def score_record(rec: Dict[str, Any], keys: List[str] = KEYS) -> Dict[str, Any]:
+    """
+    추출 결과의 완성도/유효성 검사
+    - 필수: 전시회 이름(국문명 또는 영문명), 개최 시작일
+    - 형식: 날짜 YYYY-MM-DD, 첫 개최년도 YYYY, 홈페이지 http(s), 이메일 형식 (값이 있을 때만)
+    - 완성도: 값이 채워진 키 비율 >= CASCADE_MIN_COMPLETENESS
 
+    Returns:
+        {"ok": bool, "completeness": float, "problems": [str, ...]}
+    """
+    rec = rec or {}
+    val = lambda k: str(rec.get(k) or "").strip()
+    problems = []
+
+    if not (val("전시회 국문명") or val("영문명(Full Name)")):
+        problems.append("이름 없음")
+    if not val("개최 시작"):
+        problems.append("개최 시작 없음")
+    for k in ("개최 시작", "개최 종료"):
+        if val(k) and not _DATE_RE.match(val(k)):
+            problems.append(f"{k} 형식 오류")
+    if val("개최 시작") and val("개최 종료") and val("개최 종료") < val("개최 시작"):
+        problems.append("개최 종료 < 개최 시작")
+    if val("첫 개최년도") and not re.fullmatch(r"\d{4}", val("첫 개최년도")):
+        problems.append("첫 개최년도 형식 오류")
+    if val("공식 홈페이지") and not val("공식 홈페이지").startswith(("http://", "https://")):
+        problems.append("홈페이지 형식 오류")
+    if val("이메일") and not _EMAIL_RE.match(val("이메일")):
+        problems.append("이메일 형식 오류")
+
+    completeness = sum(1 for k in keys if val(k)) / max(1, len(keys))
+    if completeness < CASCADE_MIN_COMPLETENESS:
+        problems.append(f"완성도 {completeness:.2f} < {CASCADE_MIN_COMPLETENESS}")
+
+    return {"ok": not problems, "completeness": round(completeness, 3), "problems": problems}
+
+def fill_known(rec: Dict[str, Any], text: str = "") -> Dict[str, Any]:
+    """
+    LLM 없이 채울 수 있는 값 채움
+    - 한쪽만 추출된 전시회명/개최장소 → 국문↔영문 이름 사전 (bilingual.py)
+    - 빈 국가/도시/개최장소, 국가 동의어 → 지명 사전 (gazetteer.py)
+    """
+    rec, filled = NAMES.fill_record(rec)
+    if filled:
+        print(f"[names] 사전으로 채움: {', '.join(filled)}")
+    rec, filled = fill_location(rec, text)
+    if filled:
+        print(f"[gazetteer] 지명 사전으로 채움: {', '.join(filled)}")
+    return rec
 
 # ==== 파이프라인 진입점 ======================================================
 def run_pipeline_markdown(raw: dict) -> Dict[str, Any] | None:
     """
-    입력: {'markdown': '...'} 형태
-    출력: {extracted_at, model, num_ctx, keys, data}
+    입력: {'markdown': '...', 'source_url': '...', 'priority': 'interactive|batch|background'(선택)} 형태
+    출력: {extracted_at, model, tier, quality, telemetry, num_ctx, keys, data}
+    - FAST_MODEL이 있으면 빠른 모델 결과가 score_record를 통과할 때 그대로 쓰고(tier="fast"),
+      떨어지면 MODEL로 다시 추출(tier="escalated"). FAST_MODEL이 없으면 MODEL만 사용(tier="single").
+    - 한쪽만 있는 전시회명/개최장소, 빈 국가/도시는 이름/지명 사전으로 먼저 채움 (fill_known, 채운 키는 LLM에 다시 묻지 않음)
+    - 빈 키가 FILL_MAX_KEYS개 이하면 extract_missing_fields로 그 키만 한 번 더 추출
     """
     text = (raw.get("markdown") or "").strip()
     source_url = (raw.get("source_url") or "").strip() 
@@ -353,12 +971,49 @@ def run_pipeline_markdown(raw: dict) -> Dict[str, Any] | None:
         print("처리할 텍스트가 없습니다.")
         return None
 
-    print(f"[INFO] {MODEL} model 처리 (num_ctx={NUM_CTX}, temp={TEMPERATURE})")
-    rec = extract_from_text(text, KEYS, source_url=source_url)
+    priority = raw.get("priority") or LLM_DEFAULT_PRIORITY
+    cascade = bool(FAST_MODEL) and FAST_MODEL != MODEL
+    model, tier = MODEL, "single"
+    rec, quality = None, None
+    calls: List[Dict[str, Any]] = []   # 이 페이지의 LLM 호출별 토큰/시간 통계
+
+    if cascade:
+        print(f"[INFO] {FAST_MODEL} model 처리 (fast tier, num_ctx={NUM_CTX}, temp={TEMPERATURE})")
+        rec = extract_from_text(text, KEYS, source_url=source_url, priority=priority, model=FAST_MODEL, telemetry=calls)
+        rec = fill_known(rec, text)
+        quality = score_record(rec)
+        if quality["ok"]:
+            model, tier = FAST_MODEL, "fast"
+        else:
+            print(f"[cascade] fast tier 불합격 → {MODEL} 재추출: {', '.join(quality['problems'])}")
+            rec = None
+
+    if rec is None:
+        print(f"[INFO] {MODEL} model 처리 (num_ctx={NUM_CTX}, temp={TEMPERATURE})")
+        rec = extract_from_text(text, KEYS, source_url=source_url, priority=priority, model=MODEL, telemetry=calls)
+        rec = fill_known(rec, text)
+        quality = score_record(rec)
+        tier = "escalated" if cascade else "single"
+
+    # 빈 키가 몇 개 안 되면 그 키만 다시 물어 채움 (전체 재추출보다 짧은 프롬프트/출력)
+    n_missing = sum(1 for k in KEYS if k != "출처" and not str(rec.get(k) or "").strip())
+    if 0 < n_missing <= FILL_MAX_KEYS:
+        rec = extract_missing_fields(text, rec, KEYS, source_url=source_url, priority=priority, model=model,
+                                     telemetry=calls)
+        quality = score_record(rec)
+
+    print(f"[cascade] tier={tier} model={model} completeness={quality['completeness']} url={source_url}")
 
     result = {
         "extracted_at": datetime.utcnow().isoformat() + "Z",
-        "model": MODEL,
+        "model": model,
+        "tier": tier,
+        "quality": quality,
+        "telemetry": {
+            "calls": calls,
+            "total": {m: round(sum(float(c.get(m) or 0) for c in calls), 3)
+                      for m in ("wall_sec", "queue_sec", "load_sec", "prompt_sec", "eval_sec", "prompt_tokens", "eval_tokens")},
+        },
         "num_ctx": NUM_CTX,
         "keys": KEYS,
         "data": rec,
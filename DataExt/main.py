@@ -12,16 +12,18 @@ from typing import Dict, List, Tuple, Optional
 
 import gradio as gr
 import pyperclip
-import subprocess
-import sys
-from pathlib import Path
 
-from crawl4ai import AsyncWebCrawler
+from crawl4ai import CrawlerRunConfig, CacheMode
 from crawl4ai.chunking_strategy import RegexChunking
 from pydantic import BaseModel, Field
 
+import browser                 # 검색/크롤링 공유 crawl4ai 브라우저
+
 from llama import *            # run_pipeline_markdown, KEYS 등
 from data import *             # normalize_text, to_markdown_table, canonicalize_record, save_json, compare_with_uploaded, compare_with_json
+from archive import put_markdown  # 크롤링 마크다운 보관 (내용 주소 gzip)
+import sitesearch              # GEP/Myfair/AUMA 검색 (프로세스 내 호출)
+from sitesearch import pick_latest
 
 # --- [ADD in main.py] URL 정규화 유틸 ---
 from urllib.parse import urlparse
@@ -35,23 +37,22 @@ def _extract_http_url(s: str) -> str:
     m = _URL_RE.search(s)
     return m.group(0) if m else ""
 
-def run_search_script(script, query):
-    cmd = [sys.executable, script, "--query", query, "--headless", "--only-url"]
+def run_search_site(site: str, query: str) -> str:
+    """sitesearch 패키지로 한 사이트를 검색해 가장 최신 결과의 URL 반환(없으면 빈 문자열)"""
     try:
-        output = subprocess.check_output(cmd, text=True, stderr=subprocess.STDOUT)
-        match = re.search(r"https?://[^\s]+", output)
-        return match.group(0) if match else ""
+        best = pick_latest(sitesearch.search(site, query), query)
+        return best["url"] if best else ""
     except Exception as e:
-        print(f"Error running {script}: {e}")
+        print(f"Error searching {site}: {e}")
         return ""
 
 def process_three_from_keyword(keyword):
-    scripts = [
-        "search_test_gep.py",
-        "search_test_myfair.py",
-        "search_test_auma.py",
-    ]
-    urls = [run_search_script(s, keyword) for s in scripts]
+    sites = ["gep", "myfair", "auma"]
+    results = sitesearch.search_all(keyword, sites)
+    urls = []
+    for site in sites:
+        best = pick_latest(results.get(site, []), keyword)
+        urls.append(best["url"] if best else "")
     print(f"[DEBUG] Extracted URLs: {urls}")
     return process_three(*urls)
 
@@ -102,25 +103,14 @@ def _pick_official_url(*recs: Dict[str, str]) -> str:
             return u
     return ""
 
-# 프로젝트 루트 기준 search_test.py 경로를 잡아주세요.
-# (아래는 main.py와 같은 폴더에 있는 경우 예시)
-SEARCH_SCRIPT = str(Path(__file__).parent / "search_test.py")
-
-def find_url_by_name(exhibition_name: str, timeout_sec: int = 60) -> str:
+def find_url_by_name(exhibition_name: str, site: str = "auma") -> str:
     if not exhibition_name or not exhibition_name.strip():
         return ""
-    base_cmd = [sys.executable, SEARCH_SCRIPT, "--query", exhibition_name.strip(),
-                "--only-url", "--headless"]  # ★ 항상 headless로
     for attempt in (1, 2):  # ★ 한번 재시도
-        try:
-            out = subprocess.check_output(base_cmd, stderr=subprocess.STDOUT,
-                                          timeout=timeout_sec, text=True)
-            urls = _URL_RE.findall(out)
-            if urls:
-                return urls[-1]
-        except Exception as e:
-            print(f"[find_url_by_name] try{attempt} error:", e)
-            # 재시도 루프가 한 번 더 돎
+        url = run_search_site(site, exhibition_name.strip())
+        if url:
+            return url
+        print(f"[find_url_by_name] try{attempt}: no url")
     return ""
 
 def save_record_json_local(record: dict, prefix: str) -> str | None:
@@ -225,6 +215,13 @@ except Exception:
 
 DATASET_COLORS = {1: "#D7263D", 2: "#1B9AAA", 3: "#2E7D32", 4: "#6A1B9A"}  # 1=빨강, 2=파랑, 3=초록
 
+# 상세 페이지 크롤링 설정 (기존 arun 인자: word_count_threshold=1, RegexChunking, 캐시 우회)
+CRAWL_CONFIG = CrawlerRunConfig(
+    word_count_threshold=1,
+    chunking_strategy=RegexChunking(),
+    cache_mode=CacheMode.BYPASS,
+)
+
 # --------------------------------------------------------------------------------------
 # (선택) pydantic 모델 (안 쓰이면 그대로 둬도 무방)
 # --------------------------------------------------------------------------------------
@@ -237,41 +234,40 @@ class PageSummary(BaseModel):
 # --------------------------------------------------------------------------------------
 # 크롤 + 파이프라인 (기존 summarize_url 유지)
 # --------------------------------------------------------------------------------------
-async def crawl_and_summarize(url: str):
+async def crawl_and_summarize(url: str, priority: str = PRIORITY_INTERACTIVE):
     if not url:
         return "URL이 제공되지 않았습니다. 클립보드에 URL이 복사되어 있는지 확인해주세요."
 
-    async with AsyncWebCrawler(verbose=True) as crawler:
-        start_time = time.time()
-        result = await crawler.arun(
-            url=url,
-            word_count_threshold=1,
-            chunking_strategy=RegexChunking(),
-            bypass_cache=True,
-        )
-        raw_md = getattr(result, "markdown", "") or ""
-        text_base = normalize_text(raw_md)
+    start_time = time.time()
+    # 사이트 검색과 같은 공유 브라우저(browser.py)에서 크롤링
+    result = await browser.arun(url, CRAWL_CONFIG)
+    raw_md = getattr(result, "markdown", "") or ""
+    text_base = normalize_text(raw_md)
 
-        record = {"markdown": text_base or "", "source_url": url}
+    record = {"markdown": text_base or "", "source_url": url, "priority": priority}
 
-        bytes_norm = len((text_base or "").encode("utf-8"))
-        print(f"[INFO] 전체 문장 길이: {bytes_norm} bytes")
+    bytes_norm = len((text_base or "").encode("utf-8"))
+    print(f"[INFO] 전체 문장 길이: {bytes_norm} bytes")
 
-        if not record:
-            print("[INFO] 처리할 텍스트가 없습니다.")
-            return
+    if not record:
+        print("[INFO] 처리할 텍스트가 없습니다.")
+        return
 
-        result = run_pipeline_markdown(record)
+    # LLM 호출은 블로킹이므로 스레드에서 실행 (브라우저 루프를 막지 않도록)
+    result = await asyncio.to_thread(run_pipeline_markdown, record)
+    if result:
+        # 크롤링 원문 보관 (prompt.md/모델 변경 후 archive.py reextract로 재추출)
+        result["markdown_sha256"] = put_markdown(text_base)
 
-        total_time = time.time() - start_time
-        print(f"[INFO] 전체 걸린 시간: {total_time:.2f} s")
-        return result
+    total_time = time.time() - start_time
+    print(f"[INFO] 전체 걸린 시간: {total_time:.2f} s")
+    return result
 
-async def summarize_url(url: str) -> Tuple[str, Dict[str, str]] | str:
+async def summarize_url(url: str, priority: str = PRIORITY_INTERACTIVE) -> Tuple[str, Dict[str, str]] | str:
     if not url:
         return "URL이 제공되지 않았습니다. 클립보드에 URL이 복사되어 있는지 확인해주세요."
 
-    result = await crawl_and_summarize(url)
+    result = await crawl_and_summarize(url, priority)
     if isinstance(result, str):
         return result
     if result:
@@ -286,7 +282,7 @@ async def summarize_url(url: str) -> Tuple[str, Dict[str, str]] | str:
             f"{table_md}\n\n"
             "### Raw JSON(정리 후)\n"
             f"{pretty}\n"
-            f"<sub>모델: {result['model']} · 컨텍스트: {result['num_ctx']} · 추출시각(UTC): {result['extracted_at']}</sub>\n"
+            f"<sub>모델: {result['model']} ({result.get('tier', '')}) · 컨텍스트: {result['num_ctx']} · 추출시각(UTC): {result['extracted_at']}</sub>\n"
             f"**JSON 저장:** `{saved_path}`"
         )
         print("[INFO] 처리 완료")
@@ -590,4 +586,6 @@ with gr.Blocks(css=CUSTOM_CSS) as demo:
 # Entrypoint
 # --------------------------------------------------------------------------------------
 if __name__ == "__main__":
-    demo.launch(server_name="127.0.0.1", server_port=7865)
\ No newline at end of file
+    # 모델/브라우저/프롬프트 워밍업 후 실행, 준비 상태는 GET /health
+    from warmup import launch_with_health
+    launch_with_health(demo, server_name="127.0.0.1", server_port=7865)
\ No newline at end of file
@@ -11,11 +11,17 @@ import gradio as gr
 import pyodbc  # SQL 서버 연동을 위해 추가
 import pandas as pd # 엑셀 저장을 위해 추가
 
-from crawl4ai import AsyncWebCrawler
+from crawl4ai import CrawlerRunConfig, CacheMode
 from crawl4ai.chunking_strategy import RegexChunking
 
+import browser               # 검색/크롤링 공유 crawl4ai 브라우저
+
 from llama import *          # LLM 관련 함수 임포트
 from data import *           # 데이터 처리 관련 함수 임포트
+from archive import put_markdown  # 크롤링 마크다운 보관 (내용 주소 gzip)
+from sitesearch.planner import search_planned  # 3개 사이트 다중 검색어 동시 검색 (프로세스 내 호출)
+from sitesearch.ranking import auto_select  # 검색 결과 자동 선택 (점수 기반)
+from gazetteer import city_in, country_in  # 지명 사전 (Aho-Corasick) 도시/국가 인식
 
 # 저장 디렉토리 설정 및 생성
 SAVED_DIR = os.path.abspath(os.path.join(os.getcwd(), "saved"))
@@ -226,47 +232,53 @@ except Exception:
 
 DATASET_COLORS = {1: "#D7263D", 2: "#1B9AAA", 3: "#2E7D32"}  # 1=AUMA(빨강), 2=GEP(파랑), 3=Myfair(초록)
 
+# 상세 페이지 크롤링 설정 (기존 arun 인자: word_count_threshold=1, RegexChunking, 캐시 우회)
+CRAWL_CONFIG = CrawlerRunConfig(
+    word_count_threshold=1,
+    chunking_strategy=RegexChunking(),
+    cache_mode=CacheMode.BYPASS,
+)
+
 
 
 # --------------------------------------------------------------------------------------
 # 웹 크롤링 및 데이터 추출 파이프라인
 # --------------------------------------------------------------------------------------
-async def crawl_and_summarize(url: str):
+async def crawl_and_summarize(url: str, priority: str = PRIORITY_INTERACTIVE):
     if not url:
         return "URL이 제공되지 않았습니다. 클립보드에 URL이 복사되어 있는지 확인해주세요."
 
-    async with AsyncWebCrawler(verbose=True) as crawler:
-        start_time = time.time()
-        result = await crawler.arun(
-            url=url,
-            word_count_threshold=1,           
-            chunking_strategy=RegexChunking(), 
-            bypass_cache=True,                
-        )
-        
-        raw_md = getattr(result, "markdown", "") or ""
-        text_base = normalize_text(raw_md)
+    start_time = time.time()
+    # 사이트 검색과 같은 공유 브라우저(browser.py)에서 크롤링
+    result = await browser.arun(url, CRAWL_CONFIG)
+    
+    raw_md = getattr(result, "markdown", "") or ""
+    text_base = normalize_text(raw_md)
 
-        record = {"markdown": text_base or "", "source_url": url}
+    record = {"markdown": text_base or "", "source_url": url, "priority": priority}
 
-        bytes_norm = len((text_base or "").encode("utf-8"))
-        print(f"[INFO] 추출된 텍스트 길이: {bytes_norm} bytes")
+    bytes_norm = len((text_base or "").encode("utf-8"))
+    print(f"[INFO] 추출된 텍스트 길이: {bytes_norm} bytes")
 
-        if not record:
-            print("[INFO] 처리할 텍스트가 없습니다.")
-            return
+    if not record:
+        print("[INFO] 처리할 텍스트가 없습니다.")
+        return
 
-        result = run_pipeline_markdown(record)
+    # LLM 호출은 블로킹이므로 스레드에서 실행 (브라우저 루프를 막지 않도록)
+    result = await asyncio.to_thread(run_pipeline_markdown, record)
+    if result:
+        # 크롤링 원문 보관 (prompt.md/모델 변경 후 archive.py reextract로 재추출)
+        result["markdown_sha256"] = put_markdown(text_base)
 
-        total_time = time.time() - start_time
-        print(f"[INFO] 전체 처리 시간: {total_time:.2f} s")
-        return result
+    total_time = time.time() - start_time
+    print(f"[INFO] 전체 처리 시간: {total_time:.2f} s")
+    return result
 
-async def summarize_url(url: str) -> Tuple[str, Dict[str, str]] | str:
+async def summarize_url(url: str, priority: str = PRIORITY_INTERACTIVE) -> Tuple[str, Dict[str, str]] | str:
     if not url:
         return "URL이 제공되지 않았습니다. 클립보드에 URL이 복사되어 있는지 확인해주세요."
 
-    result = await crawl_and_summarize(url)
+    result = await crawl_and_summarize(url, priority)
     if isinstance(result, str):
         return result  
         
@@ -283,7 +295,7 @@ async def summarize_url(url: str) -> Tuple[str, Dict[str, str]] | str:
             f"{table_md}\n\n"
             "### Raw JSON(정리 후)\n"
             f"{pretty}\n"
-            f"<sub>모델: {result['model']} · 컨텍스트: {result['num_ctx']} · 추출시각(UTC): {result['extracted_at']}</sub>\n"
+            f"<sub>모델: {result['model']} ({result.get('tier', '')}) · 컨텍스트: {result['num_ctx']} · 추출시각(UTC): {result['extracted_at']}</sub>\n"
             f"**JSON 저장:** `{saved_path}`"
         )
         print("[INFO] URL 처리 완료")
@@ -293,348 +305,6 @@ async def summarize_url(url: str) -> Tuple[str, Dict[str, str]] | str:
 
 
 
-# --------------------------------------------------------------------------------------
-# 3개 전시회 사이트 검색 함수
-# --------------------------------------------------------------------------------------
-def search_auma(exhibition: str) -> List[Dict[str, str]]:
-    """
-    AUMA 사이트에서 전시회 검색하여 여러 결과 반환
-    
-    Returns:
-        List[Dict[str, str]]: 검색 결과 리스트 (display_text, url, year, month, city, country)
-    """
-    try:
-        import time
-        import re
-        from selenium import webdriver
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.common.keys import Keys
-        from selenium.webdriver.chrome.service import Service
-        from webdriver_manager.chrome import ChromeDriverManager
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.common.exceptions import TimeoutException
-
-        search_query = exhibition.strip()
-        results = []
-        
-        options = webdriver.ChromeOptions()
-        options.add_argument("--headless=new")
-        options.add_argument("--window-size=1920,1080")
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("--start-maximized")
-
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
-
-        try:
-            driver.get("https://www.auma.de/en/")
-            time.sleep(0.1)
-
-            search_box = driver.find_element(By.ID, "searchText")
-            search_box.send_keys(search_query)
-            time.sleep(0.1)
-            search_box.send_keys(Keys.ENTER)
-
-            wait = WebDriverWait(driver, 20)
-            wait.until(EC.presence_of_element_located((By.CLASS_NAME, "trade-fair-result")))
-
-            row_xpath = "//tbody[@class='trade-fair-result__body']/tr[@class='trade-fair-result__row']"
-            all_rows = driver.find_elements(By.XPATH, row_xpath)
-            
-            if not all_rows:
-                print("[AUMA] no search results found")
-                return []
-
-            month_map = {
-                'January': 1, 'February': 2, 'March': 3, 'April': 4, 'May': 5, 'June': 6,
-                'July': 7, 'August': 8, 'September': 9, 'October': 10, 'November': 11, 'December': 12
-            }
-
-            for i, row in enumerate(all_rows):
-                try:
-                    # Re-find the row to avoid stale element reference
-                    current_row = driver.find_element(By.XPATH, f"({row_xpath})[{i+1}]")
-                    
-                    date_text = current_row.find_element(By.CLASS_NAME, "trade-fair-result__cell--strTermin").text
-                    link_element = current_row.find_element(By.CLASS_NAME, "trade-fair-result__link")
-                    link_text = link_element.text
-                    link_href = link_element.get_attribute('href')
-                    city_text = current_row.find_element(By.CLASS_NAME, "trade-fair-result__cell--strStadt").text
-                    country_text = current_row.find_element(By.CLASS_NAME, "trade-fair-result__cell--strLand").text
-                    
-                    combined_text = f"{link_text} {city_text} {country_text}"
-                    query_words = search_query.split()
-                    # 유연한 검색: 검색어 중 하나라도 포함되면 결과에 포함 (OR 조건)
-                    title_contains_query = any(word.lower() in combined_text.lower() for word in query_words)
-
-                    if title_contains_query:
-                        # 날짜 정보 추출
-                        year = 0
-                        month = 0
-                        year_match = re.search(r'(20\d{2})', date_text)
-                        if year_match:
-                            year = int(year_match.group(1))
-                            for name, num in month_map.items():
-                                if name.lower() in date_text.lower(): 
-                                    month = num; break
-                            if month == 0:
-                                month_num_match = re.search(r'\.(\d{2})\.', date_text)
-                                if month_num_match: month = int(month_num_match.group(1))
-
-                        # 표시 텍스트 생성
-                        display_text = f"{link_text}"
-                        if year:
-                            display_text += f" {year}"
-                        if city_text:
-                            display_text += f" - {city_text}"
-                        if country_text:
-                            display_text += f" ({country_text})"
-
-                        results.append({
-                            'display_text': display_text,
-                            'url': link_href,
-                            'year': year,
-                            'month': month,
-                            'city': city_text,
-                            'country': country_text,
-                            'title': link_text
-                        })
-                        
-                except Exception as e:
-                    print(f"[AUMA] error processing row {i+1}: {e}")
-                    continue
-
-            print(f"[AUMA] found {len(results)} results")
-            return results
-
-        finally:
-            driver.quit()
-
-    except Exception as e:
-        print(f"[AUMA 검색 오류] {e}")
-        return []
-
-def search_gep(exhibition: str) -> List[Dict[str, str]]:
-    """
-    GEP 사이트에서 전시회 검색하여 여러 결과 반환
-    
-    Returns:
-        List[Dict[str, str]]: 검색 결과 리스트 (display_text, url, year, month, title)
-    """
-    try:
-        import time
-        import re
-        from selenium import webdriver
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.common.keys import Keys
-        from selenium.webdriver.chrome.service import Service
-        from webdriver_manager.chrome import ChromeDriverManager
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.common.exceptions import TimeoutException
-
-        search_query = exhibition.strip()
-        results = []
-        
-        options = webdriver.ChromeOptions()
-        options.add_argument("--headless=new")
-        options.add_argument("--window-size=1920,1080")
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("--start-maximized")
-
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
-
-        try:
-            driver.get("https://www.gep.or.kr/gept/ovrss/main/mainPage.do")
-            time.sleep(0.1)
-
-            search_box = driver.find_element(By.ID, "topQuery")
-            search_box.send_keys(search_query)
-            time.sleep(0.1)
-            search_box.send_keys(Keys.ENTER)
-
-            wait = WebDriverWait(driver, 20)
-            wait.until(EC.presence_of_element_located((By.XPATH, "//*[@id='totalSearchView']//a")))
-
-            all_items = driver.find_elements(By.CLASS_NAME, "text-info")
-            
-            if not all_items:
-                return []
-
-            for item in all_items:
-                try:
-                    date_div = item.find_element(By.CLASS_NAME, "info-date")
-                    date_text = date_div.text
-                    link_element = item.find_element(By.CSS_SELECTOR, ".info-title a")
-                    link_text = link_element.text
-                    link_href = link_element.get_attribute('href')
-                    
-                    query_words = search_query.split()
-                    # 유연한 검색: 검색어 중 하나라도 포함되면 결과에 포함 (OR 조건)
-                    title_contains_query = any(word in link_text for word in query_words)
-
-                    if title_contains_query:
-                        # 날짜 정보 추출
-                        year = 0
-                        month = 0
-                        year_match = re.search(r'(20\d{2})', date_text)
-                        month_match = re.search(r'-(\d{2})-', date_text)
-
-                        if year_match and month_match:
-                            year = int(year_match.group(1))
-                            month = int(month_match.group(1))
-
-                        # 표시 텍스트 생성
-                        display_text = f"{link_text}"
-                        if year:
-                            display_text += f" {year}"
-                        if month:
-                            display_text += f".{month:02d}"
-
-                        # JavaScript 링크 처리를 위한 URL 생성
-                        final_url = link_href
-                        if link_href and link_href.startswith("javascript:"):
-                            match = re.search(r"viewOverseasExhibition\('([^']+)'\)", link_href)
-                            if match:
-                                exhibition_id = match.group(1)
-                                final_url = f"https://www.gep.or.kr/gept/ovrss/sear/selectOverseasExhibitionView.do?exhbId={exhibition_id}"
-
-                        results.append({
-                            'display_text': display_text,
-                            'url': final_url,
-                            'year': year,
-                            'month': month,
-                            'title': link_text,
-                            'original_url': link_href
-                        })
-                        
-                except Exception as e:
-                    print(f"[GEP] error processing item: {e}")
-                    continue
-
-            print(f"[GEP] found {len(results)} results")
-            return results
-
-        finally:
-            driver.quit()
-
-    except Exception as e:
-        print(f"[GEP 검색 오류] {e}")
-        return []
-
-def search_myfair(exhibition: str) -> List[Dict[str, str]]:
-    """
-    Myfair 사이트에서 전시회 검색하여 여러 결과 반환
-    
-    Returns:
-        List[Dict[str, str]]: 검색 결과 리스트 (display_text, url, year, month, title)
-    """
-    try:
-        import time
-        import re
-        from selenium import webdriver
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.common.keys import Keys
-        from selenium.webdriver.chrome.service import Service
-        from webdriver_manager.chrome import ChromeDriverManager
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.common.exceptions import TimeoutException
-
-        search_query = exhibition.strip()
-        results = []
-        
-        options = webdriver.ChromeOptions()
-        options.add_argument("--headless=new")
-        options.add_argument("--window-size=1920,1080")
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("--start-maximized")
-
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
-
-        try:
-            driver.get("https://myfair.co/")
-            time.sleep(0.1)
-
-            search_box = driver.find_element(By.XPATH, "//input[@placeholder='박람회명 검색']")
-            search_box.send_keys(search_query)
-            time.sleep(0.1)
-            search_box.send_keys(Keys.ENTER)
-
-            wait = WebDriverWait(driver, 20)
-            wait.until(EC.presence_of_element_located((By.CLASS_NAME, "css-azmimp")))
-
-            xpath_selector = "//div[@class='css-1byidqq' and .//span[@class='css-1nutr9u']]"
-            all_cards = driver.find_elements(By.XPATH, xpath_selector)
-            
-            if not all_cards:
-                print("[Myfair] no search results found")
-                return []
-
-            for card in all_cards:
-                try:
-                    date_span = card.find_element(By.CLASS_NAME, "css-1nutr9u")
-                    date_text = date_span.text
-                    link_element = card.find_element(By.XPATH, ".//a[contains(@class, 'text-md')]")
-                    link_text = link_element.text
-                    link_href = link_element.get_attribute('href')
-                    
-                    query_words = search_query.split()
-                    # 유연한 검색: 검색어 중 하나라도 포함되면 결과에 포함 (OR 조건)
-                    title_contains_query = any(word in link_text for word in query_words)
-
-                    if title_contains_query:
-                        # 날짜 정보 추출
-                        year = 0
-                        month = 0
-                        year_match = re.search(r'(20\d{2})', date_text)
-                        month_match = re.search(r'(\d{1,2})월', date_text)
-                        
-                        if year_match:
-                            year = int(year_match.group(1))
-                        if month_match:
-                            month = int(month_match.group(1))
-
-                        # 표시 텍스트 생성
-                        display_text = f"{link_text}"
-                        if year:
-                            display_text += f" {year}"
-                        if month:
-                            display_text += f".{month}월"
-
-                        results.append({
-                            'display_text': display_text,
-                            'url': link_href,
-                            'year': year,
-                            'month': month,
-                            'title': link_text
-                        })
-                        
-                except Exception as e:
-                    print(f"[Myfair] error processing card: {e}")
-                    continue
-
-            print(f"[Myfair] found {len(results)} results")
-            return results
-
-        finally:
-            driver.quit()
-
-    except Exception as e:
-        print(f"[Myfair 검색 오류] {e}")
-        return []
-
-
-
 # --------------------------------------------------------------------------------------
 # 다중 URL 비교 및 병합 도우미 함수
 # --------------------------------------------------------------------------------------
@@ -644,12 +314,13 @@ def search_myfair(exhibition: str) -> List[Dict[str, str]]:
 
 
 
-def _extract_multiple_parallel(urls: List[str]) -> List[Dict[str, str]]:
+def _extract_multiple_parallel(urls: List[str], priority: str = PRIORITY_INTERACTIVE) -> List[Dict[str, str]]:
     """
     여러 URL을 병렬로 동시에 추출하여 성능 향상
     
     Args:
         urls (List[str]): 추출할 URL 리스트
+        priority (str): LLM 대기열 우선순위 (UI 클릭=interactive, 일괄 실행=batch)
         
     Returns:
         List[Dict[str, str]]: 추출된 데이터 리스트 (URL 순서대로)
@@ -665,7 +336,7 @@ def _extract_multiple_parallel(urls: List[str]) -> List[Dict[str, str]]:
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         try:
-            res = loop.run_until_complete(summarize_url(url))
+            res = loop.run_until_complete(summarize_url(url, priority))
         finally:
             loop.close()
         
@@ -676,7 +347,9 @@ def _extract_multiple_parallel(urls: List[str]) -> List[Dict[str, str]]:
     
     results = [{}] * len(urls)
     
-    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+    # LLM 동시 실행 수는 llama.LIMITER가 지연/오류에 맞춰 조절하므로 스레드는 URL 수만큼 띄우고
+    # 크롤링은 바로 시작, LLM 호출 단계에서만 대기
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(urls))) as executor:
         future_to_idx = {
             executor.submit(extract_single, i): i 
             for i in range(len(urls))
@@ -691,30 +364,33 @@ def _extract_multiple_parallel(urls: List[str]) -> List[Dict[str, str]]:
                 print(f"[병렬 추출 오류] URL {idx+1}: {e}")
                 results[idx] = {}
     
+    print(f"[limiter] {LIMITER.stats()}")
+    print(f"[dispatcher] {DISPATCHER.stats()}")
     return results
 
 
 
-def search_three_sites_for_one(korean_name: str, english_name: str):
+def search_three_sites_for_one(korean_name: str, english_name: str, abbreviation: str = ""):
     """
-    하나의 전시회에 대해 3개 사이트에서 언어에 맞춰 검색
+    하나의 전시회에 대해 3개 사이트를 국문/영문/약자/연도 제거 검색어로 동시에 검색
     
     Args:
-        korean_name (str): 전시회 국문명 (GEP, Myfair 검색용)
-        english_name (str): 전시회 영문명 (AUMA 검색용)
+        korean_name (str): 전시회 국문명
+        english_name (str): 전시회 영문명
+        abbreviation (str): 전시회 약자 (DB NameAbbreviation, 없으면 "")
         
     Returns:
         tuple: (AUMA 결과 리스트, GEP 결과 리스트, Myfair 결과 리스트)
     """
     print("-" * 50)
-    print(f"[검색 시작] 국문: '{korean_name}', 영문: '{english_name}'")
+    print(f"[검색 시작] 국문: '{korean_name}', 영문: '{english_name}', 약자: '{abbreviation}'")
 
-    # 각 사이트의 특성에 맞춰 검색어 선택
-    # AUMA: 독일 사이트이므로 영문명으로 검색
-    # GEP, Myfair: 한국 사이트이므로 국문명으로 검색
-    results_auma = search_auma(english_name)
-    results_gep = search_gep(korean_name)
-    results_myfair = search_myfair(korean_name)
+    # 사이트별 검색어 변형을 동시에 검색하고 URL 기준으로 병합 (sitesearch/planner.py)
+    # AUMA는 영문명, GEP/Myfair는 국문명을 먼저 사용
+    results = search_planned(korean_name, english_name, abbreviation)
+    results_auma = results.get("auma", [])
+    results_gep = results.get("gep", [])
+    results_myfair = results.get("myfair", [])
 
     print(f"[검색 결과] AUMA: {len(results_auma)}개, GEP: {len(results_gep)}개, Myfair: {len(results_myfair)}개")
     return results_auma, results_gep, results_myfair
@@ -818,6 +494,73 @@ def extract_selected_urls(auma_choice: str, results_auma: List[Dict],
     
     return url_auma, url_gep, url_myfair
 
+def auto_select_choices(results_auma: List[Dict], results_gep: List[Dict], results_myfair: List[Dict],
+                        korean_name: str, english_name: str, abbreviation: str = "", city: str = "",
+                        country: str = "") -> Tuple[str, str, str]:
+    """
+    사이트별 검색 결과에서 점수가 임계값(AUTO_SELECT_THRESHOLD) 이상인 최고점 항목을 골라
+    드롭다운 선택값 형식("1. ...")으로 반환 (없으면 "선택 안함")
+    
+    Returns:
+        tuple: (AUMA 선택값, GEP 선택값, Myfair 선택값)
+    """
+    by_site = {"auma": results_auma, "gep": results_gep, "myfair": results_myfair}
+    picks = auto_select(by_site, korean_name, english_name, abbreviation, city=city, country=country)
+    choices = []
+    for site, results in by_site.items():
+        idx, _ = picks[site]
+        choices.append(f"{idx+1}. {results[idx]['display_text']}" if idx >= 0 else "선택 안함")
+    return tuple(choices)
+
+def run_headless_pipeline(search_term: str, connection=None, save: bool = True) -> Dict:
+    """
+    UI 없이 검색 → 자동 선택 → 추출까지 한 번에 실행 (배치/무인 실행용)
+    
+    Args:
+        search_term (str): 전시회명 (DB 연결이 있으면 DB 첫 결과의 국문/영문/약자 사용)
+        connection: 데이터베이스 연결 객체 (없으면 검색어로 직접 검색)
+        save (bool): 결과 엑셀 저장 여부
+        
+    Returns:
+        Dict: search_and_extract_single()과 같은 구조 + auto_selected / excel_path
+    """
+    exhibitions = search_exhibition_in_db(search_term, connection) if connection else []
+    if exhibitions:
+        ex = exhibitions[0]
+        korean_name, english_name = ex['korean_name'], ex['english_name']
+        abbreviation = ex.get('NameAbbreviation', '')
+        city, country = extract_city_from_exhibition(ex), extract_country_from_exhibition(ex)
+    else:
+        korean_name = english_name = search_term
+        abbreviation, city, country = "", "", ""
+
+    results_auma, results_gep, results_myfair = search_three_sites_for_one(korean_name, english_name, abbreviation)
+    choices = auto_select_choices(results_auma, results_gep, results_myfair, korean_name, english_name, abbreviation,
+                                  city, country)
+
+    search_data = {
+        "korean_name": korean_name,
+        "english_name": english_name,
+        "AUMA": {},
+        "GEP": {},
+        "Myfair": {},
+        "db_results": exhibitions,
+        "search_results": {
+            "auma": results_auma,
+            "gep": results_gep,
+            "myfair": results_myfair
+        }
+    }
+    if all(c == "선택 안함" for c in choices):
+        print(f"[headless] '{search_term}': 자동 선택된 결과 없음")
+        return search_data
+
+    _, result_data = extract_from_selected_choices(*choices, search_data, priority=PRIORITY_BATCH)
+    result_data["auto_selected"] = dict(zip(["AUMA", "GEP", "Myfair"], choices))
+    if save:
+        result_data["excel_path"] = save_merged_excel([result_data], "headless_result")
+    return result_data
+
 def search_exhibition_in_db(search_term: str, connection=None) -> List[Dict[str, str]]:
     """
     데이터베이스에서 전시회명으로 검색 (국문명/영문명 모두 대상)
@@ -1084,34 +827,47 @@ def extract_city_from_exhibition(exhibition: Dict[str, str]) -> str:
         exhibition (Dict[str, str]): 전시회 정보
         
     Returns:
-        str: 도시 이름
+        str: 도시 이름 (지명 사전의 영문 표준명, 예: "Seoul")
     """
-    # official_site에서 도시 정보 추출 시도
-    official_site = exhibition.get('official_site', '')
-    if official_site:
-        import re
-        # 도시 관련 키워드 검색
-        city_keywords = ['Seoul', 'Busan', 'Incheon', 'Daegu', 'Daejeon', 'Gwangju', 'Ulsan', 'Suwon', 'Goyang', 
-                        '서울', '부산', '인천', '대구', '대전', '광주', '울산', '수원', '고양',
-                        'New York', 'Los Angeles', 'Chicago', 'Houston', 'Phoenix', 'Philadelphia',
-                        'San Antonio', 'San Diego', 'Dallas', 'San Jose', 'Austin', 'Jacksonville',
-                        'Frankfurt', 'Munich', 'Berlin', 'Hamburg', 'Cologne', 'Düsseldorf',
-                        'Paris', 'Lyon', 'Marseille', 'Toulouse', 'Nice', 'Nantes',
-                        'London', 'Birmingham', 'Manchester', 'Glasgow', 'Liverpool', 'Leeds',
-                        'Tokyo', 'Osaka', 'Nagoya', 'Sapporo', 'Kobe', 'Kyoto']
+    # official_site(URL)는 단어가 붙어 있으므로 경계 없이, 다른 필드는 단어 경계 기준으로 지명 사전 검색
+    city = city_in(exhibition.get('official_site', '') or '', boundaries=False)
+    if city:
+        return city
+    for field in ['host_institution', 'exhibit_item']:
+        city = city_in(exhibition.get(field, '') or '')
+        if city:
+            return city
+    
+    return ""
+
+# 국가 코드 최상위 도메인 → 국가 (공식 홈페이지 주소에 지명이 없을 때)
+_TLD_COUNTRIES = {
+    'kr': 'South Korea', 'de': 'Germany', 'jp': 'Japan', 'fr': 'France', 'uk': 'United Kingdom',
+    'cn': 'China', 'it': 'Italy', 'es': 'Spain', 'nl': 'Netherlands', 'sg': 'Singapore',
+}
+
+def extract_country_from_exhibition(exhibition: Dict[str, str]) -> str:
+    """
+    전시회 정보에서 국가 정보 추출 (검색 결과 자동 선택의 도시/국가 일치도용)
+    
+    Args:
+        exhibition (Dict[str, str]): 전시회 정보
         
-        for city in city_keywords:
-            if city.lower() in official_site.lower():
-                return city
-    
-    # 다른 필드에서 도시 정보 추출 시도
-    for field in ['host_institution', 'ExhibitItem']:
-        text = exhibition.get(field, '')
-        if text:
-            for city in ['Seoul', 'Busan', 'Incheon', 'Daegu', 'Daejeon', 'Gwangju', 'Ulsan', 'Suwon', 'Goyang',
-                        '서울', '부산', '인천', '대구', '대전', '광주', '울산', '수원', '고양']:
-                if city in text:
-                    return city
+    Returns:
+        str: 국가 이름 (지명 사전의 영문 표준명, 예: "South Korea")
+    """
+    official_site = exhibition.get('official_site', '') or ''
+    country = country_in(official_site, boundaries=False)
+    if country:
+        return country
+    # 주소에 지명이 없으면 국가 코드 도메인 (.kr / .co.kr / .de ...)
+    host = re.sub(r'^[a-z]+://', '', official_site.strip().lower()).split('/')[0].split(':')[0]
+    if '.' in host and host.rsplit('.', 1)[-1] in _TLD_COUNTRIES:
+        return _TLD_COUNTRIES[host.rsplit('.', 1)[-1]]
+    for field in ['host_institution', 'exhibit_item']:
+        country = country_in(exhibition.get(field, '') or '')
+        if country:
+            return country
     
     return ""
 
@@ -1196,13 +952,11 @@ def search_and_extract_single(search_term: str, connection=None):
         korean_name = ex['korean_name']
         english_name = ex['english_name']
         print(f"[DB 검색 성공] '{korean_name}' 찾음. 3사이트 검색 시작...")
-        results_auma, results_gep, results_myfair = search_three_sites_for_one(korean_name, english_name)
+        results_auma, results_gep, results_myfair = search_three_sites_for_one(korean_name, english_name, ex.get('NameAbbreviation', ''))
     else:
         # DB에 결과가 없는 경우: 검색어로 직접 검색
         print(f"[DB 검색 실패] '{search_term}' 없음. 3사이트 직접 검색 시작...")
-        results_auma = search_auma(search_term)
-        results_gep = search_gep(search_term)
-        results_myfair = search_myfair(search_term)
+        results_auma, results_gep, results_myfair = search_three_sites_for_one(search_term, search_term)
     
     # 3. 검색 결과를 드롭다운으로 표시
     dropdowns_html = render_search_results_dropdowns(results_auma, results_gep, results_myfair)
@@ -1227,7 +981,8 @@ def search_and_extract_single(search_term: str, connection=None):
     
     return final_html, result_data
 
-def extract_from_selected_choices(auma_choice: str, gep_choice: str, myfair_choice: str, search_data: Dict):
+def extract_from_selected_choices(auma_choice: str, gep_choice: str, myfair_choice: str, search_data: Dict,
+                                  priority: str = PRIORITY_INTERACTIVE):
     """
     사용자가 선택한 드롭다운 항목으로 데이터 추출
     
@@ -1236,6 +991,7 @@ def extract_from_selected_choices(auma_choice: str, gep_choice: str, myfair_choi
         gep_choice: GEP 드롭다운 선택값
         myfair_choice: Myfair 드롭다운 선택값
         search_data: 이전 검색 결과 데이터
+        priority: LLM 대기열 우선순위 (기본 interactive)
         
     Returns:
         tuple: (표시용 HTML, 결과 데이터)
@@ -1255,7 +1011,7 @@ def extract_from_selected_choices(auma_choice: str, gep_choice: str, myfair_choi
     urls = [url_auma, url_gep, url_myfair]
     
     # 선택된 URL들에서 병렬로 정보 추출
-    records = _extract_multiple_parallel(urls)
+    records = _extract_multiple_parallel(urls, priority)
     rec_auma, rec_gep, rec_myfair = records
     
     # 각 사이트 결과를 개별 표로 생성
@@ -1314,7 +1070,7 @@ def process_selected_exhibition(selected_index: float, exhibitions_list: List[Di
     else:
         # 검색기능 활성화: 3사이트 검색 및 추출
         print(f"[선택된 전시회] '{korean_name}' 3사이트 검색 시작...")
-        url_auma, url_gep, url_myfair = search_three_sites_for_one(korean_name, english_name)
+        url_auma, url_gep, url_myfair = search_three_sites_for_one(korean_name, english_name, selected_exhibition.get('NameAbbreviation', ''))
         urls = [url_auma, url_gep, url_myfair]
         
         # 병렬로 정보 추출
@@ -1606,14 +1362,14 @@ with gr.Blocks(css=CUSTOM_CSS) as demo:
                         db_html = "<div style='color: var(--body-text-color-subdued); margin-bottom: 10px;'>📋 데이터베이스에 해당 전시회가 없습니다. 3사이트에서 직접 검색합니다.</div>"
                         # DB에 결과가 없는 경우: 검색어로 직접 3사이트 검색
                         print(f"[DB 검색 실패] '{search_term}' 없음. 3사이트 직접 검색 시작...")
-                        results_auma = search_auma(search_term)
-                        results_gep = search_gep(search_term)
-                        results_myfair = search_myfair(search_term)
+                        results_auma, results_gep, results_myfair = search_three_sites_for_one(search_term, search_term)
                         
                         # 드롭다운 옵션 생성
                         auma_choices = ["선택 안함"] + [f"{i+1}. {result['display_text']}" for i, result in enumerate(results_auma)]
                         gep_choices = ["선택 안함"] + [f"{i+1}. {result['display_text']}" for i, result in enumerate(results_gep)]
                         myfair_choices = ["선택 안함"] + [f"{i+1}. {result['display_text']}" for i, result in enumerate(results_myfair)]
+                        # 점수 기반 자동 선택값 (임계값 미달이면 "선택 안함")
+                        auma_pick, gep_pick, myfair_pick = auto_select_choices(results_auma, results_gep, results_myfair, search_term, search_term)
                         
                         # 드롭다운 HTML 생성
                         dropdowns_html = render_search_results_dropdowns(results_auma, results_gep, results_myfair)
@@ -1638,9 +1394,9 @@ with gr.Blocks(css=CUSTOM_CSS) as demo:
                         
                         return (final_html,
                                gr.update(choices=["선택 안함"], visible=False),
-                               gr.update(choices=auma_choices, visible=True),
-                               gr.update(choices=gep_choices, visible=True),
-                               gr.update(choices=myfair_choices, visible=True),
+                               gr.update(choices=auma_choices, value=auma_pick, visible=True),
+                               gr.update(choices=gep_choices, value=gep_pick, visible=True),
+                               gr.update(choices=myfair_choices, value=myfair_pick, visible=True),
                                gr.update(visible=False), # DB 선택 컬럼
                                gr.update(visible=True),  # 사이트 드롭다운 컬럼
                                gr.update(visible=True),  # 추출 버튼
@@ -1681,12 +1437,17 @@ with gr.Blocks(css=CUSTOM_CSS) as demo:
                     english_name = selected_exhibition['english_name']
                     
                     print(f"[선택된 전시회] '{korean_name}' 3사이트 검색 시작...")
-                    results_auma, results_gep, results_myfair = search_three_sites_for_one(korean_name, english_name)
+                    results_auma, results_gep, results_myfair = search_three_sites_for_one(korean_name, english_name, selected_exhibition.get('NameAbbreviation', ''))
                     
                     # 드롭다운 옵션 생성
                     auma_choices = ["선택 안함"] + [f"{i+1}. {result['display_text']}" for i, result in enumerate(results_auma)]
                     gep_choices = ["선택 안함"] + [f"{i+1}. {result['display_text']}" for i, result in enumerate(results_gep)]
                     myfair_choices = ["선택 안함"] + [f"{i+1}. {result['display_text']}" for i, result in enumerate(results_myfair)]
+                    # 점수 기반 자동 선택값 (임계값 미달이면 "선택 안함")
+                    auma_pick, gep_pick, myfair_pick = auto_select_choices(
+                        results_auma, results_gep, results_myfair, korean_name, english_name,
+                        selected_exhibition.get('NameAbbreviation', ''), extract_city_from_exhibition(selected_exhibition),
+                        extract_country_from_exhibition(selected_exhibition))
                     
                     # 드롭다운 HTML 생성
                     dropdowns_html = render_search_results_dropdowns(results_auma, results_gep, results_myfair)
@@ -1707,9 +1468,9 @@ with gr.Blocks(css=CUSTOM_CSS) as demo:
                     }
                     
                     return (dropdowns_html,
-                           gr.update(choices=auma_choices, visible=True),
-                           gr.update(choices=gep_choices, visible=True),
-                           gr.update(choices=myfair_choices, visible=True),
+                           gr.update(choices=auma_choices, value=auma_pick, visible=True),
+                           gr.update(choices=gep_choices, value=gep_pick, visible=True),
+                           gr.update(choices=myfair_choices, value=myfair_pick, visible=True),
                            gr.update(visible=True),  # 사이트 드롭다운 컬럼
                            gr.update(visible=True),  # 추출 버튼
                            [selected_exhibition],  # s_web_exhibitions 업데이트
@@ -1800,4 +1561,6 @@ with gr.Blocks(css=CUSTOM_CSS) as demo:
     )
 
 if __name__ == "__main__":
-    demo.launch(server_name="127.0.0.1", server_port=7869)
+    # 모델/브라우저/프롬프트 워밍업 후 실행, 준비 상태는 GET /health
+    from warmup import launch_with_health
+    launch_with_health(demo, server_name="127.0.0.1", server_port=7869)
@@ -0,0 +1,183 @@
+# match_result.py
+# -*- coding: utf-8 -*-
+"""
+퍼지 매칭 결과 (FuzzyExhibitionMatcher.match의 반환값)
+
+매칭 쌍, 점수, 항목별 일치 여부를 압축 배열로 들고 있다가
+필요한 페이지만 Markdown으로 그리거나 CSV/XLSX/JSONL로 한 줄씩 내보낸다.
+
+    res = matcher.match(base, target)
+    res.render_page(1)                  # 1페이지 Markdown (요약 + 상세 차이표)
+    res.to_csv("outputs/match.csv")     # 전체 내보내기 (to_xlsx / to_jsonl 동일)
+"""
+import os
+import csv
+import json
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# ==== 설정 ===================================================================
+MATCH_PAGE_SIZE = int(os.getenv("MATCH_PAGE_SIZE", "50"))   # 한 페이지에 그릴 매칭 쌍 수
+
+KR_KEY = "전시회 국문명"
+EN_KEY = "영문명(Full Name)"
+
+# ==== 결과 ===================================================================
+class MatchResult:
+    """
+    매칭 결과
+    - base/target: 매칭된 레코드 (같은 순번끼리 한 쌍)
+    - scores: 점수 배열 (array('d'))
+    - equal: 항목별 일치 여부 (bytearray, 쌍 i의 항목 k = equal[i * len(keys) + k])
+    """
+
+    def __init__(self, keys: List[str], threshold: float = 0.0, weight_kr: float = 0.0, weight_en: float = 0.0):
+        self.keys = list(keys)
+        self.threshold = threshold
+        self.weight_kr = weight_kr
+        self.weight_en = weight_en
+        self.base: List[Dict[str, Any]] = []
+        self.target: List[Dict[str, Any]] = []
+        self.scores = array("d")
+        self.equal = bytearray()
+
+    @classmethod
+    def from_pairs(cls, pairs, keys: List[str], threshold: float = 0.0,
+                   weight_kr: float = 0.0, weight_en: float = 0.0) -> "MatchResult":
+        res = cls(keys, threshold, weight_kr, weight_en)
+        for a, b, s in pairs:
+            res.add(a, b, s)
+        return res
+
+    def add(self, a: Dict[str, Any], b: Dict[str, Any], score: float):
+        self.base.append(a)
+        self.target.append(b)
+        self.scores.append(score)
+        self.equal.extend(str(a.get(k, "")) == str(b.get(k, "")) for k in self.keys)
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def __iter__(self) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any], float]]:
+        for i in range(len(self)):
+            yield self.pair(i)
+
+    def pair(self, i: int) -> Tuple[Dict[str, Any], Dict[str, Any], float]:
+        return self.base[i], self.target[i], self.scores[i]
+
+    def equal_flags(self, i: int) -> bytearray:
+        n = len(self.keys)
+        return self.equal[i * n:(i + 1) * n]
+
+    def diff_keys(self, i: int) -> List[str]:
+        """쌍 i에서 값이 다른 항목"""
+        return [k for k, eq in zip(self.keys, self.equal_flags(i)) if not eq]
+
+    # ---------- Markdown (페이지 단위) ----------
+    def page_count(self, page_size: int = MATCH_PAGE_SIZE) -> int:
+        return max(1, -(-len(self) // max(1, page_size)))
+
+    def _page_range(self, page: int, page_size: int) -> range:
+        page = min(max(1, page), self.page_count(page_size))
+        start = (page - 1) * page_size
+        return range(start, min(len(self), start + page_size))
+
+    def diff_table(self, i: int) -> str:
+        """쌍 i의 항목별 비교 표 (값이 다르면 빨간색)"""
+        a, b, _ = self.pair(i)
+        lines = ["| 항목 | DB | 비교 데이터 |\n|---|---|---|"]
+        for k, eq in zip(self.keys, self.equal_flags(i)):
+            v2 = str(b.get(k, ""))
+            if not eq:
+                v2 = f'<span style="color:red">{v2}</span>'
+            lines.append(f"| {k} | {a.get(k, '')} | {v2} |")
+        return "\n".join(lines) + "\n"
+
+    def render_page(self, page: int = 1, page_size: int = MATCH_PAGE_SIZE) -> str:
+        """page번째 페이지의 매칭 요약 + 상세 차이표 (Markdown)"""
+        if not len(self):
+            return f"퍼지 임계치 {self.threshold} 기준으로 매칭된 항목이 없습니다."
+        rows = self._page_range(page, page_size)
+
+        out = [f"### 매칭 결과 요약 (임계치={self.threshold}, KR:{self.weight_kr}, EN:{self.weight_en})",
+               "| DB | 사이트 데이터 | 매칭점수 |\n|---|---|---|"]
+        for i in rows:
+            a, b, s = self.pair(i)
+            out.append(f"| {a.get(KR_KEY,'')} / {a.get(EN_KEY,'')} | "
+                       f"{b.get(KR_KEY,'')} / {b.get(EN_KEY,'')} | {s:.2f} |")
+
+        # 상세 차이 표
+        for i in rows:
+            a, b, s = self.pair(i)
+            out.append(f"\n---\n#### #{i + 1}. `{a.get(KR_KEY,'')}` ↔ `{b.get(KR_KEY,'')}` (score: {s:.2f})")
+            out.append(self.diff_table(i))
+
+        pages = self.page_count(page_size)
+        if pages > 1:
+            cur = rows.start // page_size + 1
+            out.append(f"\n<sub>페이지 {cur}/{pages} · 전체 {len(self)}건 "
+                       f"(다른 페이지는 render_page, 전체는 to_csv/to_xlsx/to_jsonl)</sub>")
+        return "\n".join(out)
+
+    # ---------- 내보내기 (한 줄씩) ----------
+    def header(self) -> List[str]:
+        cols = ["No.", "매칭점수", "다른 항목 수", "다른 항목"]
+        for k in self.keys:
+            cols += [f"DB:{k}", f"사이트:{k}"]
+        return cols
+
+    def iter_rows(self) -> Iterator[List[Any]]:
+        """내보내기용 행 (header() 순서)"""
+        for i in range(len(self)):
+            a, b, s = self.pair(i)
+            diff = self.diff_keys(i)
+            row: List[Any] = [i + 1, round(s, 4), len(diff), ", ".join(diff)]
+            for k in self.keys:
+                row += [str(a.get(k, "")), str(b.get(k, ""))]
+            yield row
+
+    def to_csv(self, path: str) -> str:
+        """CSV 저장 (엑셀에서 한글이 깨지지 않도록 utf-8-sig)"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8-sig", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(self.header())
+            for row in self.iter_rows():
+                w.writerow(row)
+        return os.path.abspath(path)
+
+    def to_jsonl(self, path: str) -> str:
+        """JSONL 저장 (한 줄 = 매칭 쌍 하나)"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            for i in range(len(self)):
+                a, b, s = self.pair(i)
+                f.write(json.dumps({"score": s, "diff_keys": self.diff_keys(i), "db": a, "site": b},
+                                   ensure_ascii=False) + "\n")
+        return os.path.abspath(path)
+
+    def to_xlsx(self, path: str) -> Optional[str]:
+        """XLSX 저장 (openpyxl write-only 모드로 한 줄씩, 다른 값은 빨간 글씨), openpyxl이 없으면 None"""
+        try:
+            from openpyxl import Workbook
+            from openpyxl.cell import WriteOnlyCell
+            from openpyxl.styles import Font
+        except Exception as e:
+            print(f"[match_result] openpyxl 없음, XLSX 저장 불가: {e}")
+            return None
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("매칭 결과")
+        ws.append(self.header())
+        red = Font(color="FF0000")
+        for i, row in enumerate(self.iter_rows()):
+            cells = list(row[:4])
+            for k, eq in enumerate(self.equal_flags(i)):
+                cells.append(row[4 + 2 * k])
+                site = WriteOnlyCell(ws, value=row[5 + 2 * k])
+                if not eq:
+                    site.font = red
+                cells.append(site)
+            ws.append(cells)
+        wb.save(path)
+        return os.path.abspath(path)
@@ -0,0 +1,475 @@
+# matcher_index.py
+# -*- coding: utf-8 -*-
+"""
+퍼지 매칭 후보 블로킹용 n-gram 역색인
+
+대부분의 (DB, 사이트) 쌍은 이름에 공통 글자 조각이 하나도 없으므로,
+정규화된 국문/영문명의 n-gram → 레코드 번호 역색인을 만들어
+공통 n-gram이 일정 개수 이상인 후보만 FuzzyExhibitionMatcher가 점수 계산하도록 한다.
+
+- 영문/숫자: 단어별 문자 3-gram (3글자 미만 단어는 단어 그대로)
+- 한글: 음절 단위 2-gram (음절 하나가 자모 2~3개라 영문 3-gram과 비슷한 변별력, 1음절 단어는 음절 그대로)
+- 전체 레코드의 MATCH_MAX_DF 비율 이상에 나오는 흔한 n-gram('전시', 'exp' 등)은 후보 계산에서 제외
+  (질의 이름이 흔한 n-gram으로만 이루어진 경우에는 그대로 사용)
+
+    idx = NgramIndex.build(records, matcher._names)
+    idx.save("outputs/site_index.pkl")
+    idx = NgramIndex.load("outputs/site_index.pkl")
+    idx.candidates(kr_norm, en_norm)  # → 후보 레코드 번호 (오름차순)
+
+DB/data.json 기준 색인은 폴더(MatcherIndex)로 한 번 만들어 두고 memory-map으로 열어 재사용:
+
+    python matcher_index.py build --json data.json
+    python matcher_index.py match outputs/extract_20251015_141834.json
+"""
+import os
+import re
+import sys
+import json
+import time
+import pickle
+import shutil
+import argparse
+import tempfile
+import concurrent.futures
+from datetime import datetime
+import itertools
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# ==== 설정 ===================================================================
+MIN_SHARED_GRAMS = int(os.getenv("MATCH_MIN_SHARED_GRAMS", "2"))   # 후보가 되기 위한 최소 공통 n-gram 수
+MAX_DF = float(os.getenv("MATCH_MAX_DF", "0.05"))                  # 흔한 n-gram 제외 비율
+MAX_DF_MIN_RECORDS = 1000                                          # 이보다 작은 색인에는 MAX_DF 미적용
+BLOCKING_MIN_PAIRS = int(os.getenv("MATCH_BLOCKING_MIN_PAIRS", "1000000"))  # base×target 쌍이 이 이상이면 색인 사용
+LATIN_N = 3
+HANGUL_N = 2
+
+KR_KEY = "전시회 국문명"
+EN_KEY = "영문명(Full Name)"
+FIELDS = ("kr", "en")
+
+_HANGUL_RUN_RE = re.compile(r"[가-힣]+")
+
+# ==== n-gram =================================================================
+def _ngrams(token: str, n: int) -> List[str]:
+    if len(token) <= n:
+        return [token]
+    return [token[i:i + n] for i in range(len(token) - n + 1)]
+
+def name_grams(norm: str) -> List[str]:
+    """정규화된 이름 → n-gram 목록 (중복 제거, 순서 유지)"""
+    grams: List[str] = []
+    for token in (norm or "").split():
+        # 한글 구간은 음절 2-gram, 나머지(영문/숫자 등)는 문자 3-gram
+        pos = 0
+        for m in _HANGUL_RUN_RE.finditer(token):
+            if m.start() > pos:
+                grams.extend(_ngrams(token[pos:m.start()], LATIN_N))
+            grams.extend(_ngrams(m.group(), HANGUL_N))
+            pos = m.end()
+        if pos < len(token):
+            grams.extend(_ngrams(token[pos:], LATIN_N))
+    return list(dict.fromkeys(grams))
+
+# ==== 역색인 =================================================================
+class NgramIndex:
+    """국문/영문명 n-gram 역색인 (레코드 포함, 저장/재사용 가능)"""
+
+    def __init__(self, records: List[Dict[str, Any]], names: Dict[str, List[str]],
+                 postings: Dict[str, Dict[str, np.ndarray]]):
+        self.records = records        # 원본 레코드 (target)
+        self.names = names            # {"kr": [정규화 국문명], "en": [정규화 영문명]}
+        self.postings = postings      # {"kr": {gram: int32 레코드 번호 배열}, "en": {...}}
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @classmethod
+    def build(cls, records: List[Dict[str, Any]],
+              names_of: Callable[[Dict[str, Any]], Tuple[str, str]]) -> "NgramIndex":
+        """
+        레코드 목록으로 색인 생성
+        names_of: 레코드 → (정규화 국문명, 정규화 영문명) (FuzzyExhibitionMatcher._names, 이름 사전 보완 포함)
+        """
+        pairs = [names_of(r) for r in records]
+        names = {
+            "kr": [kr for kr, _ in pairs],
+            "en": [en for _, en in pairs],
+        }
+        postings: Dict[str, Dict[str, np.ndarray]] = {}
+        for field in FIELDS:
+            lists: Dict[str, List[int]] = {}
+            for i, norm in enumerate(names[field]):
+                for g in name_grams(norm):
+                    lists.setdefault(g, []).append(i)
+            postings[field] = {g: np.asarray(ids, dtype=np.int32) for g, ids in lists.items()}
+        return cls(records, names, postings)
+
+    def _posting(self, field: str, gram: str, default: np.ndarray) -> np.ndarray:
+        return self.postings[field].get(gram, default)
+
+    def _field_counts(self, field: str, norm: str, min_shared: int) -> Optional[np.ndarray]:
+        """질의 이름과 공통 n-gram이 min_shared개 이상인 레코드 번호 (이름이 비면 None)"""
+        grams = name_grams(norm)
+        if not grams:
+            return None
+        empty = np.empty(0, dtype=np.int32)
+        lists = [self._posting(field, g, empty) for g in grams]
+        # 흔한 n-gram 제외 (색인에 없는 n-gram도 변별력 있는 것으로 취급, 모두 흔하면 그대로 사용)
+        if len(self) >= MAX_DF_MIN_RECORDS:
+            max_len = max(1, int(MAX_DF * len(self)))
+            rare = [p for p in lists if len(p) <= max_len]
+            if rare:
+                lists = rare
+        lists = [p for p in lists if len(p)]
+        if not lists:
+            return empty
+        # 색인 크기가 아니라 포스팅 길이에 비례하도록 bincount 대신 unique 사용
+        ids, counts = np.unique(np.concatenate(lists), return_counts=True)
+        # 짧은 이름은 n-gram 수 자체가 적으므로 기준을 이름의 n-gram 수로 낮춤
+        need = max(1, min(min_shared, len(grams)))
+        return ids[counts >= need]
+
+    def candidates(self, kr_norm: str, en_norm: str, min_shared: int = MIN_SHARED_GRAMS) -> np.ndarray:
+        """국문 또는 영문 기준 후보 레코드 번호 합집합 (오름차순)"""
+        found = [c for c in (self._field_counts("kr", kr_norm, min_shared),
+                             self._field_counts("en", en_norm, min_shared)) if c is not None]
+        if not found:
+            return np.empty(0, dtype=np.int32)
+        return np.union1d(*found) if len(found) == 2 else found[0]
+
+    def save(self, path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "wb") as f:
+            pickle.dump({"records": self.records, "names": self.names, "postings": self.postings}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str) -> "NgramIndex":
+        with open(path, "rb") as f:
+            obj = pickle.load(f)
+        return cls(obj["records"], obj["names"], obj["postings"])
+
+# ==== 디스크 색인 (memory-map) ===============================================
+INDEX_VERSION = 1
+MATCHER_INDEX_DIR = os.getenv("MATCHER_INDEX_DIR") or os.path.join("outputs", "matcher_index")
+
+class _MappedStrings:
+    """UTF-8 바이트 덩어리 + 오프셋 배열 → 문자열 시퀀스 (필요한 항목만 디코딩)"""
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray):
+        self._blob = blob
+        self._off = offsets
+
+    def __len__(self) -> int:
+        return len(self._off) - 1
+
+    def __getitem__(self, i: int) -> str:
+        return self._blob[self._off[i]:self._off[i + 1]].tobytes().decode("utf-8")
+
+class _MappedRecords(_MappedStrings):
+    """records.jsonl + 줄 오프셋 → 레코드 시퀀스 (접근할 때만 json 파싱)"""
+    def __getitem__(self, i: int) -> Dict[str, Any]:
+        return json.loads(super().__getitem__(i))
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+def _pack_strings(items: List[str]):
+    data = [x.encode("utf-8") for x in items]
+    off = np.zeros(len(data) + 1, dtype=np.int64)
+    np.cumsum([len(x) for x in data], out=off[1:])
+    return np.frombuffer(b"".join(data), dtype=np.uint8), off
+
+def _source_stamp(path: str) -> Dict[str, Any]:
+    try:
+        st = os.stat(path)
+        return {"path": os.path.abspath(path), "mtime": st.st_mtime, "size": st.st_size}
+    except OSError:
+        return {"path": path}
+
+class MatcherIndex(NgramIndex):
+    """
+    디스크에 저장된 NgramIndex (정규화 이름, n-gram 포스팅, 레코드 오프셋을 np.load(mmap_mode="r")로 열기)
+
+    폴더 구성:
+        meta.json                          버전, 레코드 수, 원본 정보
+        records.jsonl / records.off.npy    원본 레코드 + 줄 오프셋
+        {kr,en}.names.bin / .names.off.npy 정규화 이름
+        {kr,en}.vocab.json                 n-gram 목록 (포스팅 행 번호 순)
+        {kr,en}.ptr.npy / .ids.npy         CSR 포스팅 (n-gram i의 레코드 = ids[ptr[i]:ptr[i+1]])
+    """
+
+    def __init__(self, path: str, meta: Dict[str, Any], records, names, vocab, ptr, ids):
+        self.path = path
+        self.meta = meta
+        self.records = records
+        self.names = names
+        self.postings = {}
+        self._vocab = vocab
+        self._ptr = ptr
+        self._ids = ids
+
+    def __len__(self) -> int:
+        return int(self.meta["count"])
+
+    def _posting(self, field: str, gram: str, default: np.ndarray) -> np.ndarray:
+        row = self._vocab[field].get(gram)
+        if row is None:
+            return default
+        ptr = self._ptr[field]
+        return self._ids[field][ptr[row]:ptr[row + 1]]
+
+    @staticmethod
+    def write(index: NgramIndex, path: str, source: Optional[Dict[str, Any]] = None) -> str:
+        """메모리 색인을 폴더로 저장 (임시 폴더에 쓴 뒤 교체)"""
+        path = os.path.abspath(path)
+        tmp = path + ".tmp"
+        os.makedirs(tmp, exist_ok=True)
+
+        lines = [json.dumps(r, ensure_ascii=False) + "\n" for r in index.records]
+        blob, off = _pack_strings(lines)
+        with open(os.path.join(tmp, "records.jsonl"), "wb") as f:
+            f.write(blob.tobytes())
+        np.save(os.path.join(tmp, "records.off.npy"), off)
+
+        for field in FIELDS:
+            blob, off = _pack_strings(index.names[field])
+            blob.tofile(os.path.join(tmp, f"{field}.names.bin"))
+            np.save(os.path.join(tmp, f"{field}.names.off.npy"), off)
+
+            vocab = list(index.postings[field])
+            lists = [index.postings[field][g] for g in vocab]
+            ptr = np.zeros(len(lists) + 1, dtype=np.int64)
+            np.cumsum([len(p) for p in lists], out=ptr[1:])
+            ids = np.concatenate(lists).astype(np.int32) if lists else np.empty(0, dtype=np.int32)
+            np.save(os.path.join(tmp, f"{field}.ptr.npy"), ptr)
+            np.save(os.path.join(tmp, f"{field}.ids.npy"), ids)
+            with open(os.path.join(tmp, f"{field}.vocab.json"), "w", encoding="utf-8") as f:
+                json.dump(vocab, f, ensure_ascii=False)
+
+        meta = {
+            "version": INDEX_VERSION,
+            "count": len(index),
+            "built_at": datetime.now().isoformat(timespec="seconds"),
+            "source": source or {},
+            "latin_n": LATIN_N,
+            "hangul_n": HANGUL_N,
+        }
+        with open(os.path.join(tmp, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        os.replace(tmp, path)
+        return path
+
+    @classmethod
+    def open(cls, path: str) -> "MatcherIndex":
+        """폴더 색인 열기 (배열은 memory-map, n-gram 목록만 메모리에 올림)"""
+        with open(os.path.join(path, "meta.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("version") != INDEX_VERSION or meta.get("latin_n") != LATIN_N or meta.get("hangul_n") != HANGUL_N:
+            raise ValueError(f"색인 형식이 다릅니다. 다시 생성하세요: {path}")
+
+        def _np(name):
+            return np.load(os.path.join(path, name), mmap_mode="r")
+
+        def _blob(name):
+            fp = os.path.join(path, name)
+            return np.memmap(fp, dtype=np.uint8, mode="r") if os.path.getsize(fp) else np.empty(0, dtype=np.uint8)
+
+        records = _MappedRecords(_blob("records.jsonl"), _np("records.off.npy"))
+        names, vocab, ptr, ids = {}, {}, {}, {}
+        for field in FIELDS:
+            names[field] = _MappedStrings(_blob(f"{field}.names.bin"), _np(f"{field}.names.off.npy"))
+            with open(os.path.join(path, f"{field}.vocab.json"), "r", encoding="utf-8") as f:
+                vocab[field] = {g: i for i, g in enumerate(json.load(f))}
+            ptr[field] = _np(f"{field}.ptr.npy")
+            ids[field] = _np(f"{field}.ids.npy")
+        return cls(path, meta, records, names, vocab, ptr, ids)
+
+    def is_stale(self) -> bool:
+        """원본 파일(data.json 등)이 색인 생성 후 바뀌었는지"""
+        src = self.meta.get("source") or {}
+        if "mtime" not in src:
+            return False
+        return _source_stamp(src["path"]) != src
+
+# ==== 색인 생성 ==============================================================
+DB_NAME_COLUMNS = {"ExKoreanName": KR_KEY, "ExEnglishName": EN_KEY, "NameAbbreviation": "영문명(약자)"}
+
+def records_from_db(connection, table: str = "dbo.Exhibition") -> List[Dict[str, Any]]:
+    """Exhibition 테이블 → 매칭용 레코드 (국문/영문명 + DB 원본 컬럼)"""
+    cursor = connection.cursor()
+    cursor.execute(f"SELECT * FROM {table};")
+    cols = [c[0] for c in cursor.description]
+    records = []
+    for row in cursor.fetchall():
+        rec = {c: ("" if v is None else str(v)) for c, v in zip(cols, row)}
+        for col, key in DB_NAME_COLUMNS.items():
+            if col in rec:
+                rec[key] = rec[col]
+        if rec.get(KR_KEY, "").strip() or rec.get(EN_KEY, "").strip():
+            records.append(rec)
+    return records
+
+def build_matcher_index(records: List[Dict[str, Any]], path: str = MATCHER_INDEX_DIR,
+                        source: Optional[Dict[str, Any]] = None, matcher=None) -> MatcherIndex:
+    """레코드 목록 → 폴더 색인 생성 후 memory-map으로 열어서 반환"""
+    if matcher is None:
+        from data import FuzzyExhibitionMatcher
+        matcher = FuzzyExhibitionMatcher()
+    MatcherIndex.write(matcher.build_index(records), path, source)
+    return MatcherIndex.open(path)
+
+def open_or_build(json_path: str, path: str = MATCHER_INDEX_DIR, matcher=None) -> MatcherIndex:
+    """폴더 색인이 있고 원본(json_path)이 그대로면 열고, 아니면 다시 생성"""
+    if matcher is None:
+        from data import FuzzyExhibitionMatcher
+        matcher = FuzzyExhibitionMatcher()
+    if os.path.isfile(os.path.join(path, "meta.json")):
+        try:
+            idx = MatcherIndex.open(path)
+            if not idx.is_stale() and idx.meta.get("source", {}).get("path") == os.path.abspath(json_path):
+                return idx
+        except Exception as e:
+            print(f"[matcher_index] 색인 다시 생성: {e}")
+    return build_matcher_index(matcher._load_any(json_path), path, _source_stamp(json_path), matcher)
+
+# ==== 병렬 매칭 (프로세스 풀) ================================================
+MATCH_WORKERS = int(os.getenv("MATCH_WORKERS", "1"))             # 1=단일 프로세스, -1=CPU 수
+MATCH_SHARD_SIZE = int(os.getenv("MATCH_SHARD_SIZE", "2000"))    # 워커 작업 단위 (base 레코드 수)
+PROGRESS_SEC = 5.0
+
+_WORKER: Dict[str, Any] = {}
+
+def resolve_workers(workers: Optional[int] = None) -> int:
+    workers = MATCH_WORKERS if workers is None else workers
+    return (os.cpu_count() or 1) if workers < 0 else max(1, workers)
+
+def _worker_init(index_path: str, threshold: float, weight_kr: float, weight_en: float):
+    """워커마다 한 번: 색인 memory-map 열기 + 매처 생성"""
+    from data import FuzzyExhibitionMatcher
+    _WORKER["index"] = MatcherIndex.open(index_path)
+    _WORKER["matcher"] = FuzzyExhibitionMatcher(threshold, weight_kr, weight_en, name_dict=False)
+
+def _worker_shard(names: List[Dict[str, Any]]) -> List[tuple]:
+    """샤드 하나 매칭 → [(샤드 내 순번, target 번호, 점수)]"""
+    rows = _WORKER["matcher"]._best_match_rows(names, _WORKER["index"])
+    return [(i, j, s) for i, _, j, s in rows]
+
+def parallel_best_matches(matcher, base: Iterable[Dict[str, Any]], index: NgramIndex,
+                          workers: Optional[int] = None, shard_size: int = MATCH_SHARD_SIZE) -> List[tuple]:
+    """
+    base를 shard_size개씩 나눠 프로세스 풀에서 매칭하고 순서대로 합침 (결과는 같은 색인으로 단일 프로세스에서
+    _build_best_matches_blocked를 돌린 것과 동일, 색인 없이 행렬로 비교할 크기면 _build_best_matches가 풀을 쓰지 않음)
+    - target 색인은 MatcherIndex 폴더를 각 워커가 memory-map으로 열어 공유 (메모리 색인이면 임시 폴더에 저장)
+    - 워커에는 국문/영문명만 보내고, 동시에 처리 중인 샤드는 워커 수의 2배까지 (base 스트리밍 유지)
+    - 진행률과 처리 속도(records/s)를 PROGRESS_SEC마다 출력
+    """
+    workers = resolve_workers(workers)
+    tmp_dir = None
+    # isinstance 대신 path로 판별 (python matcher_index.py 실행 시 __main__.MatcherIndex와 클래스가 다름)
+    if not getattr(index, "path", None):
+        tmp_dir = tempfile.mkdtemp(prefix="matcher_index_")
+        MatcherIndex.write(index, tmp_dir)
+        index = MatcherIndex.open(tmp_dir)
+    total = len(base) if hasattr(base, "__len__") else None
+
+    it = iter(base)
+    shard_no = itertools.count()
+    pending: Dict[Any, tuple] = {}
+    results: Dict[int, List[tuple]] = {}
+    done = 0
+    t0 = last = time.time()
+    try:
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers, initializer=_worker_init,
+                initargs=(index.path, matcher.threshold, matcher.weight_kr, matcher.weight_en)) as ex:
+
+            def _submit() -> bool:
+                shard = list(islice(it, shard_size))
+                if not shard:
+                    return False
+                # 이름 사전 보완은 여기서 끝내고 보냄 (워커는 사전 없이 점수만 계산)
+                names = [dict(zip((KR_KEY, EN_KEY), matcher._raw_names(r))) for r in shard]
+                pending[ex.submit(_worker_shard, names)] = (next(shard_no), shard)
+                return True
+
+            while len(pending) < workers * 2 and _submit():
+                pass
+            while pending:
+                finished, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for fut in finished:
+                    no, shard = pending.pop(fut)
+                    results[no] = [(shard[i], index.records[j], s) for i, j, s in fut.result()]
+                    done += len(shard)
+                    _submit()
+                now = time.time()
+                if now - last >= PROGRESS_SEC or not pending:
+                    last = now
+                    rate = done / max(now - t0, 1e-9)
+                    pct = f" ({done / total * 100:.1f}%)" if total else ""
+                    print(f"[match] {done:,}{'/' + format(total, ',') if total else ''}{pct} "
+                          f"{rate:,.0f} records/s, workers={workers}")
+    finally:
+        if tmp_dir:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    return [m for no in sorted(results) for m in results[no]]
+
+# ==== CLI ====================================================================
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="전시회 매칭 색인 생성/조회")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p_build = sub.add_parser("build", help="data.json 또는 DB Exhibition 테이블로 색인 생성")
+    p_build.add_argument("--json", help="원본 JSON/JSONL (예: data.json)")
+    p_build.add_argument("--db", help="ODBC 연결 문자열 (Exhibition 테이블 사용)")
+    p_build.add_argument("--out", default=MATCHER_INDEX_DIR)
+    p_match = sub.add_parser("match", help="추출 결과 파일들을 색인과 매칭")
+    p_match.add_argument("files", nargs="+", help="outputs/extract_*.json 등")
+    p_match.add_argument("--index", default=MATCHER_INDEX_DIR)
+    p_match.add_argument("--threshold", type=float, default=0.8)
+    p_match.add_argument("--workers", type=int, default=None, help="매칭 프로세스 수 (-1=CPU 수, 기본 MATCH_WORKERS)")
+    args = ap.parse_args(argv)
+
+    from data import FuzzyExhibitionMatcher
+
+    if args.cmd == "build":
+        t0 = time.time()
+        if args.json:
+            matcher = FuzzyExhibitionMatcher()
+            idx = build_matcher_index(matcher._load_any(args.json), args.out, _source_stamp(args.json), matcher)
+        elif args.db:
+            import pyodbc
+            with pyodbc.connect(args.db) as conn:
+                idx = build_matcher_index(records_from_db(conn), args.out, {"path": "db:Exhibition"})
+        else:
+            ap.error("--json 또는 --db 중 하나가 필요합니다.")
+        print(f"색인 생성: {len(idx)}건 → {idx.path} ({time.time() - t0:.1f}s)")
+        return 0
+
+    idx = MatcherIndex.open(args.index)
+    if idx.is_stale():
+        print(f"[matcher_index] 경고: 원본이 색인 생성 이후 변경됨 ({idx.meta['source'].get('path')})")
+    matcher = FuzzyExhibitionMatcher(threshold=args.threshold)
+    for fp in args.files:
+        t0 = time.time()
+        try:
+            pairs = matcher._build_best_matches(matcher._iter_any(fp), [], idx, args.workers)
+        except Exception as e:
+            print(f"{os.path.basename(fp)}: 건너뜀 ({e})")
+            continue
+        ms = (time.time() - t0) * 1000
+        if not pairs:
+            print(f"{os.path.basename(fp)}: 매칭 없음 ({ms:.1f} ms)")
+        for a, b, score in pairs:
+            print(f"{os.path.basename(fp)}: {a.get(KR_KEY, '')} ↔ {b.get(KR_KEY, '')} / {b.get(EN_KEY, '')} "
+                  f"(score={score:.2f}, {ms:.1f} ms)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,10 @@
+# search_test_gep.py
+# -*- coding: utf-8 -*-
+# sitesearch 패키지의 얇은 CLI 래퍼 (기존 스크립트 호출 방식 호환)
+#   python search_test_gep.py --query "검색어" [--only-url] [--headless]
+import sys
+
+from sitesearch.__main__ import main
+
+if __name__ == "__main__":
+    sys.exit(main(["gep"] + sys.argv[1:]))
@@ -0,0 +1,61 @@
+# sitesearch/__init__.py
+# -*- coding: utf-8 -*-
+"""
+AUMA / GEP / Myfair 전시회 검색 (프로세스 내 호출용)
+crawl4ai 공유 브라우저(browser.py)에서 실행되므로 상세 크롤링과 같은 브라우저 프로세스를 쓴다.
+
+    from sitesearch import search, asearch, search_all
+    results = search("auma", "automotive world tokyo")   # List[Dict]
+    by_site = search_planned("도쿄 자동차 기술전", "Automotive World Tokyo", "AWT")  # 다중 검색어
+"""
+import asyncio
+from typing import Dict, List
+
+import browser
+from . import auma, gep, myfair
+from .common import pick_latest, search_timing_histogram, SEARCH_TIMINGS
+from .planner import build_query_variants, search_planned, asearch_planned
+from .ranking import score_result, pick_best, auto_select
+
+SITES = {
+    "auma": auma,
+    "gep": gep,
+    "myfair": myfair,
+}
+
+# main2.py 등 기존 호출부 호환용 이름
+search_auma = auma.search
+search_gep = gep.search
+search_myfair = myfair.search
+
+def _site_module(site: str):
+    mod = SITES.get((site or "").strip().lower())
+    if mod is None:
+        raise ValueError(f"지원하지 않는 사이트입니다: {site} (가능: {', '.join(SITES)})")
+    return mod
+
+def search(site: str, query: str) -> List[Dict]:
+    """사이트 하나를 동기 검색"""
+    return _site_module(site).search(query)
+
+async def asearch(site: str, query: str) -> List[Dict]:
+    """사이트 하나를 비동기 검색"""
+    return await _site_module(site).asearch(query)
+
+async def asearch_all(query: str, sites: List[str] = None) -> Dict[str, List[Dict]]:
+    """여러 사이트를 동시에 검색 → {site: results}"""
+    sites = list(sites or SITES)
+    results = await asyncio.gather(*(asearch(s, query) for s in sites))
+    return dict(zip(sites, results))
+
+def search_all(query: str, sites: List[str] = None) -> Dict[str, List[Dict]]:
+    """asearch_all()의 동기 버전 (공유 브라우저 루프에서 실행)"""
+    return browser.run_sync(asearch_all(query, sites))
+
+__all__ = [
+    "SITES", "search", "asearch", "search_all", "asearch_all",
+    "search_auma", "search_gep", "search_myfair",
+    "pick_latest", "search_timing_histogram", "SEARCH_TIMINGS",
+    "build_query_variants", "search_planned", "asearch_planned",
+    "score_result", "pick_best", "auto_select",
+]
@@ -0,0 +1,34 @@
+# sitesearch/__main__.py
+# -*- coding: utf-8 -*-
+"""
+CLI: python -m sitesearch auma --query "automotive world tokyo" [--only-url] [--headless]
+"""
+import sys
+import argparse
+
+import browser
+from . import SITES, search, pick_latest
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="sitesearch", description="AUMA/GEP/Myfair 전시회 검색")
+    parser.add_argument("site", choices=list(SITES), help="검색할 사이트")
+    parser.add_argument("--query", "-q", required=True, help="검색어(전시회명)")
+    parser.add_argument("--only-url", action="store_true", help="가장 최신 결과의 URL 한 줄만 출력")
+    parser.add_argument("--headless", action="store_true", help="(호환용) 검색 브라우저는 항상 headless")
+    args = parser.parse_args(argv)
+
+    try:
+        results = search(args.site, args.query)
+    finally:
+        browser.shutdown()
+    if args.only_url:
+        best = pick_latest(results, args.query)
+        print(best["url"] if best else "")
+        return 0 if best else 1
+
+    for i, r in enumerate(results, start=1):
+        print(f"{i:>3}. {r.get('display_text', '')}\n     {r.get('url', '')}")
+    return 0 if results else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
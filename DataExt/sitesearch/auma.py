@@ -0,0 +1,103 @@
+# sitesearch/auma.py
+# -*- coding: utf-8 -*-
+"""AUMA 전시회 검색"""
+import re
+from typing import Dict, List
+from urllib.parse import urljoin
+
+import browser
+from .common import MONTH_MAP, SearchTimer, fetch_search_results, parse_html, node_text
+
+SEARCH_URL = "https://www.auma.de/en/"
+INPUT_SELECTOR = "#searchText"
+ROW_SELECTOR = "tbody.trade-fair-result__body > tr.trade-fair-result__row"
+
+
+def parse_results(html: str, search_query: str, base_url: str = SEARCH_URL) -> List[Dict[str, str]]:
+    """AUMA 검색 결과 HTML → 결과 리스트"""
+    results = []
+    for i, row in enumerate(parse_html(html).select(ROW_SELECTOR)):
+        try:
+            date_text = node_text(row.select_one(".trade-fair-result__cell--strTermin"))
+            link_element = row.select_one(".trade-fair-result__link")
+            link_text = node_text(link_element)
+            link_href = urljoin(base_url, link_element.get("href", "")) if link_element is not None else ""
+            city_text = node_text(row.select_one(".trade-fair-result__cell--strStadt"))
+            country_text = node_text(row.select_one(".trade-fair-result__cell--strLand"))
+
+            combined_text = f"{link_text} {city_text} {country_text}"
+            query_words = search_query.split()
+            # 유연한 검색: 검색어 중 하나라도 포함되면 결과에 포함 (OR 조건)
+            title_contains_query = any(word.lower() in combined_text.lower() for word in query_words)
+
+            if title_contains_query:
+                # 날짜 정보 추출
+                year = 0
+                month = 0
+                year_match = re.search(r'(20\d{2})', date_text)
+                if year_match:
+                    year = int(year_match.group(1))
+                    for name, num in MONTH_MAP.items():
+                        if name.lower() in date_text.lower():
+                            month = num; break
+                    if month == 0:
+                        month_num_match = re.search(r'\.(\d{2})\.', date_text)
+                        if month_num_match: month = int(month_num_match.group(1))
+
+                # 표시 텍스트 생성
+                display_text = f"{link_text}"
+                if year:
+                    display_text += f" {year}"
+                if city_text:
+                    display_text += f" - {city_text}"
+                if country_text:
+                    display_text += f" ({country_text})"
+
+                results.append({
+                    'display_text': display_text,
+                    'url': link_href,
+                    'year': year,
+                    'month': month,
+                    'city': city_text,
+                    'country': country_text,
+                    'title': link_text
+                })
+
+        except Exception as e:
+            print(f"[AUMA] error processing row {i+1}: {e}")
+            continue
+    return results
+
+
+async def _search(exhibition: str) -> List[Dict[str, str]]:
+    search_query = exhibition.strip()
+    timer = SearchTimer("AUMA")
+    try:
+        html, page_url = await fetch_search_results(timer, SEARCH_URL, INPUT_SELECTOR, ROW_SELECTOR, search_query)
+        results = parse_results(html, search_query, page_url)
+        timer.mark("parse")
+        if not results:
+            print("[AUMA] no search results found")
+        else:
+            print(f"[AUMA] found {len(results)} results")
+        return results
+    except Exception as e:
+        print(f"[AUMA 검색 오류] {e}")
+        return []
+    finally:
+        timer.done()
+
+
+def search(exhibition: str) -> List[Dict[str, str]]:
+    """
+    AUMA 사이트에서 전시회 검색하여 여러 결과 반환
+
+    Returns:
+        List[Dict[str, str]]: 검색 결과 리스트 (display_text, url, year, month, city, country)
+    """
+    return browser.run_sync(_search(exhibition))
+
+
+async def asearch(exhibition: str) -> List[Dict[str, str]]:
+    """search()의 비동기 버전 (공유 브라우저 루프에서 실행)"""
+    return await browser.run_async(_search(exhibition))
@@ -0,0 +1,172 @@
+# sitesearch/common.py
+# -*- coding: utf-8 -*-
+"""검색 공통 설정 (공유 crawl4ai 브라우저 + 결과 안정화 대기 + 사이트별 소요시간 히스토그램)"""
+import os
+import json
+import time
+import uuid
+from typing import Dict, List, Optional, Tuple
+
+from crawl4ai import CrawlerRunConfig, CacheMode
+
+import browser
+
+SEARCH_WAIT_SEC = int(os.getenv("SEARCH_WAIT_SEC", "20"))
+SEARCH_SETTLE_MS = int(os.getenv("SEARCH_SETTLE_MS", "300"))
+
+# 히스토그램 구간(초) - 마지막 구간은 그 이상 전부
+SEARCH_TIMING_BUCKETS = [0.5, 1, 2, 4, 8, 16]
+SEARCH_TIMINGS: Dict[str, Dict[str, List[float]]] = {}
+
+# ==== 브라우저 조작 스크립트 ==================================================
+def fill_and_submit_js(input_selector: str, query: str, timeout_ms: int = SEARCH_WAIT_SEC * 1000) -> str:
+    """
+    검색창이 나타날 때까지 기다렸다가 값 입력 + Enter 제출하는 JS
+    (React 입력창도 반영되도록 native setter + input 이벤트 사용)
+    """
+    sel = json.dumps(input_selector)
+    q = json.dumps(query)
+    return f"""
+    const deadline = Date.now() + {timeout_ms};
+    let box = document.querySelector({sel});
+    while (!box && Date.now() < deadline) {{
+        await new Promise(r => setTimeout(r, 50));
+        box = document.querySelector({sel});
+    }}
+    if (!box) return false;
+    const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, "value").set;
+    box.focus();
+    setter.call(box, {q});
+    box.dispatchEvent(new Event("input", {{bubbles: true}}));
+    box.dispatchEvent(new Event("change", {{bubbles: true}}));
+    // 실제 Enter와 같게: 핸들러가 preventDefault 하지 않았을 때만 form 기본 제출
+    let prevented = false;
+    for (const type of ["keydown", "keypress", "keyup"]) {{
+        const ev = new KeyboardEvent(type, {{key: "Enter", code: "Enter", keyCode: 13, which: 13, bubbles: true, cancelable: true}});
+        if (!box.dispatchEvent(ev)) prevented = true;
+    }}
+    if (!prevented && box.form && document.contains(box.form)) {{
+        box.form.requestSubmit ? box.form.requestSubmit() : box.form.submit();
+    }}
+    return true;
+    """
+
+def results_settled_js(result_selector: str, settle_ms: int = SEARCH_SETTLE_MS) -> str:
+    """
+    결과 요소가 1개 이상 나타나고 settle_ms 동안 개수가 변하지 않으면 true (crawl4ai wait_for용)
+    고정 sleep 대신 결과가 더 이상 늘어나지 않는 시점을 준비 완료로 간주한다.
+    """
+    sel = json.dumps(result_selector)
+    return f"""js:() => {{
+        const n = document.querySelectorAll({sel}).length;
+        const s = window.__resultSettle || (window.__resultSettle = {{n: -1, t: 0}});
+        const now = performance.now();
+        if (n === 0 || n !== s.n) {{ s.n = n; s.t = now; return false; }}
+        return now - s.t >= {settle_ms};
+    }}"""
+
+async def fetch_search_results(timer: "SearchTimer", url: str, input_selector: str,
+                               result_selector: str, query: str) -> Tuple[str, str]:
+    """
+    공유 crawl4ai 브라우저에서 검색 실행
+    1) 검색 페이지 열고 검색어 입력/제출  2) 같은 페이지(session)에서 결과가 안정될 때까지 대기
+
+    Returns:
+        tuple: (결과 페이지 HTML, 결과 페이지 URL)
+    """
+    session_id = f"search-{uuid.uuid4().hex}"
+    try:
+        await browser.arun(url, CrawlerRunConfig(
+            session_id=session_id,
+            cache_mode=CacheMode.BYPASS,
+            js_code=fill_and_submit_js(input_selector, query),
+            page_timeout=SEARCH_WAIT_SEC * 1000,
+            verbose=False,
+        ))
+        timer.mark("submit")
+
+        result = await browser.arun(url, CrawlerRunConfig(
+            session_id=session_id,
+            cache_mode=CacheMode.BYPASS,
+            js_only=True,
+            wait_for=results_settled_js(result_selector),
+            wait_for_timeout=SEARCH_WAIT_SEC * 1000,
+            verbose=False,
+        ))
+        timer.mark("results")
+        return (getattr(result, "html", "") or ""), (getattr(result, "redirected_url", None) or url)
+    finally:
+        await browser.kill_session(session_id)
+
+def parse_html(html: str):
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(html or "", "lxml")
+
+def node_text(node) -> str:
+    return node.get_text(" ", strip=True) if node is not None else ""
+
+class SearchTimer:
+    """검색 단계별(submit/results/parse) 소요시간 기록"""
+
+    def __init__(self, site: str):
+        self.site = site
+        self.phases: Dict[str, float] = {}
+        self._t0 = self._last = time.perf_counter()
+
+    def mark(self, phase: str):
+        now = time.perf_counter()
+        self.phases[phase] = now - self._last
+        self._last = now
+
+    def done(self):
+        self.phases["total"] = time.perf_counter() - self._t0
+        site_stats = SEARCH_TIMINGS.setdefault(self.site, {})
+        for phase, sec in self.phases.items():
+            site_stats.setdefault(phase, []).append(sec)
+        detail = " / ".join(f"{k} {v:.2f}s" for k, v in self.phases.items() if k != "total")
+        print(f"[{self.site}] search {self.phases['total']:.2f}s ({detail})")
+        print(search_timing_histogram(self.site))
+
+def search_timing_histogram(site: str, phase: str = "total") -> str:
+    """사이트별 검색 소요시간 분포를 텍스트 히스토그램으로 반환"""
+    samples = SEARCH_TIMINGS.get(site, {}).get(phase, [])
+    if not samples:
+        return f"[{site}] no timing samples"
+    edges = SEARCH_TIMING_BUCKETS + [float("inf")]
+    counts = [0] * len(edges)
+    for sec in samples:
+        counts[next(i for i, e in enumerate(edges) if sec < e)] += 1
+
+    lines = [f"[{site}] {phase} n={len(samples)} avg={sum(samples) / len(samples):.2f}s"]
+    lo = 0.0
+    for edge, cnt in zip(edges, counts):
+        label = f"{lo:g}-{edge:g}s" if edge != float("inf") else f"{lo:g}s+"
+        lines.append(f"  {label:>8} | {'#' * cnt} {cnt}")
+        lo = edge
+    return "\n".join(lines)
+
+
+
+# ==== 결과 선택/실행 도우미 ====================================================
+MONTH_MAP = {
+    'January': 1, 'February': 2, 'March': 3, 'April': 4, 'May': 5, 'June': 6,
+    'July': 7, 'August': 8, 'September': 9, 'October': 10, 'November': 11, 'December': 12
+}
+
+def pick_latest(results: List[Dict], query: str = "") -> Optional[Dict]:
+    """
+    검색어 단어가 모두 포함된 결과 중 가장 최신(year, month) 항목 반환
+    (전부 불일치하면 전체 결과에서 최신 항목)
+    """
+    words = [w.lower() for w in (query or "").split()]
+
+    def _matches(r: Dict) -> bool:
+        text = f"{r.get('title', '')} {r.get('city', '')} {r.get('country', '')}".lower()
+        return all(w in text for w in words)
+
+    cands = [r for r in results if r.get("url")]
+    matched = [r for r in cands if _matches(r)]
+    pool = matched or cands
+    if not pool:
+        return None
+    return max(pool, key=lambda r: (r.get("year") or 0, r.get("month") or 0))
@@ -0,0 +1,103 @@
+# sitesearch/gep.py
+# -*- coding: utf-8 -*-
+"""GEP 전시회 검색"""
+import re
+from typing import Dict, List
+from urllib.parse import urljoin
+
+import browser
+from .common import SearchTimer, fetch_search_results, parse_html, node_text
+
+SEARCH_URL = "https://www.gep.or.kr/gept/ovrss/main/mainPage.do"
+INPUT_SELECTOR = "#topQuery"
+RESULT_SELECTOR = "#totalSearchView a"
+ITEM_SELECTOR = ".text-info"
+DETAIL_URL = "https://www.gep.or.kr/gept/ovrss/sear/selectOverseasExhibitionView.do?exhbId={}"
+
+
+def parse_results(html: str, search_query: str, base_url: str = SEARCH_URL) -> List[Dict[str, str]]:
+    """GEP 검색 결과 HTML → 결과 리스트"""
+    results = []
+    for item in parse_html(html).select(ITEM_SELECTOR):
+        try:
+            date_text = node_text(item.select_one(".info-date"))
+            link_element = item.select_one(".info-title a")
+            if link_element is None:
+                continue
+            link_text = node_text(link_element)
+            link_href = link_element.get("href", "")
+
+            query_words = search_query.split()
+            # 유연한 검색: 검색어 중 하나라도 포함되면 결과에 포함 (OR 조건)
+            title_contains_query = any(word in link_text for word in query_words)
+
+            if title_contains_query:
+                # 날짜 정보 추출
+                year = 0
+                month = 0
+                year_match = re.search(r'(20\d{2})', date_text)
+                month_match = re.search(r'-(\d{2})-', date_text)
+
+                if year_match and month_match:
+                    year = int(year_match.group(1))
+                    month = int(month_match.group(1))
+
+                # 표시 텍스트 생성
+                display_text = f"{link_text}"
+                if year:
+                    display_text += f" {year}"
+                if month:
+                    display_text += f".{month:02d}"
+
+                # JavaScript 링크 처리를 위한 URL 생성
+                final_url = urljoin(base_url, link_href) if link_href else ""
+                if link_href and link_href.startswith("javascript:"):
+                    final_url = link_href
+                    match = re.search(r"viewOverseasExhibition\('([^']+)'\)", link_href)
+                    if match:
+                        final_url = DETAIL_URL.format(match.group(1))
+
+                results.append({
+                    'display_text': display_text,
+                    'url': final_url,
+                    'year': year,
+                    'month': month,
+                    'title': link_text,
+                    'original_url': link_href
+                })
+
+        except Exception as e:
+            print(f"[GEP] error processing item: {e}")
+            continue
+    return results
+
+
+async def _search(exhibition: str) -> List[Dict[str, str]]:
+    search_query = exhibition.strip()
+    timer = SearchTimer("GEP")
+    try:
+        html, page_url = await fetch_search_results(timer, SEARCH_URL, INPUT_SELECTOR, RESULT_SELECTOR, search_query)
+        results = parse_results(html, search_query, page_url)
+        timer.mark("parse")
+        print(f"[GEP] found {len(results)} results")
+        return results
+    except Exception as e:
+        print(f"[GEP 검색 오류] {e}")
+        return []
+    finally:
+        timer.done()
+
+
+def search(exhibition: str) -> List[Dict[str, str]]:
+    """
+    GEP 사이트에서 전시회 검색하여 여러 결과 반환
+
+    Returns:
+        List[Dict[str, str]]: 검색 결과 리스트 (display_text, url, year, month, title)
+    """
+    return browser.run_sync(_search(exhibition))
+
+
+async def asearch(exhibition: str) -> List[Dict[str, str]]:
+    """search()의 비동기 버전 (공유 브라우저 루프에서 실행)"""
+    return await browser.run_async(_search(exhibition))
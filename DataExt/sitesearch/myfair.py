@@ -0,0 +1,97 @@
+# sitesearch/myfair.py
+# -*- coding: utf-8 -*-
+"""Myfair 전시회 검색"""
+import re
+from typing import Dict, List
+from urllib.parse import urljoin
+
+import browser
+from .common import SearchTimer, fetch_search_results, parse_html, node_text
+
+SEARCH_URL = "https://myfair.co/"
+INPUT_SELECTOR = "input[placeholder='박람회명 검색']"
+# 결과 카드: class가 정확히 css-1byidqq 이고 날짜 span(css-1nutr9u)을 포함하는 div
+CARD_SELECTOR = "div[class='css-1byidqq']:has(span[class='css-1nutr9u'])"
+
+
+def parse_results(html: str, search_query: str, base_url: str = SEARCH_URL) -> List[Dict[str, str]]:
+    """Myfair 검색 결과 HTML → 결과 리스트"""
+    results = []
+    for card in parse_html(html).select(CARD_SELECTOR):
+        try:
+            date_text = node_text(card.select_one("span.css-1nutr9u"))
+            link_element = card.select_one("a[class*='text-md']")
+            if link_element is None:
+                continue
+            link_text = node_text(link_element)
+            link_href = urljoin(base_url, link_element.get("href", ""))
+
+            query_words = search_query.split()
+            # 유연한 검색: 검색어 중 하나라도 포함되면 결과에 포함 (OR 조건)
+            title_contains_query = any(word in link_text for word in query_words)
+
+            if title_contains_query:
+                # 날짜 정보 추출
+                year = 0
+                month = 0
+                year_match = re.search(r'(20\d{2})', date_text)
+                month_match = re.search(r'(\d{1,2})월', date_text)
+
+                if year_match:
+                    year = int(year_match.group(1))
+                if month_match:
+                    month = int(month_match.group(1))
+
+                # 표시 텍스트 생성
+                display_text = f"{link_text}"
+                if year:
+                    display_text += f" {year}"
+                if month:
+                    display_text += f".{month}월"
+
+                results.append({
+                    'display_text': display_text,
+                    'url': link_href,
+                    'year': year,
+                    'month': month,
+                    'title': link_text
+                })
+
+        except Exception as e:
+            print(f"[Myfair] error processing card: {e}")
+            continue
+    return results
+
+
+async def _search(exhibition: str) -> List[Dict[str, str]]:
+    search_query = exhibition.strip()
+    timer = SearchTimer("Myfair")
+    try:
+        html, page_url = await fetch_search_results(timer, SEARCH_URL, INPUT_SELECTOR, CARD_SELECTOR, search_query)
+        results = parse_results(html, search_query, page_url)
+        timer.mark("parse")
+        if not results:
+            print("[Myfair] no search results found")
+        else:
+            print(f"[Myfair] found {len(results)} results")
+        return results
+    except Exception as e:
+        print(f"[Myfair 검색 오류] {e}")
+        return []
+    finally:
+        timer.done()
+
+
+def search(exhibition: str) -> List[Dict[str, str]]:
+    """
+    Myfair 사이트에서 전시회 검색하여 여러 결과 반환
+
+    Returns:
+        List[Dict[str, str]]: 검색 결과 리스트 (display_text, url, year, month, title)
+    """
+    return browser.run_sync(_search(exhibition))
+
+
+async def asearch(exhibition: str) -> List[Dict[str, str]]:
+    """search()의 비동기 버전 (공유 브라우저 루프에서 실행)"""
+    return await browser.run_async(_search(exhibition))
@@ -0,0 +1,126 @@
+# sitesearch/planner.py
+# -*- coding: utf-8 -*-
+"""
+검색 계획: 사이트마다 여러 검색어 변형(국문/영문/약자/연도 제거)을 동시에 검색하고
+결과를 URL 기준으로 병합/중복 제거한다.
+"""
+import os
+import re
+import asyncio
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+import browser
+from . import auma, gep, myfair
+
+SITE_MODULES = {"auma": auma, "gep": gep, "myfair": myfair}
+
+# 사이트별로 먼저 시도할 언어 (AUMA=영문 사이트, GEP/Myfair=국내 사이트)
+SITE_LANG_ORDER = {
+    "auma": ("en", "abbr", "kr"),
+    "gep": ("kr", "en", "abbr"),
+    "myfair": ("kr", "en", "abbr"),
+}
+MAX_VARIANTS_PER_SITE = int(os.getenv("SEARCH_MAX_VARIANTS", "4"))
+SITE_CONCURRENCY = int(os.getenv("SEARCH_SITE_CONCURRENCY", "2"))
+
+_YEAR_RE = re.compile(r"\b(?:19|20)\d{2}\s*년?|(?<=\D)(?:19|20)\d{2}(?=\D|$)")
+_ORDINAL_RE = re.compile(r"제\s*\d+\s*회|\b\d+(?:st|nd|rd|th)\b", re.I)
+
+def strip_year(name: str) -> str:
+    """'2025 미국 ... 전시회' / 'Waste Expo 2026' → 연도/회차 제거"""
+    s = _YEAR_RE.sub(" ", name or "")
+    s = _ORDINAL_RE.sub(" ", s)
+    s = re.sub(r"[\(\[]\s*[\)\]]", " ", s)
+    return re.sub(r"\s+", " ", s).strip(" -·,")
+
+def _name_variants(name: str) -> List[str]:
+    name = re.sub(r"\s+", " ", (name or "")).strip()
+    if not name:
+        return []
+    out = [name]
+    stripped = strip_year(name)
+    if stripped and stripped != name:
+        out.append(stripped)
+    return out
+
+def build_query_variants(korean: str, english: str, abbreviation: str = "",
+                         sites: Optional[List[str]] = None) -> Dict[str, List[str]]:
+    """
+    사이트별 검색어 변형 목록 생성 (중복 제거, 사이트별 최대 MAX_VARIANTS_PER_SITE개)
+
+    Returns:
+        Dict[str, List[str]]: {site: [검색어, ...]}
+    """
+    by_lang = {
+        "kr": _name_variants(korean),
+        "en": _name_variants(english),
+        "abbr": [abbreviation.strip()] if abbreviation and len(abbreviation.strip()) >= 2 else [],
+    }
+    plan: Dict[str, List[str]] = {}
+    for site in (sites or list(SITE_MODULES)):
+        seen, queries = set(), []
+        # 언어별 원문을 먼저, 연도 제거형은 그다음 순서로 채움
+        for depth in (0, 1):
+            for lang in SITE_LANG_ORDER.get(site, ("kr", "en", "abbr")):
+                variants = by_lang[lang]
+                if depth < len(variants):
+                    q = variants[depth]
+                    if q.lower() not in seen:
+                        seen.add(q.lower())
+                        queries.append(q)
+        plan[site] = queries[:MAX_VARIANTS_PER_SITE]
+    return plan
+
+def _url_key(url: str) -> str:
+    """중복 판별용 URL 키 (scheme/host 소문자, fragment 및 끝 슬래시 제거)"""
+    try:
+        p = urlsplit((url or "").strip())
+        return urlunsplit((p.scheme.lower(), p.netloc.lower(), p.path.rstrip("/"), p.query, ""))
+    except Exception:
+        return (url or "").strip()
+
+def merge_results(batches: List[List[Dict]], queries: List[str]) -> List[Dict]:
+    """검색어별 결과를 URL 기준으로 병합 (먼저 나온 결과 우선, 'queries'에 적중한 검색어 기록)"""
+    merged: Dict[str, Dict] = {}
+    for q, results in zip(queries, batches):
+        for r in results or []:
+            key = _url_key(r.get("url", ""))
+            if not key:
+                continue
+            if key in merged:
+                merged[key]["queries"].append(q)
+            else:
+                merged[key] = dict(r, queries=[q])
+    return list(merged.values())
+
+async def _search_site(site: str, queries: List[str]) -> List[Dict]:
+    sem = asyncio.Semaphore(max(1, SITE_CONCURRENCY))
+    mod = SITE_MODULES[site]
+
+    async def _one(q: str) -> List[Dict]:
+        async with sem:
+            try:
+                return await mod.asearch(q)
+            except Exception as e:
+                print(f"[planner] {site} '{q}' 검색 오류: {e}")
+                return []
+
+    batches = await asyncio.gather(*(_one(q) for q in queries))
+    merged = merge_results(batches, queries)
+    print(f"[planner] {site}: {len(queries)}개 검색어 → {sum(len(b) for b in batches)}건 → 중복 제거 {len(merged)}건")
+    return merged
+
+async def asearch_planned(korean: str, english: str, abbreviation: str = "",
+                          sites: Optional[List[str]] = None) -> Dict[str, List[Dict]]:
+    """모든 사이트 × 검색어 변형을 동시에 검색 (사이트별 동시 실행 수는 SITE_CONCURRENCY로 제한)"""
+    plan = build_query_variants(korean, english, abbreviation, sites)
+    for site, queries in plan.items():
+        print(f"[planner] {site} 검색어: {queries}")
+    results = await asyncio.gather(*(_search_site(site, qs) for site, qs in plan.items()))
+    return dict(zip(plan.keys(), results))
+
+def search_planned(korean: str, english: str, abbreviation: str = "",
+                   sites: Optional[List[str]] = None) -> Dict[str, List[Dict]]:
+    """asearch_planned()의 동기 버전 (공유 브라우저 루프에서 실행)"""
+    return browser.run_sync(asearch_planned(korean, english, abbreviation, sites))
@@ -0,0 +1,123 @@
+# sitesearch/ranking.py
+# -*- coding: utf-8 -*-
+"""
+검색 결과 자동 선택: 제목 유사도 + 최신성(year/month) + 도시/국가 일치도로 점수를 매기고
+임계값(AUTO_SELECT_THRESHOLD) 이상인 최고점 결과를 사이트별로 고른다.
+"""
+import os
+import re
+import datetime as dt
+from typing import Dict, List, Optional, Tuple
+
+# 유사도 함수 준비(rapidfuzz -> difflib 백업)
+try:
+    from rapidfuzz import fuzz as _fuzz
+except Exception:
+    _fuzz = None
+
+from gazetteer import GAZETTEER
+
+AUTO_SELECT_THRESHOLD = float(os.getenv("AUTO_SELECT_THRESHOLD", "0.7"))
+# 제목 유사도가 이 값보다 낮으면 최신성/지역 점수와 무관하게 자동 선택 대상에서 제외
+AUTO_SELECT_MIN_TITLE = float(os.getenv("AUTO_SELECT_MIN_TITLE", "0.6"))
+
+W_TITLE = 0.6
+W_RECENCY = 0.25
+W_LOCATION = 0.15
+
+_YEAR_RE = re.compile(r"(?:19|20)\d{2}\s*년?")
+_NON_WORD_RE = re.compile(r"[^\w가-힣]+")
+
+def _normalize(s: str) -> str:
+    s = _YEAR_RE.sub(" ", (s or "").lower())
+    return re.sub(r"\s+", " ", _NON_WORD_RE.sub(" ", s)).strip()
+
+def title_similarity(title: str, names: List[str]) -> float:
+    """결과 제목과 검색 이름들 중 가장 비슷한 것의 유사도 (0~1, 연도는 무시)"""
+    t = _normalize(title)
+    best = 0.0
+    for name in names:
+        n = _normalize(name)
+        if not t or not n:
+            continue
+        if _fuzz is not None:
+            s = float(_fuzz.token_set_ratio(t, n)) / 100.0
+        else:
+            from difflib import SequenceMatcher
+            s = SequenceMatcher(None, " ".join(sorted(t.split())), " ".join(sorted(n.split()))).ratio()
+        best = max(best, s)
+    return best
+
+def recency_score(year: int, month: int, today: Optional[dt.date] = None) -> float:
+    """
+    개최 시기 점수 (0~1)
+    - 올해/앞으로 열릴 회차가 가장 높고, 지난 회차는 1년마다 감점
+    - 연도 정보가 없으면 0.5 (중립)
+    """
+    if not year:
+        return 0.5
+    today = today or dt.date.today()
+    months = (int(year) - today.year) * 12 + ((int(month) or 6) - today.month)
+    if months >= 0:
+        # 너무 먼 미래(2년 이상)는 약간 감점
+        return 1.0 if months <= 24 else 0.8
+    return max(0.0, 1.0 + months / 36.0)
+
+def location_score(result: Dict, city: str = "", country: str = "") -> float:
+    """도시/국가 일치도 (0~1, 비교할 정보가 없으면 0.5, 서울/Seoul·한국/South Korea 같은 표기 차이는 지명 사전으로 맞춤)"""
+    text = f"{result.get('city', '')} {result.get('country', '')} {result.get('title', '')}"
+    checks = [c for c in (city, country) if c]
+    if not checks or not text.strip():
+        return 0.5
+    found = GAZETTEER.canonical_names(text)
+    low = text.lower()
+
+    def _hit(c: str) -> bool:
+        p = GAZETTEER.lookup(c)
+        return c.lower() in low or (p is not None and p.en in found)
+
+    return sum(1.0 for c in checks if _hit(c)) / len(checks)
+
+def score_result(result: Dict, names: List[str], city: str = "", country: str = "",
+                 today: Optional[dt.date] = None) -> float:
+    """검색 결과 하나의 종합 점수 (0~1, 제목 유사도가 AUTO_SELECT_MIN_TITLE 미만이면 0)"""
+    title_sim = title_similarity(result.get("title") or result.get("display_text", ""), names)
+    if title_sim < AUTO_SELECT_MIN_TITLE:
+        return 0.0
+    return (W_TITLE * title_sim
+            + W_RECENCY * recency_score(result.get("year") or 0, result.get("month") or 0, today)
+            + W_LOCATION * location_score(result, city, country))
+
+def pick_best(results: List[Dict], names: List[str], city: str = "", country: str = "",
+              threshold: Optional[float] = None, today: Optional[dt.date] = None) -> Tuple[int, float]:
+    """
+    점수가 가장 높은 결과의 (인덱스, 점수) 반환
+    최고점이 임계값 미만이거나 결과가 없으면 인덱스는 -1
+    """
+    threshold = AUTO_SELECT_THRESHOLD if threshold is None else threshold
+    names = [n for n in names if n]
+    best_idx, best_score = -1, 0.0
+    for i, r in enumerate(results or []):
+        if not r.get("url"):
+            continue
+        s = score_result(r, names, city, country, today)
+        # 동점이면 최신 회차 우선
+        if s > best_score or (s == best_score and best_idx >= 0 and
+                              (r.get("year") or 0, r.get("month") or 0) >
+                              (results[best_idx].get("year") or 0, results[best_idx].get("month") or 0)):
+            best_idx, best_score = i, s
+    if best_score < threshold:
+        return -1, best_score
+    return best_idx, best_score
+
+def auto_select(results_by_site: Dict[str, List[Dict]], korean: str, english: str, abbreviation: str = "",
+                city: str = "", country: str = "", threshold: Optional[float] = None) -> Dict[str, Tuple[int, float]]:
+    """사이트별 pick_best 결과 → {site: (인덱스 또는 -1, 점수)}"""
+    names = [korean, english, abbreviation]
+    picks = {}
+    for site, results in results_by_site.items():
+        idx, score = pick_best(results, names, city, country, threshold)
+        picks[site] = (idx, score)
+        label = results[idx].get("display_text", "") if idx >= 0 else "임계값 미달"
+        print(f"[auto-select] {site}: {label} (score={score:.2f})")
+    return picks
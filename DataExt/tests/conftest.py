@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+# DataExt 스크립트들은 패키지가 아니라 평평한 모듈이므로 상위 폴더를 import 경로에 추가
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
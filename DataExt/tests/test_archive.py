@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+import os
+
+import archive
+
+
+def test_default_out_dir_is_stable_across_runs(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert archive.main(["reextract", "--glob", "none_*.json"]) == 0
+    assert archive.main(["reextract", "--glob", "none_*.json"]) == 0
+    out = os.listdir(tmp_path / "outputs")
+    assert out == ["reextract_" + archive._fingerprint()]
+    assert os.path.isfile(tmp_path / "outputs" / out[0] / "checkpoint.jsonl")
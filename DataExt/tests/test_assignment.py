@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import assignment
+from assignment import assign_one_to_one, components, greedy_assign
+
+# b0은 t0/t1 둘 다 높고, b1은 t0만 가능 → greedy는 b0-t0만, 헝가리안은 둘 다 배정
+EDGES = [(0, 0, 0.9), (0, 1, 0.85), (1, 0, 0.8), (2, 5, 0.7)]
+
+
+def test_components_split_by_shared_nodes():
+    comps = sorted(sorted(c) for c in components(EDGES))
+    assert comps == [[(0, 0, 0.9), (0, 1, 0.85), (1, 0, 0.8)], [(2, 5, 0.7)]]
+
+
+def test_greedy_takes_best_edge_first():
+    assert assign_one_to_one(EDGES, method="greedy") == [(0, 0, 0.9), (2, 5, 0.7)]
+    assert greedy_assign([(1, 0, 0.8), (0, 0, 0.8)]) == [(0, 0, 0.8)]   # 동점은 번호 순
+
+
+def test_hungarian_maximizes_total_score():
+    pytest.importorskip("scipy")
+    out = assign_one_to_one(EDGES, method="hungarian")
+    assert out == [(0, 1, 0.85), (1, 0, 0.8), (2, 5, 0.7)]
+    assert len({j for _, j, _ in out}) == len(out)
+
+
+def test_large_component_falls_back_to_greedy(monkeypatch):
+    pytest.importorskip("scipy")
+    monkeypatch.setattr(assignment, "ASSIGN_MAX_DENSE", 3)
+    assert assign_one_to_one(EDGES) == [(0, 0, 0.9), (2, 5, 0.7)]
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+import llama
+
+URL = "https://wasteexpo.com"
+GOOD = dict({k: "-" for k in llama.KEYS}, **{
+    "전시회 국문명": "웨이스트 엑스포", "영문명(Full Name)": "Waste Expo", "영문명(약자)": "WE",
+    "개최 시작": "2026-05-04", "개최 종료": "2026-05-07", "국가": "United States", "도시": "Las Vegas",
+    "개최장소(국문)": "라스베이거스 컨벤션 센터", "개최장소(영어)": "Las Vegas Convention Center",
+    "첫 개최년도": "1968", "공식 홈페이지": URL, "이메일": "info@wasteexpo.com", "출처": URL,
+})
+
+
+def _run(monkeypatch, fast_rec, large_rec=GOOD, fast_model="fast-model"):
+    calls = []
+
+    def fake_extract(text, keys, source_url="", priority="", model="", **kw):
+        calls.append(model)
+        return dict(fast_rec if model == "fast-model" else large_rec)
+
+    monkeypatch.setattr(llama, "FAST_MODEL", fast_model)
+    monkeypatch.setattr(llama, "MODEL", "large-model")
+    monkeypatch.setattr(llama, "extract_from_text", fake_extract)
+    return llama.run_pipeline_markdown({"markdown": "Waste Expo 2026", "source_url": URL}), calls
+
+
+def test_fast_tier_result_is_kept_when_it_passes(monkeypatch):
+    result, calls = _run(monkeypatch, GOOD)
+    assert calls == ["fast-model"]
+    assert result["tier"] == "fast" and result["model"] == "fast-model"
+    assert result["quality"]["ok"]
+
+
+def test_failing_fast_result_escalates_to_large_model(monkeypatch):
+    bad = dict(GOOD, **{"개최 시작": "2026년 5월", "전시회 국문명": "", "영문명(Full Name)": ""})
+    assert set(llama.score_record(bad)["problems"]) >= {"이름 없음", "개최 시작 형식 오류"}
+    result, calls = _run(monkeypatch, bad)
+    assert calls == ["fast-model", "large-model"]
+    assert result["tier"] == "escalated" and result["model"] == "large-model"
+    assert result["data"]["영문명(Full Name)"] == "Waste Expo"
+
+
+def test_without_fast_model_uses_single_tier(monkeypatch):
+    result, calls = _run(monkeypatch, GOOD, fast_model="")
+    assert calls == ["large-model"] and result["tier"] == "single"
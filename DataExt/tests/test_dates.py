@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import dates
+
+
+@pytest.mark.parametrize("text", [
+    "2025.05.06 ~ 05.08",
+    "2025.05.06(화) ~ 05.08(목)",
+    "2025. 5. 6.(화) ~ 5. 8.(목)",
+    "2025년 5월 6일(화) ~ 8일(목)",
+    "2025-05-06 (Tue) - 05-08 (Thu)",
+])
+def test_range_with_weekday(text):
+    assert dates.parse_range(text) == ("2025-05-06", "2025-05-08")
+
+
+def test_single_day_with_weekday():
+    assert dates.parse_range("2025.05.06(화)") == ("2025-05-06", "2025-05-06")
+    assert dates.normalize_date("2025. 5. 6.(화) ~ 5. 8.(목)", part="end") == "2025-05-08"
+
+
+def test_range_with_time():
+    assert dates.parse_range("2025.05.06 10:00 ~ 2025.05.08 18:00") == ("2025-05-06", "2025-05-08")
+    assert dates.parse_range("2025.05.06(화) 10:00 ~ 05.08(목) 17:00") == ("2025-05-06", "2025-05-08")
+    assert dates.normalize_date("2025-05-06 09:30", part="end") == "2025-05-06"
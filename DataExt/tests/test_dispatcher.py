@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+import pytest
+import requests
+
+import llama
+
+
+class _Resp:
+    def __init__(self, status, data=None):
+        self.status_code = status
+        self._data = data or {}
+
+    def json(self):
+        return self._data
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code}", response=self)
+
+
+def test_single_backend_survives_one_5xx(monkeypatch):
+    d = llama.OllamaDispatcher(["http://only:11434"], retries=2, eject_sec=30)
+    replies = [_Resp(503), _Resp(200, {"response": "ok"})]
+    monkeypatch.setattr(llama.requests, "post", lambda *a, **k: replies.pop(0))
+    monkeypatch.setattr(d, "check_health", lambda b: True)
+    monkeypatch.setattr(llama.time, "sleep", lambda s: None)
+
+    assert d.post("/api/generate", {})["response"] == "ok"
+    assert d.backends[0].available   # 마지막 백엔드는 제외하지 않음
+    assert d.counters["retries"] == 1
+
+
+def test_all_ejected_falls_back_to_soonest():
+    d = llama.OllamaDispatcher(["http://a:11434", "http://b:11434"])
+    a, b = d.backends
+    a.ejected_until = llama.time.time() + 60
+    b.ejected_until = llama.time.time() + 10
+    assert d._acquire(set()) is None
+    assert d._acquire(set(), fallback=True) is b
+
+
+def test_eject_keeps_last_available_backend():
+    d = llama.OllamaDispatcher(["http://a:11434", "http://b:11434"])
+    a, b = d.backends
+    d._eject(a, "test")
+    assert not a.available
+    d._eject(b, "test")
+    assert b.available and b.failures == 1
+
+
+def test_slow_backend_is_hedged(monkeypatch):
+    d = llama.OllamaDispatcher(["http://slow:11434", "http://fast:11434"], retries=0)
+    d._latencies.extend([0.01] * llama.OLLAMA_HEDGE_MIN_SAMPLES)
+    monkeypatch.setattr(llama, "OLLAMA_HEDGE_MIN_SEC", 0.05)
+
+    def fake_post(url, **kw):
+        if url.startswith("http://slow"):
+            llama.time.sleep(0.5)
+            return _Resp(200, {"response": "slow"})
+        return _Resp(200, {"response": "fast"})
+
+    monkeypatch.setattr(llama.requests, "post", fake_post)
+    monkeypatch.setattr(d, "_acquire", _ordered_acquire(d))
+    assert d.post("/api/generate", {})["response"] == "fast"
+    assert d.counters["hedges"] == 1 and d.counters["hedge_wins"] == 1
+
+
+def _ordered_acquire(d):
+    """백엔드 목록 순서대로 하나씩 (라운드로빈 순서와 무관하게 느린 서버를 먼저)"""
+    def _acquire(tried, fallback=False):
+        for b in d.backends:
+            if b.base_url not in tried:
+                b.outstanding += 1
+                return b
+        return None
+    return _acquire
+
+
+def test_breaker_opens_then_half_opens(monkeypatch):
+    monkeypatch.setattr(llama, "OLLAMA_BREAKER_THRESHOLD", 2)
+    monkeypatch.setattr(llama, "OLLAMA_BREAKER_COOLDOWN", 60)
+    d = llama.OllamaDispatcher(["http://down:11434"], retries=0)
+    posts = []
+
+    def fake_post(url, **kw):
+        posts.append(url)
+        raise requests.ConnectionError("refused")
+
+    monkeypatch.setattr(llama.requests, "post", fake_post)
+    for _ in range(2):
+        with pytest.raises(requests.ConnectionError):
+            d.post("/api/generate", {})
+    assert d.stats()["breaker"] == "open"
+
+    # 열린 동안은 서버에 보내지 않고 바로 실패
+    with pytest.raises(RuntimeError):
+        d.post("/api/generate", {})
+    assert len(posts) == 2 and d.counters["breaker_rejected"] == 1
+
+    # 쿨다운이 지나면 시험 요청 1건만 통과, 성공하면 닫힘
+    d._breaker_open_until = 0.0
+    d._breaker_allow()
+    with pytest.raises(RuntimeError):
+        d._breaker_allow()
+    d._breaker_record(True)
+    d._breaker_allow()
+    assert d.stats()["breaker"] == "closed"
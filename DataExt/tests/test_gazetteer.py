@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+from gazetteer import GAZETTEER, fill_location, city_in
+
+EMPTY = {"국가": "", "도시": "", "개최장소(국문)": "", "개최장소(영어)": ""}
+
+
+def test_common_words_are_not_places():
+    rec, filled = fill_location(dict(EMPTY), "Have a nice day. Visit us.")
+    assert filled == [] and rec == EMPTY
+    assert GAZETTEER.recognize("Nice to meet you")["도시"] == ""
+
+
+def test_lowercase_word_does_not_beat_real_city():
+    assert GAZETTEER.recognize("We have a nice venue in Frankfurt")["도시"] == "Frankfurt"
+
+
+def test_us_needs_nearby_us_place():
+    assert GAZETTEER.recognize("CONTACT US | ABOUT US")["국가"] == ""
+    assert [h.surface for h in GAZETTEER.find("Las Vegas, NV, US")] == ["Las Vegas", "US"]
+    assert GAZETTEER.recognize("GB rules")["국가"] == ""
+
+
+def test_ambiguous_city_with_its_country():
+    assert GAZETTEER.recognize("Acropolis, Nice, France")["도시"] == "Nice"
+
+
+def test_korean_and_venue_hits():
+    out = GAZETTEER.recognize("2025 독일 뮌헨 바우마, Messe München")
+    assert out["도시"] == "Munich" and out["개최장소(영어)"] == "Messe München"
+    assert GAZETTEER.recognize("비즈니스 미팅")["도시"] == ""
+    assert GAZETTEER.recognize("SEOUL, KOREA")["국가"] == "South Korea"
+    assert city_in("https://www.seoulfair.kr", boundaries=False) == "Seoul"
+
+
+def test_korean_common_words_are_not_cities():
+    rec, filled = fill_location(dict(EMPTY, **{"전시회 국문명": "2025 국제 스마트공장 대전"}))
+    assert filled == [] and rec["국가"] == "" and rec["도시"] == ""
+    assert GAZETTEER.recognize("고양이 박람회 캣페스타")["도시"] == ""
+    assert GAZETTEER.recognize("2025 국제 스마트공장 대전")["국가"] == ""
+
+
+def test_korean_ambiguous_city_with_suffix_or_support():
+    assert GAZETTEER.recognize("대전광역시 유성구")["도시"] == "Daejeon"
+    assert GAZETTEER.recognize("고양시 일산서구")["도시"] == "Goyang"
+    assert GAZETTEER.recognize("대한민국 대전")["도시"] == "Daejeon"
+    assert GAZETTEER.recognize("대전컨벤션센터")["도시"] == "Daejeon"
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+
+import llama
+
+
+def _limiter(**kw):
+    kw = dict(dict(initial=2, min_limit=1, max_limit=8, tolerance=2.0, backoff=0.5), **kw)
+    return llama.AdaptiveLimiter(**kw)
+
+
+def test_additive_increase_on_fast_success():
+    lim = _limiter()
+    for _ in range(4):
+        lim.release(lim.acquire(), latency=1.0)
+    # 2 → 2.5 → 2.9 → 3.24 → 3.55 (limit += 1/limit)
+    assert 3.5 < lim.limit < 3.6
+    assert lim.stats()["completed"] == 4
+
+
+def test_multiplicative_decrease_once_per_overload():
+    lim = _limiter(initial=4)
+    a, b = lim.acquire(), lim.acquire()
+    lim.release(a, latency=1.0, ok=False)
+    assert lim.limit == 2.0
+    lim.release(b, latency=1.0, ok=False)   # 감소 전에 시작된 요청 → 다시 줄이지 않음
+    assert lim.limit == 2.0
+    lim.release(lim.acquire(), latency=1.0, ok=False)
+    assert lim.limit == 1.0 and lim.errors == 3
+
+
+def test_slow_latency_counts_as_overload():
+    lim = _limiter(initial=4)
+    for _ in range(3):
+        lim.release(lim.acquire(), latency=1.0)
+    before = lim.limit
+    lim.release(lim.acquire(), latency=5.0)
+    assert lim.limit == before * 0.5
+    # 긴 프롬프트는 지연을 길이로 나눠 비교 → 과부하 아님
+    before = lim.limit
+    lim.release(lim.acquire(), latency=5.0, size=9000)
+    assert lim.limit > before
+
+
+def test_waits_for_free_slot():
+    lim = _limiter(initial=1, max_limit=1)
+    seq = lim.acquire()
+    entered = threading.Event()
+
+    def _worker():
+        lim.release(lim.acquire(), latency=0.1)
+        entered.set()
+
+    t = threading.Thread(target=_worker, daemon=True)
+    t.start()
+    assert not entered.wait(0.2)
+    lim.release(seq, latency=0.1)
+    assert entered.wait(2.0)
+    t.join(2.0)
+
+
+def test_interactive_waiters_go_first():
+    lim = _limiter(initial=1, max_limit=1)
+    seq = lim.acquire(llama.PRIORITY_INTERACTIVE)
+    order = []
+
+    def _worker(priority):
+        s = lim.acquire(priority)
+        order.append(priority)
+        lim.release(s, latency=0.1, priority=priority)
+
+    threads = []
+    for p in (llama.PRIORITY_BACKGROUND, llama.PRIORITY_BATCH, llama.PRIORITY_INTERACTIVE):
+        threads.append(threading.Thread(target=_worker, args=(p,), daemon=True))
+        threads[-1].start()
+        while lim.stats()["waiting_by_class"][p] == 0:
+            time.sleep(0.01)
+    lim.release(seq, latency=0.1, priority=llama.PRIORITY_INTERACTIVE)
+    for t in threads:
+        t.join(5.0)
+    assert order == [llama.PRIORITY_INTERACTIVE, llama.PRIORITY_BATCH, llama.PRIORITY_BACKGROUND]
+
+
+def test_aging_and_class_caps():
+    lim = _limiter(initial=4, max_limit=4)
+    now = time.time()
+    bg = [llama.PRIORITY_RANK[llama.PRIORITY_BACKGROUND], now, 1, llama.PRIORITY_BACKGROUND]
+    it = [llama.PRIORITY_RANK[llama.PRIORITY_INTERACTIVE], now, 2, llama.PRIORITY_INTERACTIVE]
+    lim._waiting = [bg, it]
+    assert lim._next_ticket() is it
+    bg[1] = now - 3 * llama.LLM_AGING_SEC   # 오래 기다리면 우선순위 상승
+    assert lim._next_ticket() is bg
+
+    # background는 limit × LLM_BACKGROUND_SHARE까지만 동시에 실행
+    cap = lim._class_cap(llama.PRIORITY_BACKGROUND)
+    assert cap == max(1, int(4 * llama.PRIORITY_SHARE[llama.PRIORITY_BACKGROUND]))
+    lim._class_in_flight[llama.PRIORITY_BACKGROUND] = cap
+    assert lim._next_ticket() is it
+    assert lim._class_cap(llama.PRIORITY_INTERACTIVE) == 4
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+import csv
+import json
+
+from match_result import MatchResult
+
+KEYS = ["전시회 국문명", "영문명(Full Name)", "개최 도시"]
+
+
+def _result(n):
+    pairs = []
+    for i in range(n):
+        a = {"전시회 국문명": f"전시회{i}", "영문명(Full Name)": f"Expo {i}", "개최 도시": "서울"}
+        b = dict(a, **({"개최 도시": "부산"} if i % 2 else {}))
+        pairs.append((a, b, 0.9 - i * 0.01))
+    return MatchResult.from_pairs(pairs, KEYS, threshold=0.7, weight_kr=0.5, weight_en=0.5)
+
+
+def test_flags_and_paging():
+    res = _result(5)
+    assert len(res) == 5 and res.diff_keys(0) == [] and res.diff_keys(1) == ["개최 도시"]
+    assert res.page_count(2) == 3
+
+    page2 = res.render_page(2, page_size=2)
+    assert "#3." in page2 and "#4." in page2 and "#2." not in page2 and "#5." not in page2
+    assert "페이지 2/3 · 전체 5건" in page2
+    # 범위 밖 페이지는 마지막 페이지로
+    assert "#5." in res.render_page(9, page_size=2)
+    assert '<span style="color:red">부산</span>' in page2
+    assert "페이지" not in res.render_page(1, page_size=10)
+
+
+def test_empty_result():
+    res = MatchResult.from_pairs([], KEYS, threshold=0.7)
+    assert res.page_count() == 1
+    assert "매칭된 항목이 없습니다" in res.render_page()
+
+
+def test_csv_and_jsonl_export(tmp_path):
+    res = _result(3)
+    with open(res.to_csv(str(tmp_path / "out" / "match.csv")), encoding="utf-8-sig", newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == res.header()
+    assert rows[2][:4] == ["2", "0.89", "1", "개최 도시"]
+    assert rows[2][-2:] == ["서울", "부산"]
+
+    with open(res.to_jsonl(str(tmp_path / "match.jsonl")), encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f]
+    assert len(lines) == 3
+    assert lines[1]["diff_keys"] == ["개최 도시"] and lines[1]["site"]["개최 도시"] == "부산"
+    assert lines[0]["db"]["전시회 국문명"] == "전시회0" and lines[0]["score"] == 0.9
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+
+import pytest
+
+pytest.importorskip("numpy")
+
+import matcher_index as mi
+from data import FuzzyExhibitionMatcher
+
+RECORDS = [
+    {"전시회 국문명": "국제 폐기물 전시회", "영문명(Full Name)": "Waste Expo Korea", "id": "1"},
+    {"전시회 국문명": "서울 국제 식품 박람회", "영문명(Full Name)": "Seoul Food", "id": "2"},
+    {"전시회 국문명": "", "영문명(Full Name)": "Automechanika Frankfurt", "id": "3"},
+    {"전시회 국문명": "의료기기 전시회", "영문명(Full Name)": "", "id": "4"},
+]
+
+
+def _write_source(path, records):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"data": records}, f, ensure_ascii=False)
+
+
+def test_index_round_trip(tmp_path):
+    src, folder = str(tmp_path / "db.json"), str(tmp_path / "index")
+    _write_source(src, RECORDS)
+    m = FuzzyExhibitionMatcher()
+    idx = mi.open_or_build(src, folder, m)
+    reopened = mi.MatcherIndex.open(folder)
+    mem = m.build_index(RECORDS)
+
+    assert len(reopened) == len(RECORDS)
+    assert list(reopened.records) == RECORDS
+    for rec in RECORDS:
+        kr, en = m._normalize(rec[mi.KR_KEY]), m._normalize(rec[mi.EN_KEY])
+        assert reopened.candidates(kr, en).tolist() == mem.candidates(kr, en).tolist()
+    base = [{"전시회 국문명": "국제 폐기물 전시", "영문명(Full Name)": "Waste Expo"}]
+    assert m._build_best_matches_blocked(base, reopened) == m._build_best_matches_blocked(base, mem)
+
+    # 원본이 그대로면 같은 폴더를 다시 열고, 바뀌면 stale → 다시 생성
+    assert not idx.is_stale()
+    assert mi.open_or_build(src, folder, m).meta == idx.meta
+    _write_source(src, RECORDS[:2])
+    os.utime(src, (0, 0))
+    assert idx.is_stale()
+    assert len(mi.open_or_build(src, folder, m)) == 2
+
+
+def _base(n):
+    words = ["Waste", "Expo", "Food", "Seoul", "Auto", "Tech", "Show", "Fair", "Medical", "Print"]
+    return [{"전시회 국문명": "", "영문명(Full Name)": f"{words[i % 10]} {words[(i * 3) % 10]} {i}"}
+            for i in range(n)]
+
+
+def _rows(pairs):
+    return [(a["영문명(Full Name)"], b["영문명(Full Name)"], round(s, 9)) for a, b, s in pairs]
+
+
+def test_worker_count_does_not_change_small_result(monkeypatch):
+    # 작은 target은 워커 수와 무관하게 단일 프로세스 행렬 경로
+    monkeypatch.setattr(mi, "MATCH_SHARD_SIZE", 10)
+    m = FuzzyExhibitionMatcher(threshold=0.5)
+    base = _base(50)
+    target = [{"전시회 국문명": "", "영문명(Full Name)": t} for t in ("Waste Expo", "Food Show", "Auto Fair", "CES", "IFA")]
+    one = m._build_best_matches(base, target, workers=1)
+    assert one and _rows(one) == _rows(m._build_best_matches(base, target, workers=2))
+
+
+def test_pool_matches_single_process_with_index(monkeypatch):
+    monkeypatch.setattr(mi, "MATCH_SHARD_SIZE", 10)
+    m = FuzzyExhibitionMatcher(threshold=0.5)
+    base = _base(50)
+    index = m.build_index([{"전시회 국문명": "", "영문명(Full Name)": t}
+                           for t in ("Waste Expo", "Food Show", "Auto Fair", "Medical Print")])
+    one = m._build_best_matches(base, [], index=index, workers=1)
+    assert one and _rows(one) == _rows(m._build_best_matches(base, [], index=index, workers=2))
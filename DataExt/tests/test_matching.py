@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+import matcher_index
+from data import FuzzyExhibitionMatcher
+
+BASE = [
+    {"전시회 국문명": "라스베이거스 폐기물 전시회", "영문명(Full Name)": "Waste Expo"},
+    {"전시회 국문명": "서울 식품 박람회", "영문명(Full Name)": "Seoul Food"},
+]
+TARGET = [
+    {"전시회 국문명": "폐기물 전시회", "영문명(Full Name)": "WasteExpo"},
+    {"전시회 국문명": "서울국제식품산업대전", "영문명(Full Name)": "Seoul Food 2026"},
+    {"전시회 국문명": "파리 에어쇼", "영문명(Full Name)": "Paris Air Show"},
+]
+
+
+def _pairs(m, base):
+    return [(a["영문명(Full Name)"], b["영문명(Full Name)"], round(s, 6))
+            for a, b, s in m._build_best_matches(base, TARGET)]
+
+
+def test_small_streamed_base_is_compared_exhaustively():
+    m = FuzzyExhibitionMatcher(threshold=0.5)
+    expected = _pairs(m, BASE)
+    assert _pairs(m, iter(BASE)) == expected
+    assert m._index_cache is None     # 작은 스트리밍 입력은 색인을 만들지 않음
+
+
+def test_large_streamed_base_uses_index(monkeypatch):
+    monkeypatch.setattr(matcher_index, "BLOCKING_MIN_PAIRS", 3)
+    m = FuzzyExhibitionMatcher(threshold=0.5)
+    _pairs(m, iter(BASE))
+    assert m._index_cache is not None
+
+
+def test_name_dict_is_opt_in():
+    assert FuzzyExhibitionMatcher()._names_dict is None
+    assert FuzzyExhibitionMatcher(name_dict=True)._names_dict is not None
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+import random
+
+import pytest
+
+from data import FuzzyExhibitionMatcher
+
+WORDS_EN = ["Waste", "Expo", "Food", "Seoul", "Auto", "World", "Tech", "Show", "Fair", "Medical", "Pack", "Print"]
+WORDS_KR = ["폐기물", "전시회", "식품", "서울", "자동차", "국제", "기술", "박람회", "의료", "포장", "인쇄"]
+
+
+def _records(rng, n, prefix):
+    out = []
+    for i in range(n):
+        kr = " ".join(rng.sample(WORDS_KR, rng.randint(1, 3))) if rng.random() > 0.2 else ""
+        en = " ".join(rng.sample(WORDS_EN, rng.randint(1, 3))) if rng.random() > 0.2 else ""
+        out.append({"id": f"{prefix}{i}", "전시회 국문명": kr, "영문명(Full Name)": en})
+    return out
+
+
+def _rows(pairs):
+    return [(a["id"], b["id"], round(s, 9)) for a, b, s in pairs]
+
+
+@pytest.mark.parametrize("threshold", [0.5, 0.8])
+def test_matrix_matches_double_loop(threshold):
+    rng = random.Random(7)
+    base, target = _records(rng, 60, "a"), _records(rng, 40, "b")
+    m = FuzzyExhibitionMatcher(threshold=threshold)
+    assert m._np is not None
+    matrix = _rows(m._build_best_matches_matrix(base, target, block_rows=16))
+
+    m._np = None   # numpy 없는 환경과 같은 이중 루프
+    loop = _rows(m._build_best_matches(base, target))
+    assert matrix == loop and matrix
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+import llama
+
+
+def _capture(monkeypatch):
+    prompts = []
+
+    def fake_generate(payload, timeout=None):
+        prompts.append(payload["prompt"])
+        return {"response": "{}"}
+
+    monkeypatch.setattr(llama.DISPATCHER, "generate", fake_generate)
+    return prompts
+
+
+def test_partial_reask_skips_prompt_md(monkeypatch):
+    prompts = _capture(monkeypatch)
+    text = "Waste Expo 2026\nLas Vegas Convention Center\nContact: info@wasteexpo.com"
+    rec = {k: "" for k in llama.KEYS}
+    rec.update({"영문명(Full Name)": "Waste Expo", "개최장소(영어)": "Las Vegas Convention Center"})
+
+    llama.ask_ollama("전시회 정보를 추출해라.", [], [], text, keys=llama.KEYS)
+    llama.extract_missing_fields(text, rec, keys=llama.KEYS, source_url="https://wasteexpo.com")
+
+    full, partial = prompts
+    rules = llama.load_prompt_md().strip()
+    assert rules in full
+    assert rules not in partial
+    assert len(partial) < len(full)
+
+
+def test_all_fewshot_examples_are_used(monkeypatch):
+    prompts = _capture(monkeypatch)
+    users = [f"예시 입력 {i}" for i in range(3)]
+    assists = [f'{{"전시회 국문명": "예시 {i}"}}' for i in range(3)]
+
+    llama.ask_ollama("전시회 정보를 추출해라.", users, assists, "본문", include_rules=False)
+
+    for u, a in zip(users, assists):
+        assert u + "\n" + a in prompts[0]
+
+
+def test_extract_reads_prompt_md_setting(tmp_path, monkeypatch):
+    custom = tmp_path / "custom_prompt.md"
+    custom.write_text("# 사용자 지정 규칙 MARKER", encoding="utf-8")
+    monkeypatch.setattr(llama, "PROMPT_MD", str(custom))
+    prompts = _capture(monkeypatch)
+
+    llama.extract_from_text("Waste Expo 2026", llama.KEYS, source_url="https://wasteexpo.com")
+
+    assert "사용자 지정 규칙 MARKER" in prompts[0]
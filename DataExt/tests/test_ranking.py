@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+import datetime as dt
+import importlib.util
+import os
+
+# sitesearch/__init__.py는 crawl4ai 브라우저를 import하므로 점수 모듈 파일만 읽음
+_spec = importlib.util.spec_from_file_location(
+    "sitesearch_ranking", os.path.join(os.path.dirname(__file__), "..", "sitesearch", "ranking.py"))
+ranking = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(ranking)
+
+TODAY = dt.date(2025, 1, 1)
+NAMES = ["라스베이거스 폐기물 전시회", "Waste Expo", "WE"]
+
+
+def _r(title, year=0, month=0, **kw):
+    return dict(title=title, display_text=title, url=f"https://example.com/{title}/{year}", year=year, month=month, **kw)
+
+
+def test_low_title_similarity_scores_zero():
+    assert ranking.score_result(_r("Paris Air Show", 2025, 6), NAMES, today=TODAY) == 0.0
+    assert ranking.score_result(_r("Waste Expo", 2025, 6), NAMES, today=TODAY) > 0.9
+
+
+def test_threshold():
+    results = [_r("Waste Expo Asia", 2020, 1)]
+    idx, score = ranking.pick_best(results, NAMES, threshold=0.99, today=TODAY)
+    assert idx == -1 and 0 < score < 0.99
+    assert ranking.pick_best(results, NAMES, threshold=0.5, today=TODAY)[0] == 0
+    assert ranking.pick_best([], NAMES) == (-1, 0.0)
+
+
+def test_tie_prefers_latest_edition():
+    results = [_r("Waste Expo", 2025, 6), _r("Waste Expo", 2026, 6), _r("Waste Expo", 2024, 6)]
+    assert ranking.score_result(results[0], NAMES, today=TODAY) == ranking.score_result(results[1], NAMES, today=TODAY)
+    assert ranking.pick_best(results, NAMES, today=TODAY)[0] == 1
+
+
+def test_auto_select_uses_country():
+    by_site = {
+        "auma": [_r("Waste Expo", city="Shanghai", country="China"),
+                 _r("Waste Expo", city="Las Vegas", country="United States")],
+        "gep": [_r("Paris Air Show")],
+    }
+    picks = ranking.auto_select(by_site, *NAMES, country="United States", threshold=0.5)
+    assert picks["auma"][0] == 1
+    assert picks["gep"][0] == -1
+    assert ranking.location_score(by_site["auma"][1], country="United States") == 1.0
+    assert ranking.location_score(by_site["auma"][0], country="United States") == 0.0
+
+
+def test_location_spelling_variants_match():
+    assert ranking.location_score(_r("Waste Expo", city="라스베이거스", country="USA"),
+                                  city="Las Vegas", country="United States") == 1.0
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+import llama
+
+
+def test_p50_p95_per_model_and_domain():
+    t = llama.TelemetryStats(window=100)
+    for i in range(1, 101):   # wall_sec 1..100
+        t.record({"model": "large", "domain": "auma.de" if i % 2 else "gep.or.kr", "wall_sec": float(i),
+                  "eval_tokens": 10})
+    s = t.summary()
+    large = s["model"]["large"]
+    assert large["count"] == 100
+    assert large["wall_sec"] == {"p50": 51.0, "p95": 96.0}
+    assert large["eval_tokens"] == {"p50": 10.0, "p95": 10.0}
+    assert s["domain"]["auma.de"]["count"] == 50
+    assert s["domain"]["auma.de"]["wall_sec"]["p95"] == 95.0   # 1, 3, ..., 99
+
+
+def test_window_keeps_recent_calls_only():
+    t = llama.TelemetryStats(window=3)
+    for sec in (100.0, 1.0, 2.0, 3.0):
+        t.record({"model": "m", "wall_sec": sec})
+    row = t.summary()["model"]["m"]
+    assert row["count"] == 3 and row["wall_sec"]["p95"] == 3.0
+    assert "-" in t.summary()["domain"]   # 도메인 없는 호출
+
+
+def test_parse_ollama_stats():
+    stats = llama.parse_ollama_stats({"prompt_eval_count": 200, "eval_count": 50, "load_duration": 1.5e9,
+                                      "prompt_eval_duration": 2e9, "eval_duration": 5e8})
+    assert stats["prompt_tps"] == 100.0 and stats["eval_tps"] == 100.0
+    assert stats["load_sec"] == 1.5
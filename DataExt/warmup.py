@@ -0,0 +1,162 @@
+# warmup.py
+# -*- coding: utf-8 -*-
+"""
+앱 시작 시 워밍업 + 헬스 엔드포인트
+
+- 각 Ollama 백엔드에 짧은 생성 요청(num_predict=1, keep_alive)을 보내 모델을 미리 메모리에 올림
+- 공유 crawl4ai 브라우저(browser.py)를 미리 띄움
+- prompt.md(PROMPT_MD)를 미리 읽어 캐시 (추출 시 같은 경로를 읽으므로 바로 캐시 적중)
+- GET /health 로 준비 상태 확인 (ready/degraded 200, warming/down 503)
+
+    from warmup import launch_with_health
+    launch_with_health(demo, server_name="127.0.0.1", server_port=7869)
+"""
+import os
+import time
+import threading
+from typing import Any, Dict, List, Optional
+
+import requests
+
+import browser
+import llama
+
+# ==== 설정 ===================================================================
+WARMUP_ENABLED = os.getenv("WARMUP", "1") != "0"
+WARMUP_TIMEOUT = float(os.getenv("WARMUP_TIMEOUT", "300"))   # 모델 로드 대기 한도 (초)
+
+# ==== 준비 상태 ==============================================================
+_STATE: Dict[str, Any] = {
+    "started_at": None,
+    "finished_at": None,
+    "components": {},   # name -> {"ok": bool|None, "detail": str, "seconds": float}
+}
+_STATE_LOCK = threading.Lock()
+_THREAD: Optional[threading.Thread] = None
+
+def _set(name: str, ok: Optional[bool], detail: str = "", seconds: float = 0.0):
+    with _STATE_LOCK:
+        _STATE["components"][name] = {"ok": ok, "detail": detail, "seconds": round(seconds, 2)}
+
+def _timed(name: str, fn):
+    _set(name, None, "warming")
+    t0 = time.time()
+    try:
+        detail = fn() or "ok"
+        _set(name, True, str(detail), time.time() - t0)
+    except Exception as e:
+        _set(name, False, str(e), time.time() - t0)
+        print(f"[warmup] {name} 실패: {e}")
+
+# ==== 개별 워밍업 ============================================================
+def _warm_models() -> List[str]:
+    models = [llama.MODEL]
+    if llama.FAST_MODEL and llama.FAST_MODEL != llama.MODEL:
+        models.append(llama.FAST_MODEL)
+    return models
+
+def warm_ollama(base_url: str, model: str) -> str:
+    """백엔드 하나에 1토큰 생성 요청 → 모델 로드 + keep_alive 동안 유지"""
+    payload = {
+        "model": model,
+        "prompt": "ok",
+        "options": {"num_predict": 1},
+        "keep_alive": llama.OLLAMA_KEEP_ALIVE,
+        "stream": False,
+    }
+    resp = requests.post(base_url + "/api/generate", json=payload, timeout=WARMUP_TIMEOUT)
+    resp.raise_for_status()
+    load_ms = (resp.json() or {}).get("load_duration", 0) / 1e6
+    return f"load {load_ms:.0f} ms"
+
+def warm_browser() -> str:
+    """공유 crawl4ai 브라우저 시작 (사이트 검색/상세 크롤링 공용)"""
+    browser.run_sync(browser.get_crawler(), timeout=WARMUP_TIMEOUT)
+    return "started"
+
+def warm_prompt() -> str:
+    text = llama.read_prompt_file(llama.PROMPT_MD)
+    return f"{len(text)} chars"
+
+def run_warmup():
+    """모든 워밍업을 병렬로 실행하고 끝날 때까지 대기"""
+    with _STATE_LOCK:
+        _STATE["started_at"] = time.time()
+        _STATE["finished_at"] = None
+    jobs = [("prompt", warm_prompt), ("browser", warm_browser)]
+    for b in llama.DISPATCHER.backends:
+        for m in _warm_models():
+            jobs.append((f"ollama:{b.base_url}:{m}", lambda u=b.base_url, m=m: warm_ollama(u, m)))
+
+    threads = [threading.Thread(target=_timed, args=job, name=f"warmup-{job[0]}", daemon=True) for job in jobs]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    with _STATE_LOCK:
+        _STATE["finished_at"] = time.time()
+    print(f"[warmup] 완료: {health()['status']} ({_STATE['finished_at'] - _STATE['started_at']:.1f}s)")
+
+def start_warmup() -> Optional[threading.Thread]:
+    """백그라운드 스레드로 워밍업 시작 (WARMUP=0이면 건너뜀, 이미 실행 중이면 그대로 반환)"""
+    global _THREAD
+    if not WARMUP_ENABLED:
+        return None
+    if _THREAD is None or not _THREAD.is_alive():
+        _THREAD = threading.Thread(target=run_warmup, name="warmup", daemon=True)
+        _THREAD.start()
+    return _THREAD
+
+# ==== 헬스 ===================================================================
+def health() -> Dict[str, Any]:
+    """
+    준비 상태 요약
+    status: ready(전부 성공) / warming(진행 중) / degraded(일부 실패, Ollama 1대 이상 성공) / down
+    """
+    with _STATE_LOCK:
+        comps = {k: dict(v) for k, v in _STATE["components"].items()}
+        started, finished = _STATE["started_at"], _STATE["finished_at"]
+
+    ollama_ok = [v["ok"] for k, v in comps.items() if k.startswith("ollama:")]
+    if started is None:
+        status = "ready" if not WARMUP_ENABLED else "warming"
+    elif finished is None or any(v["ok"] is None for v in comps.values()):
+        status = "warming"
+    elif all(v["ok"] for v in comps.values()):
+        status = "ready"
+    elif any(ollama_ok) and comps.get("browser", {}).get("ok"):
+        status = "degraded"
+    else:
+        status = "down"
+
+    return {
+        "status": status,
+        "components": comps,
+        "llm_limiter": llama.LIMITER.stats(),
+        "backends": [repr(b) for b in llama.DISPATCHER.backends],
+        "dispatcher": llama.DISPATCHER.stats(),
+        "telemetry": llama.TELEMETRY.summary(),
+    }
+
+# ==== 실행 ===================================================================
+def launch_with_health(demo, server_name: str = "127.0.0.1", server_port: int = 7860):
+    """워밍업 시작 후 Gradio 앱을 FastAPI에 올려 /health 와 함께 실행"""
+    from fastapi import FastAPI
+    from fastapi.responses import JSONResponse
+    import gradio as gr
+    import uvicorn
+
+    start_warmup()
+
+    app = FastAPI()
+
+    @app.get("/health")
+    def _health():
+        h = health()
+        return JSONResponse(h, status_code=200 if h["status"] in ("ready", "degraded") else 503)
+
+    app = gr.mount_gradio_app(app, demo, path="/")
+    try:
+        uvicorn.run(app, host=server_name, port=server_port)
+    finally:
+        browser.shutdown()